@@ -3,19 +3,94 @@ from typing import TYPE_CHECKING
 import lazy_loader as lazy
 
 submod_attrs={
+    "async_io": ["aload", "asave", "set_async_executor"],
+    "async_saver": ["AsyncSaver"],
+    "cache": ["LoadCache", "load_cache"],
     "compress": ["compress"],
     "decompress": ["decompress"],
-    "load": ["load"],
+    "inspect": ["inspect"],
+    "iter_audio": ["iter_audio"],
+    "iter_load": ["iter_load"],
+    "json_io": ["iter_jsonl", "get_json_engine"],
+    "lazy": [
+        "MmapNpzFile",
+        "HDF5File",
+        "HDF5Group",
+        "HDF5Dataset",
+        "MatlabFile",
+        "MatlabStruct",
+        "MatlabCell",
+        "MatlabArray",
+    ],
+    "load": ["load", "set_loader_defaults"],
+    "load_images": ["load_images"],
+    "load_many": ["load_many", "load_as_completed"],
+    "prefetch": ["Prefetcher"],
     "save": ["save"],
+    "sniff": ["sniff_format"],
+    "writers": ["open_writer"],
 }
 
 __getattr__, __dir__, __all__ = lazy.attach(__name__, submod_attrs=submod_attrs)
 
 if TYPE_CHECKING:
+    from .async_io import aload, asave, set_async_executor
+    from .async_saver import AsyncSaver
+    from .cache import LoadCache, load_cache
     from .compress import compress
     from .decompress import decompress
-    from .load import load
+    from .inspect import inspect
+    from .iter_audio import iter_audio
+    from .iter_load import iter_load
+    from .json_io import iter_jsonl, get_json_engine
+    from .lazy import (
+        MmapNpzFile,
+        HDF5File,
+        HDF5Group,
+        HDF5Dataset,
+        MatlabFile,
+        MatlabStruct,
+        MatlabCell,
+        MatlabArray,
+    )
+    from .load import load, set_loader_defaults
+    from .load_images import load_images
+    from .load_many import load_many, load_as_completed
+    from .prefetch import Prefetcher
     from .save import save
+    from .sniff import sniff_format
+    from .writers import open_writer
 
 
-__all__ = ["compress", "decompress", "load", "save"]
\ No newline at end of file
+__all__ = [
+    "compress",
+    "decompress",
+    "load",
+    "iter_load",
+    "iter_audio",
+    "iter_jsonl",
+    "get_json_engine",
+    "inspect",
+    "load_many",
+    "load_as_completed",
+    "load_images",
+    "save",
+    "open_writer",
+    "aload",
+    "asave",
+    "set_async_executor",
+    "AsyncSaver",
+    "set_loader_defaults",
+    "sniff_format",
+    "MmapNpzFile",
+    "HDF5File",
+    "HDF5Group",
+    "HDF5Dataset",
+    "MatlabFile",
+    "MatlabStruct",
+    "MatlabCell",
+    "MatlabArray",
+    "Prefetcher",
+    "LoadCache",
+    "load_cache",
+]
\ No newline at end of file
@@ -0,0 +1,140 @@
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .load import load
+from .save import save
+
+__all__ = ["aload", "asave", "set_async_executor"]
+
+default_executor: Optional[Executor] = None  # Global executor shared by the coroutines
+
+
+async def aload(
+    file_path: Union[str, Path],
+    loader: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> Any:
+    """
+    Load data from a file without blocking the event loop.
+
+    The file is loaded with `load` on a bounded executor, so the same loaders,
+    including custom loaders registered with `register_loader`, are available.
+    Many files can be loaded with `asyncio.gather`; the number of concurrent
+    loads is limited by the workers of the executor, and the rest wait in its queue.
+
+    Cancelling the coroutine cancels the load if it has not started yet. A load
+    that is already running can not be interrupted, but its result is discarded.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the file to load.
+    loader : Optional[str], default=None
+        The loader type to use. If not provided, it will be inferred from the file extension.
+    executor : Optional[Executor], default=None
+        The executor to run the load in. If not provided, the global executor
+        configured with `set_async_executor` is used.
+    kwargs : dict
+        Additional keyword arguments to pass to `load`.
+
+    Returns
+    -------
+    Any
+        The data loaded from the file.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import asyncio
+        from dmf.io import aload
+
+        async def main(paths):
+            return await asyncio.gather(*(aload(path) for path in paths))
+
+        dfs = asyncio.run(main(["a.csv", "b.csv"]))
+    """
+    return await _run(executor, load, file_path, loader=loader, **kwargs)
+
+
+async def asave(
+    data: Any,
+    file_path: Union[str, Path],
+    saver: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> None:
+    """
+    Save data to a file without blocking the event loop.
+
+    The data is saved with `save` on a bounded executor, so the same savers,
+    including custom savers registered with `register_saver`, are available.
+
+    Cancelling the coroutine cancels the save if it has not started yet. A save
+    that is already running is completed, so no partially written file is left.
+
+    Parameters
+    ----------
+    data : Any
+        The data to be saved.
+    file_path : Union[str, Path]
+        The path to the file where the data should be saved.
+    saver : Optional[str], default=None
+        The saver type to use. If not provided, it will be inferred from the file extension.
+    executor : Optional[Executor], default=None
+        The executor to run the save in. If not provided, the global executor
+        configured with `set_async_executor` is used.
+    kwargs : dict
+        Additional keyword arguments to pass to `save`.
+    """
+    return await _run(executor, save, data, file_path, saver=saver, **kwargs)
+
+
+def set_async_executor(executor: Optional[Executor] = None, workers: Optional[int] = None) -> Executor:
+    """
+    Set the global executor used by `aload` and `asave`.
+
+    Parameters
+    ----------
+    executor : Optional[Executor], default=None
+        The executor to use. If not provided, a new thread pool is created.
+    workers : Optional[int], default=None
+        The number of threads of the new thread pool, when no executor is given.
+        If None, the default of `ThreadPoolExecutor` is used.
+
+    Returns
+    -------
+    Executor
+        The executor that will be used.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import set_async_executor
+
+        set_async_executor(workers=8)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    global default_executor
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dmf-io")
+
+    previous, default_executor = default_executor, executor
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
+    return executor
+
+
+async def _run(executor: Optional[Executor], func, *args, **kwargs) -> Any:
+    """Run a function in the executor, creating the global one if needed."""
+    import asyncio
+    import functools
+
+    if executor is None:
+        executor = default_executor or set_async_executor()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
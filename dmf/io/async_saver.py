@@ -0,0 +1,192 @@
+import atexit
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, List, Optional, Set, Union
+
+__all__ = ["AsyncSaver", "default_saver"]
+
+# Savers with writes that must be completed before the interpreter exits
+_open_savers: "weakref.WeakSet[AsyncSaver]" = weakref.WeakSet()
+
+
+class AsyncSaver:
+    """
+    Save data in background threads, behind a queue bounded by a byte budget.
+
+    `save` returns immediately with a future while the data is serialized and
+    written by the worker threads with `dmf.io.save`. When the data waiting to
+    be written exceeds `max_bytes`, `save` blocks until enough writes have
+    finished, so a fast producer can not exhaust the memory. The pending
+    writes are completed when the saver is closed, when the context manager
+    exits and when the interpreter exits.
+
+    Errors raised while writing are set on the future of the write and raised
+    again by the next call to `save`, `flush` or `close`, so they are not lost
+    when the futures are not checked.
+
+    The data must not be modified until its write has finished, as it is not
+    copied.
+
+    Parameters
+    ----------
+    workers : int, default=1
+        The number of writer threads. With a single thread, the writes are done
+        in submission order, so several saves to the same file keep the last one.
+    max_bytes : int, default=1 GiB
+        The maximum estimated memory, in bytes, of the data waiting to be written.
+        A single save larger than the budget is accepted when nothing else is pending.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import AsyncSaver
+
+        with AsyncSaver(max_bytes=4 * 1024**3) as saver:
+            for epoch in range(100):
+                train(model)
+                saver.save(model.state_dict(), f"checkpoints/epoch{epoch}.pt")
+        # All the checkpoints are written here, and write errors are raised
+
+        # Or through save with the global saver
+        from dmf.io import save
+        future = save(results, "results.parquet", background=True)
+    """
+
+    def __init__(self, workers: int = 1, max_bytes: int = 1024**3):
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dmf-save")
+        self._condition = threading.Condition()
+        self._pending_bytes = 0
+        self._futures: Set[Future] = set()
+        self._errors: List[BaseException] = []
+        self._closed = False
+        _open_savers.add(self)
+
+    @property
+    def pending_bytes(self) -> int:
+        """Estimated memory of the data waiting to be written."""
+        return self._pending_bytes
+
+    @property
+    def closed(self) -> bool:
+        """Whether the saver has been closed."""
+        return self._closed
+
+    def save(self, data: Any, file_path: Union[str, Path], saver: Optional[str] = None, **kwargs) -> Future:
+        """
+        Queue data to be saved with `dmf.io.save`, blocking while the byte budget is exceeded.
+
+        Parameters
+        ----------
+        data : Any
+            The data to be saved.
+        file_path : Union[str, Path]
+            The path to the file where the data should be saved.
+        saver : Optional[str], default=None
+            The saver type to use. If not provided, it will be inferred from the file extension.
+        kwargs : dict
+            Additional keyword arguments to pass to `save`.
+
+        Returns
+        -------
+        Future
+            A future that completes when the file has been written.
+        """
+        from .cache import _estimate_size
+        from .save import save
+
+        if self._closed:
+            raise RuntimeError("Cannot save with a closed AsyncSaver.")
+        self._raise_errors()
+
+        nbytes = _estimate_size(data)
+        with self._condition:
+            while self._futures and self._pending_bytes + nbytes > self.max_bytes:
+                self._condition.wait()
+            self._pending_bytes += nbytes
+            future = self._executor.submit(save, data, file_path, saver=saver, **kwargs)
+            self._futures.add(future)
+        future.add_done_callback(partial(self._on_done, nbytes))
+        return future
+
+    def _on_done(self, nbytes: int, future: Future) -> None:
+        """Release the budget of a finished write and record its error."""
+        with self._condition:
+            self._pending_bytes -= nbytes
+            self._futures.discard(future)
+            if not future.cancelled() and future.exception() is not None:
+                self._errors.append(future.exception())
+            self._condition.notify_all()
+
+    def _raise_errors(self) -> None:
+        """Raise the first error of the writes finished since the last check."""
+        with self._condition:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def flush(self) -> None:
+        """Wait until all the pending writes have finished, raising the first write error."""
+        with self._condition:
+            while self._futures:
+                self._condition.wait()
+        self._raise_errors()
+
+    def close(self) -> None:
+        """Complete the pending writes and stop the writer threads."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+            _open_savers.discard(self)
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def __enter__(self):
+        """Context management enter method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context management exit method."""
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"<AsyncSaver pending={len(self)} pending_bytes={self._pending_bytes} "
+            f"max_bytes={self.max_bytes}>"
+        )
+
+
+@atexit.register
+def _close_savers() -> None:
+    """Complete the pending writes of all the savers before the interpreter exits."""
+    errors = []
+    for saver in list(_open_savers):
+        try:
+            saver.close()
+        except Exception as error:
+            errors.append(error)
+    if errors:
+        raise errors[0]
+
+
+# Global saver used by `save(..., background=True)`, created on first use
+default_saver: Optional[AsyncSaver] = None
+_default_saver_lock = threading.Lock()
+
+
+def get_default_saver() -> AsyncSaver:
+    """Return the global saver, creating it if needed."""
+    global default_saver
+    with _default_saver_lock:
+        if default_saver is None or default_saver.closed:
+            default_saver = AsyncSaver()
+        return default_saver
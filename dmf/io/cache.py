@@ -0,0 +1,262 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+__all__ = ["LoadCache", "load_cache"]
+
+
+class LoadCache:
+    """
+    Cache for the results of `load`, keyed by the file and the loader arguments.
+
+    Entries are keyed by the resolved path, size and modification time of the
+    file, together with the loader and its keyword arguments, so modifying a
+    file automatically makes its previous entries unreachable. The cache has an
+    in-memory LRU tier bounded by `max_bytes` and an optional on-disk tier in
+    `cache_dir` that stores a fast binary re-encoding of the result (Arrow for
+    DataFrames, .npy for arrays and pickle otherwise), which survives between
+    processes.
+
+    Cached objects are shared between calls and should not be modified in place.
+    Results that hold open file handles, such as lazy HDF5 files or images, are
+    returned without being cached.
+
+    Parameters
+    ----------
+    max_bytes : int, default=2 GB
+        The maximum estimated size of the results kept in memory. Set to 0 to
+        disable the memory tier.
+    cache_dir : Optional[Union[str, Path]], default=None
+        The directory of the on-disk tier. If None, only the memory tier is used.
+
+    Examples
+    --------
+    Using the global cache:
+
+    .. code-block:: python
+
+        from dmf.io import load, load_cache
+
+        df = load("behaviour.csv", cache=True)  # Parsed and cached
+        df = load("behaviour.csv", cache=True)  # Returned from memory
+        load_cache.stats
+        # {'hits': 1, 'disk_hits': 0, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': ...}
+
+    Using a dedicated cache with an on-disk tier:
+
+    .. code-block:: python
+
+        from dmf.io import LoadCache
+
+        cache = LoadCache(max_bytes=4 * 1024**3, cache_dir="~/.cache/dmf-io")
+        data = cache.load("session.mat")
+        cache.invalidate("session.mat")
+    """
+
+    def __init__(self, max_bytes: int = 2 * 1024**3, cache_dir: Optional[Union[str, Path]] = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def load(self, file_path: Union[str, Path], loader: Optional[str] = None, **kwargs) -> Any:
+        """
+        Load a file through the cache.
+
+        Parameters
+        ----------
+        file_path : Union[str, Path]
+            The path to the file to load.
+        loader : Optional[str], default=None
+            The loader type to use. If not provided, it will be inferred from the file extension.
+        kwargs : dict
+            Additional keyword arguments to pass to the loader function.
+
+        Returns
+        -------
+        Any
+            The data loaded from the file, or the cached result of a previous identical call.
+        """
+        from .load import load, resolve_loader, LOADER_DEFAULTS
+
+        file_path = Path(file_path)
+        loader = resolve_loader(file_path, loader)
+        key = self._make_key(file_path, loader, {**LOADER_DEFAULTS.get(loader, {}), **kwargs})
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return self._entries[key][1]
+
+        data = self._read_disk(file_path, key)
+        if data is not None:
+            with self._lock:
+                self._counters["disk_hits"] += 1
+            self._put(file_path, key, data)
+            return data
+
+        with self._lock:
+            self._counters["misses"] += 1
+        data = load(file_path, loader=loader, **kwargs)
+        if _is_cacheable(data):
+            self._put(file_path, key, data)
+            self._write_disk(file_path, key, data)
+        return data
+
+    def invalidate(self, file_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Remove the cached entries of a file, or all the entries.
+
+        Parameters
+        ----------
+        file_path : Optional[Union[str, Path]], default=None
+            The file whose entries should be removed. If None, the whole cache,
+            including the on-disk tier, is cleared.
+        """
+        path_id = None if file_path is None else self._path_id(Path(file_path))
+        with self._lock:
+            for key in list(self._entries):
+                if path_id is None or key.startswith(path_id):
+                    self._bytes -= self._entries.pop(key)[2]
+
+        if self.cache_dir and self.cache_dir.exists():
+            pattern = "*" if path_id is None else f"{path_id}-*"
+            for cached_file in self.cache_dir.glob(pattern):
+                cached_file.unlink()
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters."""
+        self.invalidate()
+        with self._lock:
+            self._counters = dict.fromkeys(self._counters, 0)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters, and the number and size of the entries in memory."""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries), "bytes": self._bytes}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f'<LoadCache entries={len(self._entries)} bytes={self._bytes} '
+            f'max_bytes={self.max_bytes} cache_dir="{self.cache_dir}">'
+        )
+
+    @staticmethod
+    def _path_id(file_path: Path) -> str:
+        """Short identifier of the resolved path, used as prefix of its keys."""
+        return hashlib.sha256(str(file_path.resolve()).encode()).hexdigest()[:16]
+
+    def _make_key(self, file_path: Path, loader: str, kwargs: dict) -> str:
+        """Build the key of a load call from the file metadata and the loader arguments."""
+        stat = file_path.stat()
+        signature = repr((stat.st_size, stat.st_mtime_ns, loader, sorted(kwargs.items())))
+        return f"{self._path_id(file_path)}-{hashlib.sha256(signature.encode()).hexdigest()[:32]}"
+
+    def _put(self, file_path: Path, key: str, data: Any) -> None:
+        """Store a result in the memory tier, evicting the least recently used entries."""
+        nbytes = _estimate_size(data)
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[2]
+            self._entries[key] = (file_path, data, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self._counters["evictions"] += 1
+
+    def _read_disk(self, file_path: Path, key: str) -> Any:
+        """Read a result from the on-disk tier, or return None if it is not there."""
+        if not self.cache_dir:
+            return None
+
+        for cached_file in self.cache_dir.glob(f"{key}.*"):
+            ext = cached_file.suffix
+            if ext == ".feather":
+                import pandas as pd
+                return pd.read_feather(cached_file)
+            elif ext == ".npy":
+                import numpy as np
+                return np.load(cached_file)
+            elif ext == ".pkl":
+                from .load import load_pickle
+                # Read the out-of-band buffers into writable memory, as the file can be evicted
+                return load_pickle(cached_file, mmap=False)
+        return None
+
+    def _write_disk(self, file_path: Path, key: str, data: Any) -> None:
+        """Store a result in the on-disk tier using a fast binary encoding."""
+        if not self.cache_dir:
+            return
+        import pickle
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_dir / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            ext = _write_binary(data, tmp_file)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # The result can not be serialized, keep it only in memory
+            if tmp_file.exists():
+                tmp_file.unlink()
+            return
+        os.replace(tmp_file, self.cache_dir / f"{key}.{ext}")
+
+
+def _is_cacheable(data: Any) -> bool:
+    """Check that a result holds its data, rather than an open file or a memory map."""
+    return not hasattr(data, "close") and type(data).__name__ != "memmap"
+
+
+def _write_binary(data: Any, file_path: Path) -> str:
+    """Write data with the fastest encoding for its type and return the extension to use."""
+    module = type(data).__module__.split(".")[0]
+    if module == "pandas" and type(data).__name__ == "DataFrame":
+        try:
+            data.to_feather(file_path)
+            return "feather"
+        except (ImportError, ValueError, TypeError):
+            # Non-default indexes or non-string column names are not supported by Arrow
+            pass
+    elif module == "numpy" and type(data).__name__ == "ndarray" and not data.dtype.hasobject:
+        import numpy as np
+        with open(file_path, "wb") as file:
+            np.save(file, data, allow_pickle=False)
+        return "npy"
+
+    from .oob_pickle import dump_out_of_band
+
+    # Large buffers, such as the arrays of a dict of arrays, are written without copies
+    with open(file_path, "wb") as file:
+        dump_out_of_band(data, file)
+    return "pkl"
+
+
+def _estimate_size(data: Any) -> int:
+    """Estimate the memory used by a loaded result."""
+    if hasattr(data, "memory_usage") and hasattr(data, "columns"):
+        return int(data.memory_usage(deep=True).sum())
+    if hasattr(data, "nbytes") and not isinstance(data, (str, bytes)):
+        return int(data.nbytes)
+    if isinstance(data, dict):
+        return sys.getsizeof(data) + sum(_estimate_size(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return sys.getsizeof(data) + sum(_estimate_size(value) for value in data)
+    return sys.getsizeof(data)
+
+
+# Initialize the global instance of LoadCache, used by `load(..., cache=True)`
+load_cache = LoadCache()
@@ -0,0 +1,240 @@
+import io
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Container, Iterator, IO, Optional, Tuple, Union
+
+from ..utils.decorators import register
+
+__all__ = ["open_compressed", "split_compression"]
+
+# Openers of the single-file compression codecs, shared by compress, decompress, load and save
+CODECS = {}
+
+# Tar archives compressed through a codec stream, as tarfile does not support these codecs
+TAR_CODECS = {"tar.zst": "zst", "tzst": "zst", "tar.lz4": "lz4"}
+
+# Formats that are read and written sequentially, and can be streamed through a codec.
+# Other formats need random access and are (de)compressed through an in-memory buffer.
+STREAMABLE_EXTENSIONS = {
+    "csv", "tsv", "json", "jsonl", "ndjson", "txt", "html", "log", "md", "rst",
+    "yaml", "yml", "ini", "cfg", "pkl", "pickle",
+}
+
+
+def open_compressed(
+    file_path: Union[str, Path],
+    mode: str = "rb",
+    compression: Optional[str] = None,
+    **kwargs,
+) -> "CompressedFile":
+    """
+    Open a compressed file as a binary stream that (de)compresses on the fly.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the compressed file.
+    mode : str, default="rb"
+        "rb" to read or "wb" to write the file.
+    compression : Optional[str], default=None
+        The compression codec: "gz", "bz2", "xz", "zst" or "lz4". If not provided, it
+        will be inferred from the file extension.
+    kwargs : dict
+        Additional keyword arguments to pass to the codec, e.g. `compresslevel` for gzip,
+        or `level`, `threads` and `long_distance` for zstd.
+
+    Returns
+    -------
+    CompressedFile
+        A binary file object whose `name` is the path without the compression extension.
+
+    Raises
+    ------
+    ValueError
+        If the compression codec is not supported.
+    """
+    file_path = Path(file_path)
+    inner_path, detected = split_compression(file_path)
+    compression = compression or detected
+    if compression not in CODECS:
+        raise ValueError(
+            f"Compression format {compression} is not supported for streaming. "
+            f"Use one of {list(CODECS.keys())}."
+        )
+    return CompressedFile(CODECS[compression](file_path, mode, **kwargs), inner_path, mode)
+
+
+def split_compression(file_path: Union[str, Path]) -> Tuple[Path, Optional[str]]:
+    """
+    Split the compression extension from a file path.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the file, e.g. "data.csv.gz".
+
+    Returns
+    -------
+    Tuple[Path, Optional[str]]
+        The path without the compression extension and the compression codec,
+        e.g. ("data.csv", "gz"), or the unchanged path and None if the file
+        has no compression extension.
+    """
+    file_path = Path(file_path)
+    ext = file_path.suffix.lstrip(".").lower()
+    if ext in CODECS:
+        return file_path.with_suffix(""), ext
+    return file_path, None
+
+
+def registered_extension(file_path: Union[Path, BinaryIO], extensions: Container[str]) -> str:
+    """
+    Return the longest registered extension of a file name (without leading dot), or its last suffix.
+
+    Double extensions such as "csv.gz" are preferred to their last suffix when
+    registered. For open streams, the extension is taken from their name.
+    """
+    if not isinstance(file_path, Path):
+        file_path = Path(getattr(file_path, "name", None) or "")
+    suffixes = [suffix.lower() for suffix in file_path.suffixes]
+    candidates = ["".join(suffixes[i:]).lstrip(".") for i in range(len(suffixes))]
+    return next((candidate for candidate in candidates if candidate in extensions),
+                file_path.suffix.lstrip(".").lower())
+
+
+class CompressedFile:
+    """
+    Binary file object over a compression codec, named after the inner file.
+
+    All the file methods are delegated to the codec stream. The `name` is the
+    path without the compression extension, so libraries that infer the format
+    from the name of a file object handle it as the uncompressed file.
+    """
+
+    def __init__(self, fileobj: BinaryIO, name: Union[str, Path], mode: str = "rb"):
+        self._fileobj = fileobj
+        self.name = str(name)
+        self.mode = mode
+
+    def __getattr__(self, attr: str):
+        return getattr(self._fileobj, attr)
+
+    def __iter__(self):
+        return iter(self._fileobj)
+
+    def __enter__(self):
+        """Context management enter method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context management exit method."""
+        self._fileobj.close()
+
+    def __repr__(self) -> str:
+        return f'<CompressedFile name="{self.name}" stream={self._fileobj!r}>'
+
+
+@register(CODECS, ["gz", "gzip"])
+def open_gzip(file_path: Path, mode: str = "rb", **kwargs) -> BinaryIO:
+    """Open a gzip stream."""
+    import gzip
+    return gzip.open(file_path, mode, **kwargs)
+
+
+@register(CODECS, ["bz2", "bzip2"])
+def open_bzip2(file_path: Path, mode: str = "rb", **kwargs) -> BinaryIO:
+    """Open a bzip2 stream."""
+    import bz2
+    return bz2.open(file_path, mode, **kwargs)
+
+
+@register(CODECS, ["xz"])
+def open_xz(file_path: Path, mode: str = "rb", **kwargs) -> BinaryIO:
+    """Open an xz stream."""
+    import lzma
+    return lzma.open(file_path, mode, **kwargs)
+
+
+@register(CODECS, ["zst", "zstd"])
+def open_zstd(
+    file_path: Path,
+    mode: str = "rb",
+    level: Optional[int] = None,
+    threads: int = 0,
+    long_distance: Union[bool, int] = False,
+    **kwargs,
+) -> BinaryIO:
+    """
+    Open a zstd stream.
+
+    When writing, `threads` compresses with that many worker threads (-1 for one
+    per core), and `long_distance` enables long-distance matching with a window
+    of 128 MiB, or of 2**long_distance bytes when an int is given, which finds
+    repetitions far apart in big files.
+    """
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstandard package is required for zstd compression. "
+            "Install it using `pip install zstandard`."
+        )
+    if "r" in mode:
+        # Accept the large windows of long-distance matching
+        kwargs.setdefault("dctx", zstandard.ZstdDecompressor(max_window_size=2**31))
+    elif level is not None or threads or long_distance:
+        params = {"threads": threads}
+        if long_distance:
+            params["enable_ldm"] = True
+            params["window_log"] = 27 if long_distance is True else long_distance
+        kwargs["cctx"] = zstandard.ZstdCompressor(
+            compression_params=zstandard.ZstdCompressionParameters.from_level(
+                3 if level is None else level, **params
+            )
+        )
+    return zstandard.open(file_path, mode, **kwargs)
+
+
+@register(CODECS, ["lz4"])
+def open_lz4(file_path: Path, mode: str = "rb", level: Optional[int] = None, **kwargs) -> BinaryIO:
+    """Open an lz4 frame stream. Levels above 2 use the slower high-compression mode."""
+    try:
+        import lz4.frame
+    except ImportError:
+        raise ImportError(
+            "lz4 package is required for lz4 compression. "
+            "Install it using `pip install lz4`."
+        )
+    if level is not None and "r" not in mode:
+        kwargs["compression_level"] = level
+    return lz4.frame.open(file_path, mode, **kwargs)
+
+
+@contextmanager
+def open_file(file: Union[str, Path, BinaryIO], mode: str = "r", **kwargs) -> Iterator[IO]:
+    """
+    Open a file path, or wrap an already open binary stream such as a `CompressedFile`.
+
+    Streams are not closed on exit, and are wrapped in a text layer for text modes.
+    Additional keyword arguments, such as `newline`, are passed to `open` or to the text layer.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, mode, **kwargs) as opened_file:
+            yield opened_file
+    elif "b" in mode:
+        yield file
+    else:
+        wrapper = io.TextIOWrapper(file, **kwargs)
+        try:
+            yield wrapper
+        finally:
+            if wrapper.writable():
+                wrapper.flush()
+            wrapper.detach()
+
+
+def read_into_memory(stream: BinaryIO) -> io.BytesIO:
+    """Read a whole stream into a seekable in-memory buffer with the same name."""
+    buffer = io.BytesIO(stream.read())
+    buffer.name = getattr(stream, "name", None)
+    return buffer
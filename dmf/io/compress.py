@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Optional, Union, Callable
 
 from ..utils.decorators import register
+from .codecs import CODECS, TAR_CODECS
 
 COMPRESSORS = {}
 
@@ -16,7 +17,10 @@ def compress(
     """
     Compress a file or directory into a specified format.
 
-    This function compresses a file or directory using various compression formats such as gzip, bzip2, xz, zip, 7z, and tar-based formats. The format can either be specified directly or inferred from the output file extension.
+    This function compresses a file or directory using various compression formats such as gzip, bzip2, xz, zstd, lz4, zip, 7z, and tar-based formats. The format can either be specified directly or inferred from the output file extension.
+
+    zstd (.zst, .tar.zst) compresses with several threads and is much faster than
+    gzip at a similar ratio, and lz4 (.lz4, .tar.lz4) is faster still at a lower ratio.
 
     Parameters
     ----------
@@ -29,7 +33,10 @@ def compress(
     password : Optional[str], default=None
         Password for the archive, supported only for ZIP and 7z formats.
     kwargs : dict
-        Additional keyword arguments to pass to the compression function.
+        Additional keyword arguments to pass to the compression function. For zstd
+        and lz4, `level` sets the compression level. For zstd, `threads` sets the
+        number of worker threads (-1 for one per core) and `long_distance=True`
+        enables long-distance matching, which improves the ratio of big archives.
 
     Returns
     -------
@@ -73,6 +80,12 @@ def compress(
 
         compress("my_folder", output_file="my_folder.tar.gz")
 
+    Compressing a big directory with zstd on all the cores
+
+    .. code-block:: python
+
+        compress("recordings", compression="tar.zst", level=10, threads=-1, long_distance=True)
+
     Compressing a directory into a password-protected file
 
     .. code-block:: python
@@ -91,9 +104,11 @@ def compress(
     if output_file:
         output_file = Path(output_file)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        compression = next(
+        # The longest matching extension, so that "tar.gz" is chosen before "gz"
+        compression = max(
             (ext for ext in COMPRESSORS if output_file.name.endswith(f".{ext}")),
-            None,
+            key=len,
+            default=None,
         )
     if not output_file:
         compression = compression or "zip"
@@ -117,11 +132,9 @@ def compress_gzip(
     input_file: Path, output_file: Path, password: Optional[str] = None, **kwargs
 ) -> None:
     """Compress a file using gzip."""
-    import gzip
-
     _check_no_folder(input_file)
     _check_password_none(password)
-    _generic_compressor(input_file, output_file, gzip.open, **kwargs)
+    _generic_compressor(input_file, output_file, CODECS["gz"], **kwargs)
 
 
 @register(COMPRESSORS, ["bz2", "bzip2"])
@@ -129,11 +142,9 @@ def compress_bzip2(
     input_file: Path, output_file: Path, password: Optional[str] = None, **kwargs
 ) -> None:
     """Compress a file using bzip2."""
-    import bz2
-
     _check_no_folder(input_file)
     _check_password_none(password)
-    _generic_compressor(input_file, output_file, bz2.open, **kwargs)
+    _generic_compressor(input_file, output_file, CODECS["bz2"], **kwargs)
 
 
 @register(COMPRESSORS, ["xz"])
@@ -141,11 +152,29 @@ def compress_xz(
     input_file: Path, output_file: Path, password: Optional[str] = None, **kwargs
 ) -> None:
     """Compress a file using xz."""
-    import lzma
+    _check_no_folder(input_file)
+    _check_password_none(password)
+    _generic_compressor(input_file, output_file, CODECS["xz"], **kwargs)
+
 
+@register(COMPRESSORS, ["zst", "zstd"])
+def compress_zstd(
+    input_file: Path, output_file: Path, password: Optional[str] = None, **kwargs
+) -> None:
+    """Compress a file using zstd."""
     _check_no_folder(input_file)
     _check_password_none(password)
-    _generic_compressor(input_file, output_file, lzma.open, **kwargs)
+    _generic_compressor(input_file, output_file, CODECS["zst"], **kwargs)
+
+
+@register(COMPRESSORS, ["lz4"])
+def compress_lz4(
+    input_file: Path, output_file: Path, password: Optional[str] = None, **kwargs
+) -> None:
+    """Compress a file using lz4."""
+    _check_no_folder(input_file)
+    _check_password_none(password)
+    _generic_compressor(input_file, output_file, CODECS["lz4"], **kwargs)
 
 
 @register(COMPRESSORS, ["zip"])
@@ -193,7 +222,7 @@ def compress_7z(
             archive.write(input_file, arcname=input_file.name)
 
 
-@register(COMPRESSORS, ["tar", "tgz", "tar.gz", "tar.bz2", "tar.xz"])
+@register(COMPRESSORS, ["tar", "tgz", "tar.gz", "tar.bz2", "tar.xz", "tar.zst", "tzst", "tar.lz4"])
 def compress_tar(
     input_file: Path, output_file: Path, password: Optional[str] = None, **kwargs
 ) -> None:
@@ -210,15 +239,26 @@ def compress_tar(
         "tar": "w",
     }
 
-    # Compression is first match that ends with the input file suffix
-    compression = next(
-        (comp for comp in mode_mapping if input_file.suffix.endswith(comp)), "tar"
+    if not (input_file.is_dir() or input_file.is_file()):
+        raise ValueError("Invalid input for tar compression.")
+
+    codec = next(
+        (TAR_CODECS[comp] for comp in TAR_CODECS if output_file.name.endswith(f".{comp}")), None
     )
-    if input_file.is_dir() or input_file.is_file():
-        with tarfile.open(output_file, mode_mapping[compression], **kwargs) as tar:
+    if codec:
+        # The tar stream is written through the codec, with kwargs such as level and threads
+        with CODECS[codec](output_file, "wb", **kwargs) as stream, tarfile.open(
+            fileobj=stream, mode="w|", bufsize=1024**2
+        ) as tar:
             tar.add(input_file, arcname=input_file.name)
-    else:
-        raise ValueError("Invalid input for tar compression.")
+        return
+
+    # Compression is the first match that ends with the output file name
+    compression = next(
+        (comp for comp in mode_mapping if output_file.name.endswith(f".{comp}")), "tar"
+    )
+    with tarfile.open(output_file, mode_mapping[compression], **kwargs) as tar:
+        tar.add(input_file, arcname=input_file.name)
 
 
 def _generic_compressor(
@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Optional, Union, Callable
 
 from ..utils.decorators import register
+from .codecs import CODECS, TAR_CODECS
 
 
 DECOMPRESSORS = {}
@@ -17,19 +18,23 @@ def decompress(
     Decompress a compressed file.
 
     This function decompresses a file based on its extension or the specified compression format.
-    Supported formats include gzip, bzip2, xz, zip, 7z, and various tar-based formats.
+    Supported formats include gzip, bzip2, xz, zstd, lz4, zip, 7z, and various tar-based formats.
 
     Supported Formats
     -----------------
     - gzip (.gz, .gzip)
     - bzip2 (.bz2, .bzip2)
     - xz (.xz)
+    - zstd (.zst, .zstd)
+    - lz4 (.lz4)
     - zip (.zip)
     - 7z (.7z)
     - tar (.tar)
     - tar.gz (.tar.gz, .tgz)
     - tar.bz2 (.tar.bz2)
     - tar.xz (.tar.xz)
+    - tar.zst (.tar.zst, .tzst)
+    - tar.lz4 (.tar.lz4)
 
     Parameters
     ----------
@@ -96,11 +101,18 @@ def decompress(
         output_dir.mkdir(parents=True, exist_ok=True)
 
     if not compression:
-        for key in DECOMPRESSORS.keys():
-            if input_file.name.endswith("." + key):
-                compression = key
-                break
-    
+        # The longest matching extension, so that "tar.gz" is chosen before "gz"
+        compression = max(
+            (key for key in DECOMPRESSORS if input_file.name.endswith("." + key)),
+            key=len,
+            default=None,
+        )
+        if not compression:
+            raise ValueError(
+                f"Compression format of {input_file} could not be inferred. "
+                f"Use one of {list(DECOMPRESSORS.keys())}."
+            )
+
     compression = compression.lower().lstrip(".")
     decompressor_func = DECOMPRESSORS.get(compression)
     if not decompressor_func:
@@ -117,9 +129,8 @@ def decompress_gzip(
     input_file: Path, output_dir: Path, password: Optional[str] = None, **kwargs
 ) -> None:
     """Decompress a gzip file."""
-    import gzip
     _check_password_none(password)
-    _generic_decompresor(input_file, output_dir, gzip.open, **kwargs)
+    _generic_decompresor(input_file, output_dir, CODECS["gz"], **kwargs)
 
 
 @register(DECOMPRESSORS, ["bz2", "bzip2"])
@@ -127,9 +138,8 @@ def decompress_bzip2(
     input_file: Path, output_dir: Path, password: Optional[str] = None, **kwargs
 ) -> None:
     """Decompress a bzip2 file."""
-    import bz2
     _check_password_none(password)
-    _generic_decompresor(input_file, output_dir, bz2.open, **kwargs)
+    _generic_decompresor(input_file, output_dir, CODECS["bz2"], **kwargs)
 
 
 @register(DECOMPRESSORS, "xz")
@@ -137,9 +147,26 @@ def decompress_xz(
     input_file: Path, output_dir: Path, password: Optional[str] = None, **kwargs
 ) -> None:
     """Decompress an xz file."""
-    import lzma
     _check_password_none(password)
-    _generic_decompresor(input_file, output_dir, lzma.open, **kwargs)
+    _generic_decompresor(input_file, output_dir, CODECS["xz"], **kwargs)
+
+
+@register(DECOMPRESSORS, ["zst", "zstd"])
+def decompress_zstd(
+    input_file: Path, output_dir: Path, password: Optional[str] = None, **kwargs
+) -> None:
+    """Decompress a zstd file."""
+    _check_password_none(password)
+    _generic_decompresor(input_file, output_dir, CODECS["zst"], **kwargs)
+
+
+@register(DECOMPRESSORS, "lz4")
+def decompress_lz4(
+    input_file: Path, output_dir: Path, password: Optional[str] = None, **kwargs
+) -> None:
+    """Decompress an lz4 file."""
+    _check_password_none(password)
+    _generic_decompresor(input_file, output_dir, CODECS["lz4"], **kwargs)
 
 
 @register(DECOMPRESSORS, "zip")
@@ -171,7 +198,7 @@ def decompress_7z(
         archive.extractall(output_dir)
 
 
-@register(DECOMPRESSORS, ["tgz", "tar.gz", "tar.bz2", "tar.xz", "tar"])
+@register(DECOMPRESSORS, ["tgz", "tar.gz", "tar.bz2", "tar.xz", "tar.zst", "tzst", "tar.lz4", "tar"])
 def decompress_tar(
     input_file: Path, output_dir: Path, password: Optional[str] = None, **kwargs
 ) -> None:
@@ -180,6 +207,17 @@ def decompress_tar(
 
     _check_password_none(password)
 
+    codec = next(
+        (TAR_CODECS[comp] for comp in TAR_CODECS if input_file.name.endswith(f".{comp}")), None
+    )
+    if codec:
+        # The tar stream is read through the codec
+        with CODECS[codec](input_file, "rb", **kwargs) as stream, tarfile.open(
+            fileobj=stream, mode="r|", bufsize=1024**2
+        ) as tar:
+            tar.extractall(output_dir)
+        return
+
     with tarfile.open(input_file, "r") as tar:
         tar.extractall(output_dir)
 
@@ -0,0 +1,278 @@
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..utils.decorators import register
+
+__all__ = ["inspect"]
+
+INSPECTORS = {}
+
+
+def inspect(file_path: Union[str, Path], inspector: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read the metadata of a file without loading its content.
+
+    Only the headers, footers or attributes of the file are read, so checking the
+    dimensions of many large files is much faster than loading them.
+
+    Supported Formats
+    -----------------
+    - NumPy (.npy, .npz): shape, dtype and memory order of each array, from the array headers.
+    - Parquet (.parquet): columns, types, number of rows and row groups, from the footer.
+    - Feather (.feather, .arrow): columns, types and number of rows, from the Arrow schema.
+    - CSV (.csv, .tsv): columns, from the header line.
+    - HDF5 (.h5, .hdf5, .hdf): shape, dtype, chunks and compression of each dataset, and attributes.
+    - MATLAB (.mat): shape and class of each variable.
+    - Images: width, height, mode, format and number of frames, from the Pillow header.
+    - Audio: sample rate, channels, number of frames and duration, from the soundfile header.
+    - Video: fps, number of frames, width, height and duration, from the OpenCV properties.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the file.
+    inspector : Optional[str], default=None
+        The format of the file. If not provided, it will be detected as in `load`.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The metadata of the file. It always contains the "path", the detected
+        "format" and the on-disk "size" in bytes, and the fields of the format
+        listed above when the format is supported. For compressed files, only
+        the "compression" codec is added.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import inspect
+
+        inspect("embeddings.npy")
+        # {'path': 'embeddings.npy', 'format': 'npy', 'size': 4096000128,
+        #  'shape': (1000000, 1024), 'dtype': 'float32', 'fortran_order': False}
+    """
+    from .load import detect_extension, _detect_compression
+
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"File '{file_path}' does not exist.")
+
+    ext = inspector or detect_extension(file_path)
+    metadata = {"path": str(file_path), "format": ext, "size": file_path.stat().st_size}
+
+    # The headers of compressed files can not be read without decompressing them
+    compression = _detect_compression(file_path)
+    if compression:
+        metadata["compression"] = compression
+        return metadata
+
+    inspector_func = INSPECTORS.get(ext)
+    if inspector_func:
+        metadata.update(inspector_func(file_path))
+    return metadata
+
+
+def _read_npy_header(file) -> Dict[str, Any]:
+    """Read the shape and dtype from the header of an .npy stream."""
+    import numpy as np
+
+    version = np.lib.format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+    return {"shape": shape, "dtype": str(dtype), "fortran_order": fortran_order}
+
+
+@register(INSPECTORS, "npy")
+def inspect_npy(file_path: Path) -> Dict[str, Any]:
+    """Read the metadata of an .npy file from its header."""
+    with open(file_path, "rb") as file:
+        return _read_npy_header(file)
+
+
+@register(INSPECTORS, "npz")
+def inspect_npz(file_path: Path) -> Dict[str, Any]:
+    """Read the metadata of each array of an .npz file from their headers."""
+    import zipfile
+
+    arrays = {}
+    with zipfile.ZipFile(file_path, "r") as archive:
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+            # Only the header of compressed members is decompressed
+            with archive.open(info) as member:
+                arrays[info.filename[:-4]] = _read_npy_header(member)
+    return {"arrays": arrays}
+
+
+@register(INSPECTORS, "parquet")
+def inspect_parquet(file_path: Path) -> Dict[str, Any]:
+    """Read the metadata of a Parquet file from its footer."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow package is required for parquet inspection. "
+                          "Install it using `pip install pyarrow`.")
+
+    metadata = pq.read_metadata(file_path)
+    schema = metadata.schema.to_arrow_schema()
+    return {
+        "columns": [field.name for field in schema],
+        "dtypes": {field.name: str(field.type) for field in schema},
+        "num_rows": metadata.num_rows,
+        "num_row_groups": metadata.num_row_groups,
+    }
+
+
+@register(INSPECTORS, ["feather", "arrow"])
+def inspect_feather(file_path: Path) -> Dict[str, Any]:
+    """Read the metadata of a Feather (Arrow IPC) file from its schema and batch headers."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("pyarrow package is required for feather inspection. "
+                          "Install it using `pip install pyarrow`.")
+
+    with pa.memory_map(str(file_path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        if hasattr(reader, "count_rows"):
+            # Only the metadata of the record batches is read, not their (compressed) buffers
+            num_rows = reader.count_rows()
+        else:
+            import pyarrow.dataset as ds
+            num_rows = ds.dataset(str(file_path), format="feather").count_rows()
+        return {
+            "columns": reader.schema.names,
+            "dtypes": {field.name: str(field.type) for field in reader.schema},
+            "num_rows": num_rows,
+            "num_record_batches": reader.num_record_batches,
+        }
+
+
+@register(INSPECTORS, ["csv", "tsv"])
+def inspect_csv(file_path: Path) -> Dict[str, Any]:
+    """Read the columns of a CSV file from its header line."""
+    import pandas as pd
+
+    sep = "\t" if file_path.suffix.lower() == ".tsv" else ","
+    return {"columns": list(pd.read_csv(file_path, sep=sep, nrows=0).columns)}
+
+
+@register(INSPECTORS, ["h5", "hdf5", "hdf"])
+def inspect_hdf5(file_path: Path) -> Dict[str, Any]:
+    """Read the metadata of each dataset of an HDF5 file."""
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError("h5py package is required for hdf5 inspection. "
+                          "Install it using `pip install h5py`.")
+
+    datasets = {}
+
+    def visit(name, item):
+        if isinstance(item, h5py.Dataset):
+            datasets[name] = {
+                "shape": item.shape,
+                "dtype": str(item.dtype),
+                "chunks": item.chunks,
+                "compression": item.compression,
+            }
+
+    with h5py.File(file_path, "r") as file:
+        file.visititems(visit)
+        attrs = dict(file.attrs)
+    return {"datasets": datasets, "attrs": attrs}
+
+
+@register(INSPECTORS, "mat")
+def inspect_matlab(file_path: Path) -> Dict[str, Any]:
+    """Read the shape and class of each variable of a MATLAB file."""
+    with open(file_path, "rb") as file:
+        is_hdf5 = file.read(19) == b"MATLAB 7.3 MAT-file"
+    if is_hdf5:
+        return inspect_hdf5(file_path)
+
+    try:
+        import scipy.io
+    except ImportError:
+        raise ImportError("scipy.io is required to inspect .mat files. "
+                          "Install it using `pip install scipy`.")
+    return {
+        "variables": {
+            name: {"shape": shape, "class": matlab_class}
+            for name, shape, matlab_class in scipy.io.whosmat(str(file_path))
+        }
+    }
+
+
+@register(INSPECTORS, ["jpg", "jpeg", "png", "bmp", "gif", "tiff", "tif", "webp"])
+def inspect_image(file_path: Path) -> Dict[str, Any]:
+    """Read the size and mode of an image from its header."""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Pillow package is required for image inspection. "
+                          "Install it using `pip install pillow`.")
+
+    # Opening an image only parses its header, the pixels are decoded on load
+    with Image.open(file_path) as image:
+        return {
+            "width": image.width,
+            "height": image.height,
+            "mode": image.mode,
+            "image_format": image.format,
+            "n_frames": getattr(image, "n_frames", 1),
+        }
+
+
+@register(INSPECTORS, ["wav", "mp3", "flac", "ogg"])
+def inspect_audio(file_path: Path) -> Dict[str, Any]:
+    """Read the sample rate and duration of an audio file from its header."""
+    try:
+        import soundfile as sf
+    except ImportError:
+        raise ImportError("soundfile is required to inspect audio files. "
+                          "Install it using `pip install soundfile`.")
+
+    info = sf.info(str(file_path))
+    return {
+        "sample_rate": info.samplerate,
+        "channels": info.channels,
+        "frames": info.frames,
+        "duration": info.duration,
+        "subtype": info.subtype,
+    }
+
+
+@register(INSPECTORS, ["mp4", "avi", "mov", "mkv"])
+def inspect_video(file_path: Path) -> Dict[str, Any]:
+    """Read the fps, number of frames and size of a video from its container properties."""
+    try:
+        import cv2
+    except ImportError:
+        raise ImportError("OpenCV is required to inspect video files. "
+                          "Install it using `pip install opencv-python`.")
+
+    cap = cv2.VideoCapture(str(file_path))
+    if not cap.isOpened():
+        raise ValueError(f"Unable to open video file: {file_path}")
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        return {
+            "fps": fps,
+            "frame_count": frame_count,
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "duration": frame_count / fps if fps else None,
+        }
+    finally:
+        cap.release()
@@ -0,0 +1,194 @@
+from math import gcd
+from pathlib import Path
+from typing import Iterator, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ["iter_audio"]
+
+READ_FRAMES = 65536
+
+
+def iter_audio(
+    file_path: Union[str, Path],
+    block_size: int = 65536,
+    overlap: int = 0,
+    sr: Optional[int] = None,
+    start: float = 0.0,
+    stop: Optional[float] = None,
+    mono: bool = False,
+    dtype: str = "float32",
+) -> Iterator["np.ndarray"]:
+    """
+    Iterate over an audio file in blocks of samples.
+
+    The file is read with soundfile in fixed-size chunks, so the memory used does
+    not depend on the duration of the recording. When `sr` differs from the
+    sample rate of the file, the audio is resampled incrementally with a
+    polyphase filter, giving the same samples as resampling the whole signal
+    with `scipy.signal.resample_poly`.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the audio file, in any format supported by soundfile
+        (e.g. .wav, .flac, .ogg, .mp3).
+    block_size : int, default=65536
+        The number of samples of each block, at the output sample rate.
+    overlap : int, default=0
+        The number of samples shared by consecutive blocks. Must be smaller than `block_size`.
+    sr : Optional[int], default=None
+        The output sample rate. If None, the sample rate of the file is kept.
+    start : float, default=0.0
+        The time in seconds at which to start reading. The file is seeked to this
+        position without decoding the previous samples.
+    stop : Optional[float], default=None
+        The time in seconds at which to stop reading. If None, read until the end of the file.
+    mono : bool, default=False
+        If True, average the channels into a single one.
+    dtype : str, default="float32"
+        The data type of the samples, as accepted by soundfile ("float32",
+        "float64", "int32" or "int16").
+
+    Yields
+    ------
+    np.ndarray
+        The next block, of shape (block_size,) for single-channel outputs and
+        (block_size, channels) otherwise. The last block can be shorter.
+
+    Raises
+    ------
+    ValueError
+        If the block size, overlap or time window are not valid.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import iter_audio, inspect
+
+        print(inspect("session.flac")["sample_rate"])
+
+        # One-second blocks with 50% overlap, resampled to 16 kHz
+        for block in iter_audio("session.flac", block_size=16000, overlap=8000, sr=16000, mono=True):
+            ...
+
+        # Read a time window of 10 seconds starting at 1 hour
+        blocks = list(iter_audio("session.flac", start=3600, stop=3610))
+    """
+    try:
+        import soundfile as sf
+    except ImportError:
+        raise ImportError("soundfile package is required for audio iteration. "
+                          "Install it using `pip install soundfile`.")
+
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"File '{file_path}' does not exist.")
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer.")
+    if not 0 <= overlap < block_size:
+        raise ValueError("overlap must be non-negative and smaller than block_size.")
+    if start < 0 or (stop is not None and stop < start):
+        raise ValueError("The time window must satisfy 0 <= start <= stop.")
+
+    with sf.SoundFile(str(file_path)) as sound_file:
+        samplerate = sound_file.samplerate
+        start_frame = min(int(round(start * samplerate)), sound_file.frames)
+        stop_frame = sound_file.frames if stop is None else min(int(round(stop * samplerate)), sound_file.frames)
+        resampler = _StreamResampler(samplerate, sr) if sr and sr != samplerate else None
+
+        if start_frame:
+            sound_file.seek(start_frame)
+        remaining = stop_frame - start_frame
+
+        chunks = _read_chunks(sound_file, remaining, mono, dtype, resampler)
+        for block in _reblock(chunks, block_size, overlap):
+            yield block
+
+
+def _read_chunks(sound_file, frames: int, mono: bool, dtype: str, resampler) -> Iterator["np.ndarray"]:
+    """Read a number of frames from a sound file in chunks, resampling them if needed."""
+    while frames > 0:
+        chunk = sound_file.read(min(READ_FRAMES, frames), dtype=dtype, always_2d=True)
+        # Stop early if the file is shorter than announced in its header
+        frames = frames - len(chunk) if len(chunk) else 0
+        if mono:
+            chunk = chunk.mean(axis=1, keepdims=True).astype(dtype, copy=False)
+        if resampler is not None:
+            chunk = resampler.process(chunk, final=frames <= 0).astype(dtype, copy=False)
+        yield chunk
+
+
+def _reblock(chunks: Iterator["np.ndarray"], block_size: int, overlap: int) -> Iterator["np.ndarray"]:
+    """Split a stream of chunks into blocks of a fixed size sharing `overlap` samples."""
+    import numpy as np
+
+    hop = block_size - overlap
+    pending = None
+    yielded = False
+    for chunk in chunks:
+        pending = chunk if pending is None else np.concatenate([pending, chunk])
+        while len(pending) >= block_size:
+            yield _squeeze(pending[:block_size].copy())
+            yielded = True
+            pending = pending[hop:]
+
+    # The last block only contains new samples if it is longer than the overlap
+    if pending is not None and (len(pending) > overlap or (not yielded and len(pending))):
+        yield _squeeze(pending)
+
+
+def _squeeze(block: "np.ndarray") -> "np.ndarray":
+    """Return single-channel blocks as 1D arrays, like soundfile."""
+    return block[:, 0] if block.shape[1] == 1 else block
+
+
+class _StreamResampler:
+    """
+    Polyphase resampler processing a signal chunk by chunk.
+
+    Each chunk is resampled with `scipy.signal.resample_poly` together with enough
+    samples of context on each side to cover the support of the filter, and only
+    the output samples that do not depend on missing context are kept. The chunk
+    boundaries are aligned to multiples of `down`, so the output samples fall on
+    the same grid as when resampling the whole signal at once.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int):
+        divisor = gcd(int(orig_sr), int(target_sr))
+        self.up = int(target_sr) // divisor
+        self.down = int(orig_sr) // divisor
+        # Half-length of the default filter of resample_poly, in input samples
+        half_length = -(-10 * max(self.up, self.down) // self.up) + 1
+        self.pad = -(-half_length // self.down) * self.down
+        self.buffer = None
+        self.offset = 0  # Input index of the first sample of the buffer
+        self.position = 0  # Input index of the next output sample
+
+    def process(self, chunk: "np.ndarray", final: bool = False) -> "np.ndarray":
+        import numpy as np
+        from scipy.signal import resample_poly
+
+        buffer = chunk if self.buffer is None else np.concatenate([self.buffer, chunk])
+        total = self.offset + len(buffer)
+        end = total if final else (total - self.pad) // self.down * self.down
+        if end <= self.position:
+            self.buffer = buffer
+            return buffer[:0]
+
+        segment_start = max(self.offset, self.position - self.pad)
+        segment_stop = total if final else end + self.pad
+        segment = buffer[segment_start - self.offset:segment_stop - self.offset]
+        output = resample_poly(segment, self.up, self.down, axis=0)
+
+        first = (self.position - segment_start) * self.up // self.down
+        last = -(-(end - segment_start) * self.up // self.down)
+        output = output[first:last]
+
+        keep_from = max(self.offset, end - self.pad)
+        self.buffer = buffer[keep_from - self.offset:]
+        self.offset = keep_from
+        self.position = end
+        return output
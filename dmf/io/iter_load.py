@@ -0,0 +1,160 @@
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Optional, Union, TYPE_CHECKING
+
+from ..utils.decorators import register
+from .codecs import STREAMABLE_EXTENSIONS, open_compressed, split_compression
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = ["iter_load"]
+
+BATCH_ITERATORS = {}
+
+
+def iter_load(
+    file_path: Union[str, Path],
+    batch_size: int = 100000,
+    iterator: Optional[str] = None,
+    **kwargs,
+) -> Iterator["pd.DataFrame"]:
+    """
+    Iterate over a tabular file in batches of rows.
+
+    Unlike `load`, the file is never fully read into memory: each batch is
+    decoded when it is requested, so files larger than the available memory
+    can be processed with a bounded memory footprint. CSV and JSON Lines files
+    compressed with gzip, bzip2, xz, zstd or lz4 (e.g. "data.csv.gz") are
+    decompressed on the fly.
+
+    Supported Formats
+    -----------------
+    - "csv": For .csv and .tsv files, read with pandas chunking.
+    - "parquet": For .parquet files, read row group by row group.
+    - "feather": For .feather and .arrow files, read Arrow record batch by record batch.
+    - "jsonl": For .jsonl and .ndjson files, read in blocks of lines.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the file to read.
+    batch_size : int, default=100000
+        The maximum number of rows of each batch.
+    iterator : Optional[str], default=None
+        The format of the file. If not provided, it will be inferred from the file extension.
+    kwargs : dict
+        Additional keyword arguments to pass to the underlying reader, such as
+        `columns` for Parquet and Feather files or `usecols` for CSV files.
+
+    Yields
+    ------
+    pd.DataFrame
+        The next batch of at most `batch_size` rows.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file extension or the specified format is not supported.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import iter_load
+
+        total = 0
+        for batch in iter_load("behaviour.csv", batch_size=500000):
+            total += batch["reaction_time"].sum()
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"File '{file_path}' does not exist.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+
+    inner_path, compression = split_compression(file_path)
+    if not iterator:
+        iterator = inner_path.suffix.lstrip(".").lower()
+        if iterator not in BATCH_ITERATORS and not compression:
+            from .sniff import sniff_format
+            iterator = sniff_format(file_path) or iterator
+    iterator_func = BATCH_ITERATORS.get(iterator)
+    if not iterator_func:
+        raise ValueError(
+            f"Format '{iterator}' is not supported for batch iteration. "
+            f"Use one of {list(BATCH_ITERATORS.keys())}."
+        )
+
+    if compression:
+        if iterator not in STREAMABLE_EXTENSIONS:
+            raise ValueError(f"Compressed '{iterator}' files can not be iterated in batches. "
+                             "Decompress the file first.")
+        return _iter_compressed(iterator_func, file_path, compression, batch_size=batch_size, **kwargs)
+    return iterator_func(file_path, batch_size=batch_size, **kwargs)
+
+
+def _iter_compressed(
+    iterator_func: Callable, file_path: Path, compression: str, **kwargs
+) -> Iterator["pd.DataFrame"]:
+    """Iterate over a compressed file, decompressing it on the fly."""
+    with open_compressed(file_path, "rb", compression=compression) as stream:
+        yield from iterator_func(stream, **kwargs)
+
+
+@register(BATCH_ITERATORS, ["csv", "tsv"])
+def iter_csv(file_path: Union[Path, BinaryIO], batch_size: int, **kwargs) -> Iterator["pd.DataFrame"]:
+    """Iterate over a CSV file, or a decompressed stream, in chunks of rows."""
+    import pandas as pd
+
+    if Path(getattr(file_path, "name", file_path)).suffix.lower() == ".tsv":
+        kwargs.setdefault("sep", "\t")
+
+    with pd.read_csv(file_path, chunksize=batch_size, **kwargs) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+@register(BATCH_ITERATORS, ["parquet"])
+def iter_parquet(file_path: Path, batch_size: int, **kwargs) -> Iterator["pd.DataFrame"]:
+    """Iterate over a Parquet file, reading one row group at a time."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow package is required for parquet batch iteration. "
+                          "Install it using `pip install pyarrow`.")
+
+    with pq.ParquetFile(file_path) as parquet_file:
+        for batch in parquet_file.iter_batches(batch_size=batch_size, **kwargs):
+            yield batch.to_pandas()
+
+
+@register(BATCH_ITERATORS, ["feather", "arrow"])
+def iter_feather(file_path: Path, batch_size: int, columns=None, **kwargs) -> Iterator["pd.DataFrame"]:
+    """Iterate over the record batches of a Feather (Arrow IPC) file."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("pyarrow package is required for feather batch iteration. "
+                          "Install it using `pip install pyarrow`.")
+
+    # Memory-mapping avoids copying uncompressed batches into memory
+    with pa.memory_map(str(file_path), "r") as source:
+        reader = pa.ipc.open_file(source, **kwargs)
+        for index in range(reader.num_record_batches):
+            record_batch = reader.get_batch(index)
+            if columns is not None:
+                record_batch = record_batch.select(columns)
+            for offset in range(0, record_batch.num_rows, batch_size):
+                yield record_batch.slice(offset, batch_size).to_pandas()
+
+
+@register(BATCH_ITERATORS, ["jsonl", "ndjson"])
+def _iter_jsonl_batches(file_path: Union[Path, BinaryIO], batch_size: int, **kwargs) -> Iterator["pd.DataFrame"]:
+    """Iterate over a JSON Lines file, or a decompressed stream, in blocks of lines."""
+    import pandas as pd
+
+    with pd.read_json(file_path, lines=True, chunksize=batch_size, **kwargs) as reader:
+        for chunk in reader:
+            yield chunk
@@ -0,0 +1,261 @@
+import math
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, NamedTuple, Optional, Union
+
+from ..utils.decorators import register
+from .codecs import open_compressed, open_file, split_compression
+
+__all__ = ["iter_jsonl", "get_json_engine"]
+
+JSON_ENGINES = {}
+
+# Engines tried in order when no engine is specified
+ENGINE_PRIORITY = ["orjson", "ujson", "json"]
+
+
+class JSONEngine(NamedTuple):
+    """Functions of a JSON library, normalized to parse and serialize bytes."""
+    name: str
+    loads: Callable[..., Any]
+    dumps: Callable[..., bytes]
+
+
+def get_json_engine(engine: Optional[str] = None) -> JSONEngine:
+    """
+    Return a JSON engine by name, or the fastest installed one.
+
+    Parameters
+    ----------
+    engine : Optional[str], default=None
+        The name of the engine: "orjson", "ujson" or "json" (the standard library).
+        If None, the first installed engine in this order is used, falling back
+        to the standard library for what it can not handle faithfully: indents
+        other than 2, integers beyond 64 bits, NaN and infinite values, which
+        the fast engines write as null, and files with NaN or Infinity, which
+        they do not parse.
+
+    Returns
+    -------
+    JSONEngine
+        A named tuple with the `name` of the engine, a `loads` function accepting
+        bytes or str, and a `dumps(obj, indent=None, sort_keys=False)` function
+        returning UTF-8 encoded bytes. NumPy arrays and scalars are serialized
+        as lists and numbers by all the engines.
+
+    Raises
+    ------
+    ValueError
+        If the engine is not supported.
+    ImportError
+        If the requested engine is not installed.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import numpy as np
+        from dmf.io import get_json_engine
+
+        engine = get_json_engine()
+        engine.name
+        # 'orjson'
+        engine.dumps({"rt": np.array([0.5, 0.7])})
+        # b'{"rt":[0.5,0.7]}'
+    """
+    if engine is None:
+        for name in ENGINE_PRIORITY:
+            try:
+                return _with_fallback(JSON_ENGINES[name]())
+            except ImportError:
+                continue
+    if engine not in JSON_ENGINES:
+        raise ValueError(f"JSON engine '{engine}' is not supported. "
+                         f"Use one of {list(JSON_ENGINES.keys())}.")
+    return JSON_ENGINES[engine]()
+
+
+def resolve_json_engine(engine: Optional[str], kwargs: dict) -> JSONEngine:
+    """
+    Return the engine to use for a call with extra keyword arguments.
+
+    Keyword arguments such as `object_hook` or `ensure_ascii` are only understood
+    by the standard library, so they select it when no engine is specified.
+    """
+    extra = set(kwargs) - {"indent", "sort_keys"}
+    if engine is None and extra:
+        engine = "json"
+    return get_json_engine(engine)
+
+
+def _with_fallback(json_engine: JSONEngine) -> JSONEngine:
+    """Wrap a fast engine to use the standard library for the calls it can not handle faithfully."""
+    if json_engine.name == "json":
+        return json_engine
+    stdlib = stdlib_engine()
+
+    def loads(data: Union[bytes, str], **kwargs) -> Any:
+        try:
+            return json_engine.loads(data, **kwargs)
+        except ValueError:
+            # NaN and Infinity are written by the standard library, but are not valid JSON
+            return stdlib.loads(data, **kwargs)
+
+    def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False, **kwargs) -> bytes:
+        if indent in (None, 2):
+            try:
+                data = json_engine.dumps(obj, indent=indent, sort_keys=sort_keys, **kwargs)
+            except (TypeError, ValueError, OverflowError):
+                # e.g. integers beyond 64 bits, which the fast engines do not serialize
+                pass
+            else:
+                # NaN and infinite values are written as null, so the data is only checked then
+                if b"null" not in data or not _has_non_finite(obj):
+                    return data
+        return stdlib.dumps(obj, indent=indent, sort_keys=sort_keys, **kwargs)
+
+    return JSONEngine(json_engine.name, loads, dumps)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Check whether an object contains NaN or infinite floats, including in NumPy arrays."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    if type(obj).__module__ == "numpy" and hasattr(obj, "dtype"):
+        if obj.dtype.kind == "O":
+            return _has_non_finite(obj.tolist())
+        if obj.dtype.kind in "fc":
+            import numpy as np
+            return not np.isfinite(obj).all()
+    return False
+
+
+def _to_builtin(obj: Any) -> Any:
+    """Convert NumPy arrays and scalars to Python objects that can be serialized."""
+    if hasattr(obj, "tolist") and type(obj).__module__ == "numpy":
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _check_options(engine: str, kwargs: dict) -> None:
+    """Raise an error for options that an engine does not support."""
+    if kwargs:
+        raise ValueError(f"Options {list(kwargs)} are not supported by the '{engine}' engine. "
+                         "Use engine='json' to pass options of the standard library.")
+
+
+@register(JSON_ENGINES, "orjson")
+def orjson_engine() -> JSONEngine:
+    """Return the orjson engine, which serializes NumPy arrays natively."""
+    try:
+        import orjson
+    except ImportError:
+        raise ImportError("orjson package is required for the orjson engine. "
+                          "Install it using `pip install orjson`.")
+
+    def loads(data: Union[bytes, str], **kwargs) -> Any:
+        _check_options("orjson", kwargs)
+        return orjson.loads(data)
+
+    def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False, **kwargs) -> bytes:
+        _check_options("orjson", kwargs)
+        if indent not in (None, 0, 2):
+            raise ValueError("The orjson engine only supports an indent of 2.")
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_to_builtin, option=option)
+
+    return JSONEngine("orjson", loads, dumps)
+
+
+@register(JSON_ENGINES, "ujson")
+def ujson_engine() -> JSONEngine:
+    """Return the ujson engine."""
+    try:
+        import ujson
+    except ImportError:
+        raise ImportError("ujson package is required for the ujson engine. "
+                          "Install it using `pip install ujson`.")
+
+    def loads(data: Union[bytes, str], **kwargs) -> Any:
+        _check_options("ujson", kwargs)
+        return ujson.loads(data)
+
+    def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False, **kwargs) -> bytes:
+        _check_options("ujson", kwargs)
+        text = ujson.dumps(obj, indent=indent or 0, sort_keys=sort_keys, default=_to_builtin,
+                           ensure_ascii=False, escape_forward_slashes=False)
+        return text.encode("utf-8")
+
+    return JSONEngine("ujson", loads, dumps)
+
+
+@register(JSON_ENGINES, "json")
+def stdlib_engine() -> JSONEngine:
+    """Return the engine of the standard library, which accepts all the options of `json`."""
+    import json
+
+    def loads(data: Union[bytes, str], **kwargs) -> Any:
+        return json.loads(data, **kwargs)
+
+    def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False, **kwargs) -> bytes:
+        kwargs.setdefault("default", _to_builtin)
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys, **kwargs).encode("utf-8")
+
+    return JSONEngine("json", loads, dumps)
+
+
+def iter_jsonl(file_path: Union[str, Path, BinaryIO], engine: Optional[str] = None, **kwargs) -> Iterator[Any]:
+    """
+    Iterate over the records of a JSON Lines file.
+
+    The file is read line by line, so only one record is held in memory at a
+    time. Blank lines are skipped. Files compressed with gzip, bzip2, xz, zstd or lz4
+    (e.g. "events.jsonl.gz") are decompressed on the fly.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path, BinaryIO]
+        The path to the .jsonl or .ndjson file, or an open binary stream.
+    engine : Optional[str], default=None
+        The JSON engine: "orjson", "ujson" or "json". If None, the fastest installed one is used.
+    kwargs : dict
+        Additional keyword arguments to pass to `json.loads`. They are only
+        supported by the standard library engine.
+
+    Yields
+    ------
+    Any
+        The next record of the file.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import iter_jsonl
+
+        n_errors = sum(1 for event in iter_jsonl("events.jsonl.gz") if event["type"] == "error")
+    """
+    json_engine = resolve_json_engine(engine, kwargs)
+
+    if isinstance(file_path, (str, Path)):
+        _, compression = split_compression(Path(file_path))
+        if compression:
+            with open_compressed(file_path, "rb", compression=compression) as stream:
+                yield from _iter_lines(stream, json_engine, kwargs)
+            return
+    with open_file(file_path, "rb") as file:
+        yield from _iter_lines(file, json_engine, kwargs)
+
+
+def _iter_lines(file: BinaryIO, json_engine: JSONEngine, kwargs: dict) -> Iterator[Any]:
+    """Parse the non-blank lines of a binary file."""
+    for line in file:
+        if line.strip():
+            yield json_engine.loads(line, **kwargs)
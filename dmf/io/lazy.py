@@ -0,0 +1,720 @@
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+__all__ = [
+    "MmapNpzFile",
+    "HDF5File",
+    "HDF5Group",
+    "HDF5Dataset",
+    "MatlabFile",
+    "MatlabStruct",
+    "MatlabCell",
+    "MatlabArray",
+]
+
+
+class MmapNpzFile(Mapping):
+    """
+    Read-only, memory-mapped view over the arrays stored in a `.npz` archive.
+
+    Members stored without compression (as written by `numpy.savez`) are mapped
+    directly from the archive, so no data is read until the array is accessed and
+    several processes opening the same file share the operating system page cache.
+    Compressed members (`numpy.savez_compressed`) and object arrays cannot be
+    mapped and are decoded into memory on first access.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the `.npz` archive.
+    allow_pickle : bool, default=False
+        Whether to allow loading pickled object arrays. Only used for members
+        that cannot be memory-mapped.
+    mmap_mode : str, default="r"
+        The mode of the memory maps: "r" for read-only, "r+" to write to the
+        archive or "c" for copy-on-write arrays.
+    kwargs : dict
+        Additional keyword arguments to pass to `numpy.load` for the members
+        that cannot be memory-mapped: `fix_imports`, `encoding` or `max_header_size`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import load
+
+        archive = load("embeddings.npz", mmap=True)
+        archive.files
+        # ['train', 'test']
+        rows = archive["train"][:10]  # Only the touched pages are read
+    """
+
+    def __init__(self, file_path: Union[str, Path], allow_pickle: bool = False, mmap_mode: str = "r", **kwargs):
+        import zipfile
+
+        if mmap_mode not in ("r", "r+", "c"):
+            raise ValueError(f"mmap_mode '{mmap_mode}' is not supported. Use 'r', 'r+' or 'c'.")
+        unsupported = set(kwargs) - {"fix_imports", "encoding", "max_header_size"}
+        if unsupported:
+            raise ValueError(f"Options {sorted(unsupported)} are not supported for memory-mapped npz files.")
+
+        self.file_path = Path(file_path)
+        self.allow_pickle = allow_pickle
+        self.mmap_mode = mmap_mode
+        self.load_kwargs = kwargs
+        self._arrays: Dict[str, object] = {}
+        with zipfile.ZipFile(self.file_path, "r") as archive:
+            self._members = {
+                self._member_key(info.filename): info for info in archive.infolist()
+            }
+
+    @staticmethod
+    def _member_key(filename: str) -> str:
+        """Return the array name for an archive member, as `numpy.load` does."""
+        return filename[:-4] if filename.endswith(".npy") else filename
+
+    @property
+    def files(self) -> List[str]:
+        """Names of the arrays stored in the archive."""
+        return list(self._members)
+
+    def __getitem__(self, key: str):
+        if key not in self._members:
+            raise KeyError(f"{key} is not a file in the archive")
+        if key not in self._arrays:
+            self._arrays[key] = self._load_member(self._members[key])
+        return self._arrays[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def _load_member(self, info):
+        """Memory-map a member if it is stored uncompressed, otherwise decode it."""
+        import struct
+        import zipfile
+        import numpy as np
+
+        if info.compress_type == zipfile.ZIP_STORED and info.filename.endswith(".npy"):
+            with open(self.file_path, "rb") as file:
+                # The local header can have a different extra field than the central
+                # directory entry, so the data offset must be computed from it.
+                file.seek(info.header_offset)
+                local_header = file.read(30)
+                if local_header[:4] != b"PK\x03\x04":
+                    raise ValueError(f"Corrupted zip member '{info.filename}'.")
+                name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+                file.seek(info.header_offset + 30 + name_length + extra_length)
+
+                version = np.lib.format.read_magic(file)
+                if version == (1, 0):
+                    header = np.lib.format.read_array_header_1_0(file)
+                elif version == (2, 0):
+                    header = np.lib.format.read_array_header_2_0(file)
+                else:
+                    header = None
+                offset = file.tell()
+
+            if header is not None:
+                shape, fortran_order, dtype = header
+                if not dtype.hasobject:
+                    return np.memmap(
+                        self.file_path,
+                        dtype=dtype,
+                        mode=self.mmap_mode,
+                        shape=shape,
+                        order="F" if fortran_order else "C",
+                        offset=offset,
+                    )
+
+        with np.load(self.file_path, allow_pickle=self.allow_pickle, **self.load_kwargs) as archive:
+            return archive[self._member_key(info.filename)]
+
+    def close(self) -> None:
+        """Drop the references to the mapped arrays held by the archive."""
+        self._arrays.clear()
+
+    def __enter__(self):
+        """Context management enter method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context management exit method."""
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'<MmapNpzFile file="{self.file_path}" files={self.files}>'
+
+
+class HDF5Group(Mapping):
+    """
+    Lazy, read-only view over a group of an HDF5 file.
+
+    Indexing a group by name returns another `HDF5Group` or an `HDF5Dataset`,
+    and nothing is read from the datasets until they are sliced. Groups are
+    usually obtained from an `HDF5File` rather than created directly.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        The open h5py group to wrap.
+    """
+
+    def __init__(self, group):
+        self._group = group
+
+    @property
+    def name(self) -> str:
+        """Full path of the group inside the file."""
+        return self._group.name
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        """Attributes of the group."""
+        return dict(self._group.attrs)
+
+    def __getitem__(self, key: str) -> Union["HDF5Group", "HDF5Dataset"]:
+        import h5py
+
+        item = self._group[key]
+        if isinstance(item, h5py.Dataset):
+            return HDF5Dataset(item)
+        return HDF5Group(item)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._group)
+
+    def __len__(self) -> int:
+        return len(self._group)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._group
+
+    def __repr__(self) -> str:
+        return f'<HDF5Group name="{self.name}" keys={list(self.keys())}>'
+
+
+class HDF5Dataset:
+    """
+    Lazy, read-only view over a dataset of an HDF5 file.
+
+    Indexing the dataset reads only the selected hyperslab from disk, so a slice
+    of a large recording only decompresses the chunks it overlaps. The whole
+    dataset can be read with `read()` or `numpy.asarray`.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        The open h5py dataset to wrap.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import load
+
+        with load("recording.h5") as file:
+            eeg = file["eeg"]
+            eeg.shape, eeg.chunks, eeg.compression
+            # ((1000, 64, 5000), (1, 64, 5000), 'gzip')
+            trial = eeg[10]  # Only reads the chunks of trial 10
+    """
+
+    def __init__(self, dataset):
+        self._dataset = dataset
+
+    @property
+    def name(self) -> str:
+        """Full path of the dataset inside the file."""
+        return self._dataset.name
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the dataset."""
+        return self._dataset.shape
+
+    @property
+    def dtype(self):
+        """NumPy data type of the dataset."""
+        return self._dataset.dtype
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the dataset."""
+        return self._dataset.ndim
+
+    @property
+    def size(self) -> int:
+        """Number of elements of the dataset."""
+        return self._dataset.size
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the dataset in bytes once read into memory."""
+        return self._dataset.size * self._dataset.dtype.itemsize
+
+    @property
+    def chunks(self) -> Optional[Tuple[int, ...]]:
+        """Chunk shape of the dataset, or None if it is stored contiguously."""
+        return self._dataset.chunks
+
+    @property
+    def compression(self) -> Optional[str]:
+        """Name of the compression filter, or None if it is not compressed."""
+        return self._dataset.compression
+
+    @property
+    def compression_opts(self) -> Any:
+        """Options of the compression filter, e.g. the gzip level."""
+        return self._dataset.compression_opts
+
+    @property
+    def shuffle(self) -> bool:
+        """Whether the shuffle filter is applied before compression."""
+        return self._dataset.shuffle
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        """Attributes of the dataset."""
+        return dict(self._dataset.attrs)
+
+    def iter_chunks(self, selection: Optional[Tuple[slice, ...]] = None) -> Iterator[Tuple[slice, ...]]:
+        """
+        Iterate over the chunk-aligned selections of the dataset.
+
+        Parameters
+        ----------
+        selection : Optional[Tuple[slice, ...]], default=None
+            Restrict the iteration to the chunks that overlap this selection.
+
+        Yields
+        ------
+        Tuple[slice, ...]
+            A selection that can be used to index the dataset and reads exactly one chunk.
+        """
+        return self._dataset.iter_chunks(selection)
+
+    def read(self):
+        """Read the whole dataset into memory."""
+        return self._dataset[()]
+
+    def __getitem__(self, index):
+        return self._dataset[index]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.read()
+        return data if dtype is None else data.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self._dataset)
+
+    def __repr__(self) -> str:
+        return (
+            f'<HDF5Dataset name="{self.name}" shape={self.shape} dtype={self.dtype} '
+            f'chunks={self.chunks} compression={self.compression}>'
+        )
+
+
+class HDF5File(HDF5Group):
+    """
+    Read-only HDF5 file that stays open and reads datasets lazily.
+
+    The file is kept open until `close()` is called or the context manager
+    exits. The root group behaves as an `HDF5Group`.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path, BinaryIO]
+        The path to the HDF5 file, or a seekable binary file object.
+    kwargs : dict
+        Additional keyword arguments to pass to `h5py.File`, for example
+        `rdcc_nbytes` to enlarge the chunk cache.
+    """
+
+    def __init__(self, file_path: Union[str, Path, BinaryIO], **kwargs):
+        import h5py
+
+        # File objects, such as decompressed streams, are opened as they are
+        self.file_path = Path(file_path) if isinstance(file_path, str) else file_path
+        super().__init__(h5py.File(self.file_path, "r", **kwargs))
+
+    @property
+    def closed(self) -> bool:
+        """Whether the file has been closed."""
+        return not self._group.id.valid
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._group.close()
+
+    def __enter__(self):
+        """Context management enter method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context management exit method."""
+        self.close()
+
+    def __repr__(self) -> str:
+        if self.closed:
+            return f'<HDF5File file="{self.file_path}" (closed)>'
+        return f'<HDF5File file="{self.file_path}" keys={list(self.keys())}>'
+
+
+# Names of the groups used internally by MATLAB to store referenced data
+MATLAB_INTERNAL_GROUPS = ("#refs#", "#subsystem#")
+
+
+def _matlab_class(item) -> Optional[str]:
+    """Return the MATLAB class stored in the attributes of an HDF5 object, if any."""
+    value = item.attrs.get("MATLAB_class")
+    if value is None:
+        return None
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _wrap_matlab(item):
+    """Wrap an object of a MATLAB v7.3 file in the proxy matching its MATLAB class."""
+    import h5py
+    import numpy as np
+
+    matlab_class = _matlab_class(item)
+    if isinstance(item, h5py.Group):
+        if "MATLAB_sparse" in item.attrs:
+            return _read_matlab_sparse(item)
+        return MatlabStruct(item)
+    if item.attrs.get("MATLAB_empty", 0):
+        # Empty arrays store their dimensions instead of their data
+        if matlab_class == "char":
+            return ""
+        return np.zeros(tuple(np.asarray(item[()]).astype(int).ravel()))
+    if h5py.check_dtype(ref=item.dtype) is not None:
+        return MatlabCell(item)
+    if matlab_class == "char":
+        return _decode_matlab_char(item[()].T)
+    return MatlabArray(item)
+
+
+def _decode_matlab_char(data) -> Union[str, List[str]]:
+    """Decode a MATLAB char array stored as UTF-16 code units into strings."""
+    import numpy as np
+
+    data = np.atleast_2d(data).astype(np.uint16)
+    rows = ["".join(map(chr, row)) for row in data]
+    return rows[0] if len(rows) == 1 else rows
+
+
+def _read_matlab_sparse(group):
+    """Read a MATLAB sparse matrix, stored as the CSC arrays data, ir and jc."""
+    try:
+        from scipy.sparse import csc_matrix
+    except ImportError:
+        raise ImportError("scipy package is required to read MATLAB sparse matrices. "
+                          "Install it using `pip install scipy`.")
+    import numpy as np
+
+    indptr = group["jc"][()]
+    n_rows = int(group.attrs["MATLAB_sparse"])
+    data = group["data"][()] if "data" in group else np.ones(indptr[-1], dtype=bool)
+    indices = group["ir"][()] if "ir" in group else np.zeros(0, dtype=indptr.dtype)
+    return csc_matrix((data, indices, indptr), shape=(n_rows, len(indptr) - 1))
+
+
+def _reverse_index(index, ndim: int) -> tuple:
+    """Translate an index of the MATLAB (column-major) view into an index of the HDF5 dataset."""
+    index = index if isinstance(index, tuple) else (index,)
+    if any(item is Ellipsis for item in index):
+        position = next(i for i, item in enumerate(index) if item is Ellipsis)
+        fill = (slice(None),) * (ndim - len(index) + 1)
+        index = index[:position] + fill + index[position + 1:]
+    index = index + (slice(None),) * (ndim - len(index))
+    return tuple(reversed(index))
+
+
+class MatlabArray(HDF5Dataset):
+    """
+    Lazy, read-only view over a numeric array of a MATLAB v7.3 file.
+
+    MATLAB stores arrays in column-major order, so the HDF5 dataset holds the
+    transpose of the array. This view exposes the array with its MATLAB shape
+    and translates the indices, so that slicing only reads the selected part of
+    the file. Logical arrays are returned as booleans.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        The open h5py dataset to wrap.
+    """
+
+    @property
+    def matlab_class(self) -> Optional[str]:
+        """MATLAB class of the array, e.g. "double", "single" or "logical"."""
+        return _matlab_class(self._dataset)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the array in MATLAB order."""
+        return tuple(reversed(self._dataset.shape))
+
+    @property
+    def dtype(self):
+        """NumPy data type of the array."""
+        import numpy as np
+        return np.dtype(bool) if self.matlab_class == "logical" else self._dataset.dtype
+
+    @property
+    def chunks(self) -> Optional[Tuple[int, ...]]:
+        """Chunk shape of the array in MATLAB order, or None if it is stored contiguously."""
+        chunks = self._dataset.chunks
+        return None if chunks is None else tuple(reversed(chunks))
+
+    def iter_chunks(self, selection: Optional[Tuple[slice, ...]] = None) -> Iterator[Tuple[slice, ...]]:
+        """
+        Iterate over the chunk-aligned selections of the array, in MATLAB order.
+
+        Parameters
+        ----------
+        selection : Optional[Tuple[slice, ...]], default=None
+            Restrict the iteration to the chunks that overlap this selection.
+
+        Yields
+        ------
+        Tuple[slice, ...]
+            A selection that can be used to index the array and reads exactly one chunk.
+        """
+        if selection is not None:
+            selection = _reverse_index(selection, self.ndim)
+        for chunk in self._dataset.iter_chunks(selection):
+            yield tuple(reversed(chunk))
+
+    def _convert(self, data):
+        """Transpose the data read from the dataset and apply the MATLAB class."""
+        import numpy as np
+
+        data = np.asarray(data).T
+        return data.astype(bool) if self.matlab_class == "logical" else data
+
+    def read(self):
+        """Read the whole array into memory."""
+        return self._convert(self._dataset[()])
+
+    def __getitem__(self, index):
+        return self._convert(self._dataset[_reverse_index(index, self.ndim)])
+
+    def __len__(self) -> int:
+        if not self.ndim:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return (
+            f'<MatlabArray name="{self.name}" shape={self.shape} class={self.matlab_class}>'
+        )
+
+
+class MatlabCell:
+    """
+    Lazy, read-only view over a cell array of a MATLAB v7.3 file.
+
+    The cell array only stores references to its elements, which are dereferenced
+    when indexed, so only the elements that are accessed are read. Struct arrays
+    are stored in the same way, one cell array per field.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        The open h5py dataset of references to wrap.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import load
+
+        with load("data_v73.mat") as file:
+            trials = file["data"]["trial"]  # MatlabCell of shape (1, n_trials)
+            first = trials[0, 0][:]  # Only the first trial is read
+    """
+
+    def __init__(self, dataset):
+        self._dataset = dataset
+        self._refs = None
+
+    @property
+    def name(self) -> str:
+        """Full path of the cell array inside the file."""
+        return self._dataset.name
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the cell array in MATLAB order."""
+        return tuple(reversed(self._dataset.shape))
+
+    @property
+    def refs(self):
+        """Array of the HDF5 references to the elements, in MATLAB order."""
+        if self._refs is None:
+            self._refs = self._dataset[()].T
+        return self._refs
+
+    def _dereference(self, ref):
+        """Return the proxy of the element pointed by a reference."""
+        return _wrap_matlab(self._dataset.file[ref])
+
+    def __getitem__(self, index):
+        import numpy as np
+
+        refs = self.refs[index]
+        if not isinstance(refs, np.ndarray):
+            return self._dereference(refs)
+        elements = np.empty(refs.shape, dtype=object)
+        for position, ref in np.ndenumerate(refs):
+            elements[position] = self._dereference(ref)
+        return elements
+
+    def read(self):
+        """Dereference all the elements, returning an object array of their proxies."""
+        return self[...]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the elements in MATLAB (column-major) order."""
+        for ref in self.refs.flatten(order="F"):
+            yield self._dereference(ref)
+
+    def __len__(self) -> int:
+        return self._dataset.size
+
+    def __repr__(self) -> str:
+        return f'<MatlabCell name="{self.name}" shape={self.shape}>'
+
+
+class MatlabStruct(Mapping):
+    """
+    Lazy, read-only view over a struct of a MATLAB v7.3 file.
+
+    Indexing the struct by field name returns a `MatlabStruct` for nested
+    structs, a `MatlabCell` for cell arrays and fields of struct arrays, a
+    `MatlabArray` for numeric arrays, and decodes char arrays into strings.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        The open h5py group of the struct to wrap.
+    """
+
+    def __init__(self, group):
+        self._group = group
+
+    @property
+    def name(self) -> str:
+        """Full path of the struct inside the file."""
+        return self._group.name
+
+    @property
+    def fields(self) -> List[str]:
+        """Names of the fields of the struct, in MATLAB order when it is stored."""
+        fields = self._group.attrs.get("MATLAB_fields")
+        if fields is None:
+            return [key for key in self._group if key not in MATLAB_INTERNAL_GROUPS]
+        return ["".join(char.decode() for char in field) for field in fields]
+
+    def __getitem__(self, key: str):
+        if key in MATLAB_INTERNAL_GROUPS:
+            raise KeyError(key)
+        return _wrap_matlab(self._group[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.fields
+
+    def __repr__(self) -> str:
+        return f'<MatlabStruct name="{self.name}" fields={self.fields}>'
+
+
+class MatlabFile(MatlabStruct):
+    """
+    Read-only MATLAB v7.3 file that stays open and reads variables lazily.
+
+    MATLAB v7.3 files are HDF5 files. The variables are returned as lazy proxies
+    that only read the data that is accessed, and MATLAB references of cell and
+    struct arrays are dereferenced on access. The file is kept open until
+    `close()` is called or the context manager exits.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path, BinaryIO]
+        The path to the MATLAB file, or a seekable binary file object.
+    variable_names : Optional[List[str]], default=None
+        If given, only expose these variables.
+    kwargs : dict
+        Additional keyword arguments to pass to `h5py.File`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import load
+
+        with load("fieldtrip_v73.mat") as file:
+            list(file)
+            # ['data']
+            sampling_rate = file["data"]["fsample"][0, 0]
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path, BinaryIO],
+        variable_names: Optional[List[str]] = None,
+        **kwargs,
+    ):
+        import h5py
+
+        self.file_path = Path(file_path) if isinstance(file_path, str) else file_path
+        super().__init__(h5py.File(self.file_path, "r", **kwargs))
+        self.variable_names = None if variable_names is None else list(variable_names)
+        missing = [name for name in self.variable_names or [] if name not in self._group]
+        if missing:
+            self.close()
+            raise ValueError(f"Variables {missing} not found in '{self.file_path}'.")
+
+    @property
+    def fields(self) -> List[str]:
+        """Names of the variables of the file."""
+        if self.variable_names is not None:
+            return self.variable_names
+        return [key for key in self._group if key not in MATLAB_INTERNAL_GROUPS]
+
+    def __getitem__(self, key: str):
+        if key not in self.fields:
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the file has been closed."""
+        return not self._group.id.valid
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._group.close()
+
+    def __enter__(self):
+        """Context management enter method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context management exit method."""
+        self.close()
+
+    def __repr__(self) -> str:
+        if self.closed:
+            return f'<MatlabFile file="{self.file_path}" (closed)>'
+        return f'<MatlabFile file="{self.file_path}" variables={self.fields}>'
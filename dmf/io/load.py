@@ -1,27 +1,63 @@
 from pathlib import Path
-from typing import Optional, Union, Callable, List
+from typing import Any, BinaryIO, Optional, Tuple, Union, Callable, List, TYPE_CHECKING
 
-__all__ = ["load", "register_loader"]
+from .codecs import (
+    CODECS, STREAMABLE_EXTENSIONS, open_compressed, open_file, read_into_memory, registered_extension,
+    split_compression,
+)
+from .sniff import HEADER_SIZE, sniff_format, sniff_header
+
+if TYPE_CHECKING:
+    from .cache import LoadCache
+
+__all__ = ["load", "register_loader", "set_loader_defaults"]
 
 # Loaders and extension mapping
 LOADERS = {}
 EXTENSION_MAPPING = {}
 
-def load(file_path: Union[str, Path], loader: Optional[str] = None, **kwargs):
+# Default keyword arguments for each loader, set with `set_loader_defaults`
+LOADER_DEFAULTS = {}
+
+# Manifest of the datasets saved in shards, loaded instead of the files of their directory
+SHARDS_MANIFEST = "manifest.shards.json"
+
+def load(
+    file_path: Union[str, Path],
+    loader: Optional[str] = None,
+    cache: Union[bool, "LoadCache"] = False,
+    concat: bool = True,
+    source_column: Optional[str] = None,
+    workers: Optional[int] = None,
+    **kwargs,
+):
     """
     Load data from a file using the appropriate loader.
 
     This function loads data from various file formats by automatically determining the appropriate loader based on the file extension. You can also specify the loader explicitly if desired.
 
+    The format is also detected from the first bytes of binary files, so files without
+    extension, with double extensions or with a wrong extension can be loaded as well.
+    Files compressed with gzip, bzip2, xz, zstd or lz4 (e.g. "data.csv.gz") are decompressed
+    on the fly and passed to the loader of the inner file, without temporary files.
+
+    If `file_path` is a directory or a glob pattern (e.g. "shards/*.parquet"), the
+    matching files are loaded in parallel, in sorted order, and concatenated: DataFrames
+    with a single `pd.concat`, arrays into a single preallocated array and lists of
+    records into a single list. Directories saved with `save(..., shards=...)` are
+    loaded from their manifest instead.
+
     Supported Loaders
     -----------------
-    - "pickle": For .pkl files.
+    - "pickle": For .pkl files. The large buffers of pickles saved with `out_of_band=True` are memory-mapped.
     - "joblib": For .joblib files.
-    - "pandas": For .csv, .parquet, .xlsx, .xls, .feather files.
-    - "json": For .json files.
+    - "pandas": For .csv, .parquet, .xlsx, .xls, .feather files. Use `columns` and `filters` to read only part of the table.
+    - "json": For .json files, parsed with orjson or ujson when installed.
+    - "jsonl": For .jsonl, .ndjson files, returning a list of records.
+    - "shards": For manifest.shards.json files of datasets saved with `save(..., shards=...)`. Use `stream=True` to iterate over the shards.
     - "str": For .txt, .html, .log, .md, .rst files.
     - "hdf5": For .h5, .hdf5, .hdf files.
-    - "numpy": For .npz, .npy files.
+    - "numpy": For .npz, .npy files. Use `mmap=True` to memory-map the arrays instead of reading them.
     - "pillow": For image files (.jpg, .jpeg, .png, .bmp, .gif, .tiff, .tif, .webp).
     - "pytorch": For PyTorch model files (.pt, .pth).
     - "yaml": For .yaml, .yml files.
@@ -36,6 +72,18 @@ def load(file_path: Union[str, Path], loader: Optional[str] = None, **kwargs):
         The path to the file to load. The file extension will be used to determine the appropriate loader if not specified.
     loader : Optional[str], default=None
         The loader type to use. If not provided, it will be inferred from the file extension.
+    cache : Union[bool, LoadCache], default=False
+        If True, use the global `dmf.io.load_cache` to reuse the result of a previous
+        identical call, as long as the file has not been modified. A `LoadCache`
+        instance can be passed to use a dedicated cache instead.
+    concat : bool, default=True
+        Only for directories and glob patterns. If True, concatenate the data of the
+        files, otherwise return the list of the data of each file.
+    source_column : Optional[str], default=None
+        Only for directories and glob patterns of tables. If given, add a column with
+        this name containing the path of the file of each row.
+    workers : Optional[int], default=None
+        Only for directories, glob patterns and sharded datasets. The number of threads used to load the files.
     kwargs : dict
         Additional keyword arguments to pass to the loader function.
 
@@ -45,14 +93,16 @@ def load(file_path: Union[str, Path], loader: Optional[str] = None, **kwargs):
         The data loaded from the file. The return type depends on the loader used, such as:
         - pd.DataFrame for Pandas files (.csv, .parquet, etc.)
         - dict for JSON or YAML files
+        - list for JSON Lines files (.jsonl, .ndjson)
         - np.ndarray for NumPy files (.npy, .npz)
         - torch.Tensor for PyTorch model files (.pt, .pth)
         - PIL.Image for image files (.jpg, .png, etc.)
         - str for text files (.txt, .log, etc.)
         - configparser.ConfigParser for INI files
-        - dict for MATLAB files (.mat)
+        - dmf.io.HDF5File for HDF5 files (.h5, .hdf5, .hdf)
+        - dict for MATLAB files (.mat), or dmf.io.MatlabFile for v7.3 files
         - tuple[np.ndarray, int] for audio files
-        - list[np.ndarray] for video files
+        - np.ndarray of shape (N, H, W, 3) for video files
         - Any for pickle and joblib files (the specific type depends on the serialized object)
 
     Raises
@@ -88,27 +138,243 @@ def load(file_path: Union[str, Path], loader: Optional[str] = None, **kwargs):
         tensor = load('model.pth')
         type(tensor)
         # <class 'torch.Tensor'>
+
+    Loading and concatenating the shards of a dataset:
+
+    .. code-block:: python
+
+        df = load('shards/*.parquet', source_column='shard')
+        arrays = load('embeddings/', concat=False)
     """
 
     file_path = Path(file_path)
+    if file_path.is_dir() and (file_path / SHARDS_MANIFEST).exists():
+        file_path = file_path / SHARDS_MANIFEST
+    if file_path.is_dir() or (_is_pattern(file_path) and not file_path.exists()):
+        return _load_multiple(file_path, loader=loader, cache=cache, concat=concat,
+                              source_column=source_column, workers=workers, **kwargs)
     if not file_path.exists():
         raise FileNotFoundError(f"File '{file_path}' does not exist.")
-    
-    ext = file_path.suffix.lstrip(".").lower()
+
+    if cache is True:
+        from .cache import load_cache as cache
+    if cache is not None and cache is not False:
+        return cache.load(file_path, loader=loader, **kwargs)
+
+    compression = _detect_compression(file_path)
+    if compression:
+        return _load_compressed(file_path, compression, loader, **kwargs)
+
+    loader = resolve_loader(file_path, loader)
+    loader_func = LOADERS[loader]
+    kwargs = {**LOADER_DEFAULTS.get(loader, {}), **kwargs}
+    if loader == "shards" and workers is not None:
+        kwargs["workers"] = workers
+    return loader_func(file_path, **kwargs)
+
+
+def _is_pattern(file_path: Path) -> bool:
+    """Check whether a path contains glob wildcards."""
+    return any(char in str(file_path) for char in "*?[")
+
+
+def _expand_paths(file_path: Path) -> List[Path]:
+    """Return the files of a directory or matching a glob pattern, in sorted order."""
+    import glob
+
+    if file_path.is_dir():
+        paths = [path for path in file_path.iterdir()
+                 if path.is_file() and not path.name.startswith(".")]
+    else:
+        paths = [Path(path) for path in glob.glob(str(file_path), recursive=True)]
+        paths = [path for path in paths if path.is_file()]
+    if not paths:
+        raise FileNotFoundError(f"No files found matching '{file_path}'.")
+    return sorted(paths)
+
+
+def _load_multiple(
+    file_path: Path,
+    concat: bool = True,
+    source_column: Optional[str] = None,
+    workers: Optional[int] = None,
+    **kwargs,
+):
+    """Load the files of a directory or glob pattern in parallel and concatenate them."""
+    from .load_many import load_many
+
+    paths = _expand_paths(file_path)
+    if concat and "mmap" not in kwargs and all(path.suffix.lower() == ".npy" for path in paths):
+        # Map the arrays so that they are only read once, when copied into the output
+        kwargs["mmap"] = True
+    results = load_many(paths, workers=workers, **kwargs)
+    if not concat:
+        return results
+    return _concatenate(results, paths, source_column)
+
+
+def _concatenate(results: List[Any], paths: List[Path], source_column: Optional[str] = None):
+    """Concatenate the data loaded from several files."""
+    import numpy as np
+
+    first = results[0]
+    if all(hasattr(result, "columns") and hasattr(result, "iloc") for result in results):
+        import pandas as pd
+
+        data = pd.concat(results, ignore_index=True)
+        if source_column is not None:
+            sources = pd.Categorical([str(path) for path in paths])
+            lengths = [len(result) for result in results]
+            data[source_column] = sources[np.repeat(np.arange(len(paths)), lengths)]
+        return data
+
+    if source_column is not None:
+        raise ValueError("source_column is only supported for tables.")
+
+    if all(isinstance(result, np.ndarray) and result.ndim for result in results):
+        if any(result.shape[1:] != first.shape[1:] for result in results):
+            raise ValueError("Arrays with different shapes cannot be concatenated.")
+        data = np.empty((sum(len(result) for result in results),) + first.shape[1:],
+                        dtype=np.result_type(*results))
+        offset = 0
+        for result in results:
+            data[offset:offset + len(result)] = result
+            offset += len(result)
+        return data
+
+    if all(isinstance(result, list) for result in results):
+        return [item for result in results for item in result]
+
+    raise ValueError(
+        f"Data of type {type(first).__name__} cannot be concatenated. "
+        "Use concat=False to get the data of each file."
+    )
+
+
+def resolve_loader(file_path: Path, loader: Optional[str] = None) -> str:
+    """Return the name of the loader to use for a file, checking that it is supported."""
     if loader and loader not in LOADERS:
         raise ValueError(f"Loader '{loader}' is not supported. "
                          f"Use one of {list(LOADERS.keys())}.")
     elif not loader:
-        loader = EXTENSION_MAPPING.get(ext, None)
-        if not loader:
-            raise ValueError(
-                f"File extension '{ext}' is not supported. "
-                f"Supported extensions: {list(EXTENSION_MAPPING.keys())}. "
-                "Please specify a supported loader."
-            )
-    
+        loader = _get_loader_name(detect_extension(file_path))
+    return loader
+
+
+def detect_extension(file_path: Union[Path, BinaryIO]) -> str:
+    """
+    Return the extension that identifies the format of a file (without leading dot).
+
+    The longest registered extension of the file name is used (e.g. "csv.gz"
+    before "gz"). The format is detected from the content of the file only when
+    the extension is not registered or is a compression codec, as happens with
+    extension-less files. For compressed files, the extension of the inner file
+    is returned. For open streams, the extension is taken from their name.
+    """
+    if not isinstance(file_path, Path):
+        return registered_extension(file_path, EXTENSION_MAPPING)
+
+    ext = _choose_extension(registered_extension(file_path, EXTENSION_MAPPING), lambda: sniff_format(file_path))
+    if ext in CODECS and ext not in EXTENSION_MAPPING:
+        inner_path, _ = split_compression(file_path)
+        with open_compressed(file_path, "rb", compression=ext) as stream:
+            ext = _choose_extension(registered_extension(inner_path, EXTENSION_MAPPING),
+                                    lambda: sniff_header(stream.read(HEADER_SIZE)))
+    return ext
+
+
+def _choose_extension(ext: str, detect: Callable[[], Optional[str]]) -> str:
+    """
+    Return the extension of a file name, or the format detected from its content.
+
+    A registered extension is trusted, so the content is only read for unknown
+    extensions and compression codecs, whose inner format must be detected.
+    """
+    if ext in EXTENSION_MAPPING and ext not in CODECS:
+        return ext
+    return detect() or ext
+
+
+def _get_loader_name(ext: str) -> str:
+    """Return the loader registered for an extension."""
+    loader = EXTENSION_MAPPING.get(ext, None)
+    if not loader:
+        raise ValueError(
+            f"File extension '{ext}' is not supported. "
+            f"Supported extensions: {list(EXTENSION_MAPPING.keys())}. "
+            "Please specify a supported loader."
+        )
+    return loader
+
+
+def _detect_compression(file_path: Path) -> Optional[str]:
+    """Return the compression codec of a file, unless a loader handles the compressed file itself."""
+    ext = _choose_extension(registered_extension(file_path, EXTENSION_MAPPING), lambda: sniff_format(file_path))
+    if ext in CODECS and ext not in EXTENSION_MAPPING:
+        return ext
+    return None
+
+
+def _load_compressed(file_path: Path, compression: str, loader: Optional[str] = None, **kwargs):
+    """Load a compressed file streaming the decompressed data into the loader of the inner file."""
+    ext = detect_extension(file_path)
+    loader = resolve_loader(file_path, loader) if loader else _get_loader_name(ext)
     loader_func = LOADERS[loader]
-    return loader_func(file_path, **kwargs)
+    kwargs = {**LOADER_DEFAULTS.get(loader, {}), **kwargs}
+
+    # Name the stream after the inner file so that loaders can dispatch on its extension
+    inner_path, _ = split_compression(file_path)
+    if registered_extension(inner_path, EXTENSION_MAPPING) != ext:
+        inner_path = inner_path.with_name(f"{inner_path.name}.{ext}")
+
+    with open_compressed(file_path, "rb", compression=compression) as stream:
+        stream.name = str(inner_path)
+        if ext in STREAMABLE_EXTENSIONS:
+            return loader_func(stream, **kwargs)
+        # Formats that need random access are decompressed into memory
+        return loader_func(read_into_memory(stream), **kwargs)
+
+
+def set_loader_defaults(loader: str, **kwargs: Any) -> None:
+    """
+    Set default keyword arguments for a loader.
+
+    The defaults are applied on every call to `load` that uses the loader, and
+    keyword arguments passed explicitly to `load` take precedence over them.
+    Setting a default to `None` removes it.
+
+    Parameters
+    ----------
+    loader : str
+        The name of a registered loader, e.g. "numpy".
+    kwargs : dict
+        The default keyword arguments for the loader.
+
+    Raises
+    ------
+    ValueError
+        If the loader is not registered.
+
+    Examples
+    --------
+    Memory-map all NumPy files loaded in the session:
+
+    .. code-block:: python
+
+        from dmf.io import load, set_loader_defaults
+
+        set_loader_defaults("numpy", mmap=True)
+        embeddings = load("embeddings.npy")  # Read-only numpy.memmap
+    """
+    if loader not in LOADERS:
+        raise ValueError(f"Loader '{loader}' is not supported. "
+                         f"Use one of {list(LOADERS.keys())}.")
+    defaults = LOADER_DEFAULTS.setdefault(loader, {})
+    for key, value in kwargs.items():
+        if value is None:
+            defaults.pop(key, None)
+        else:
+            defaults[key] = value
 
 
 def register_loader(loader_name: str, extensions: List[str]):
@@ -138,10 +404,38 @@ def register_loader(loader_name: str, extensions: List[str]):
 
 
 @register_loader("pickle", ["pkl", "pickle"])
-def load_pickle(file_path: Path, **kwargs):
-    """Load a file using the pickle loader."""
+def load_pickle(file_path: Path, mmap: bool = True, **kwargs):
+    """
+    Load a file using the pickle loader.
+
+    Pickles saved with `out_of_band=True` have their large buffers stored after
+    the pickle stream. By default, these buffers are memory-mapped, so the arrays
+    are reconstructed without copies and only read from disk when accessed.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the pickle file.
+    mmap : bool, optional
+        If True, memory-map the out-of-band buffers, giving read-only arrays.
+        If False, read them into writable memory. Regular pickles are not
+        affected. Default is True.
+    kwargs : dict
+        Additional keyword arguments to pass to `pickle.load`.
+    """
     import pickle
+    from .oob_pickle import load_out_of_band, read_buffer_table
+
+    if not isinstance(file_path, (str, Path)):
+        # Out-of-band pickles need random access, so streams are read as regular pickles
+        with open_file(file_path, "rb") as file:
+            return pickle.load(file, **kwargs)
+
     with open(file_path, "rb") as file:
+        table = read_buffer_table(file)
+        if table is not None:
+            return load_out_of_band(file, table, mmap=mmap, **kwargs)
+        file.seek(0)
         return pickle.load(file, **kwargs)
 
 @register_loader("joblib", ["joblib"])
@@ -156,83 +450,392 @@ def load_joblib(file_path: Path, **kwargs):
 
 @register_loader("hdf5", ["h5", "hdf5", "hdf"])
 def load_hdf5(file_path: Path, **kwargs):
-    """Load a file using the hdf5 loader."""
+    """
+    Load a file using the hdf5 loader.
+
+    The file is returned open as an `HDF5File`, whose datasets are only read
+    when they are indexed. Close it with `close()` or use it as a context manager.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the HDF5 file.
+    kwargs : dict
+        Additional keyword arguments to pass to `h5py.File`.
+    """
     try:
         import h5py
     except ImportError:
         raise ImportError("h5py package is required for hdf5 loading. "
                           "Install it using `pip install h5py`.")
-    with h5py.File(file_path, "r") as file:
-        return file
+    from .lazy import HDF5File
+    return HDF5File(file_path, **kwargs)
 
 @register_loader("json", ["json"])
-def load_json(file_path: Path, **kwargs):
-    """Load a file using the json loader."""
-    import json
-    with open(file_path, "r") as file:
-        return json.load(file, **kwargs)
-    
+def load_json(file_path: Path, engine: Optional[str] = None, **kwargs):
+    """
+    Load a file using the json loader.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the JSON file.
+    engine : Optional[str], optional
+        The JSON engine: "orjson", "ujson" or "json" (the standard library). If
+        None, the fastest installed engine is used, unless options of the
+        standard library are given. Default is None.
+    kwargs : dict
+        Additional keyword arguments to pass to `json.loads`.
+    """
+    from .json_io import resolve_json_engine
+
+    json_engine = resolve_json_engine(engine, kwargs)
+    with open_file(file_path, "rb") as file:
+        return json_engine.loads(file.read(), **kwargs)
+
+
+@register_loader("jsonl", ["jsonl", "ndjson"])
+def load_jsonl(file_path: Path, engine: Optional[str] = None, **kwargs):
+    """
+    Load a file using the JSON Lines loader, returning the list of records.
+
+    Use `dmf.io.iter_jsonl` to iterate over the records without reading the whole file.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the .jsonl or .ndjson file.
+    engine : Optional[str], optional
+        The JSON engine, as in the json loader. Default is None.
+    kwargs : dict
+        Additional keyword arguments to pass to `json.loads`.
+    """
+    from .json_io import iter_jsonl
+    return list(iter_jsonl(file_path, engine=engine, **kwargs))
+
+
+@register_loader("shards", ["shards.json"])
+def load_shards(
+    file_path: Path,
+    stream: bool = False,
+    workers: Optional[int] = None,
+    verify: bool = False,
+    **kwargs,
+):
+    """
+    Load a dataset saved in shards with `save(..., shards=...)` from its manifest.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the manifest (manifest.shards.json).
+    stream : bool, optional
+        If True, return an iterator over the shards, loading the next one in the
+        background, instead of the reassembled data. Default is False.
+    workers : Optional[int], optional
+        The number of threads loading the shards. Default is None.
+    verify : bool, optional
+        Whether to check the checksums of the shards before loading them. Default is False.
+    kwargs : dict
+        Additional keyword arguments to pass to the loader of the shards.
+    """
+    from .shards import load_sharded
+    return load_sharded(file_path, stream=stream, workers=workers, verify=verify, **kwargs)
+
+
 @register_loader("str", ["txt", "html", "log", "md", "rst"])
 def txt_loader(file_path: Path, **kwargs):
     """Load a file using the txt loader."""
-    with open(file_path, "r") as file:
+    with open_file(file_path, "r") as file:
         return file.read(**kwargs)
 
 @register_loader("numpy", ["npz", "npy"])
-def numpy_loader(file_path: Path, **kwargs):
-    """Load a file using the numpy loader."""
+def numpy_loader(file_path: Path, mmap: bool = False, **kwargs):
+    """
+    Load a file using the numpy loader.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the .npy or .npz file.
+    mmap : bool, optional
+        If True, return a read-only memory-mapped array for .npy files and a
+        `MmapNpzFile` that maps each uncompressed member of .npz files on access.
+        Default is False.
+    kwargs : dict
+        Additional keyword arguments to pass to `numpy.load`.
+    """
     try:
         import numpy as np
     except ImportError:
         raise ImportError("numpy package is required for numpy loading. "
                           "Install it using `pip install numpy`.")
-    ext = file_path.suffix.lstrip(".").lower()
+    ext = detect_extension(file_path)
+    # Streams of compressed files can not be memory-mapped
+    mmap = mmap and isinstance(file_path, Path)
     if ext == "npz":
+        if mmap:
+            from .lazy import MmapNpzFile
+            return MmapNpzFile(file_path, **kwargs)
         return np.load(file_path, **kwargs)
     elif ext == "npy":
+        if mmap:
+            kwargs.setdefault("mmap_mode", "r")
         return np.load(file_path, **kwargs)
     else:
         raise ValueError(f"Extension {ext} is not supported for numpy loading. "
                         f"Use one of {EXTENSION_MAPPING.keys()} or use directly the numpy loader.")
 
 @register_loader("pandas", ["csv", "parquet", "xlsx", "xls", "feather"])
-def pandas_loader(file_path: Path, **kwargs):
-    """Load a file using the pandas loader."""
+def pandas_loader(file_path: Path, columns: Optional[List[str]] = None, filters: Any = None, **kwargs):
+    """
+    Load a file using the pandas loader.
+
+    For Parquet and Feather files, the column projection and the row filters are
+    pushed down to the Arrow reader, so only the selected columns are decoded and,
+    for Parquet, row groups whose statistics cannot match the filters are skipped.
+    The number of skipped row groups is reported in
+    `df.attrs["row_groups_skipped"]` (and the total in `df.attrs["row_groups_total"]`).
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the file.
+    columns : Optional[List[str]], optional
+        The columns to read. Default is None, which reads all the columns.
+    filters : Any, optional
+        Row filters, only supported for Parquet and Feather files. Either a
+        `pyarrow.dataset.Expression` or filters in disjunctive normal form as
+        accepted by `pandas.read_parquet`, e.g. `[("trial", ">", 10)]`.
+        Default is None.
+    kwargs : dict
+        Additional keyword arguments to pass to the pandas reader, or to
+        `pyarrow.Table.to_pandas` when `filters` are given.
+    """
     import pandas as pd
-    ext = file_path.suffix.lstrip(".").lower()
+    ext = detect_extension(file_path)
+    if filters is not None:
+        if ext not in ("parquet", "feather"):
+            raise ValueError(f"Filters are only supported for parquet and feather files, not {ext}.")
+        return _read_arrow_pushdown(file_path, ext, columns=columns, filters=filters, **kwargs)
+
     if ext == "csv":
+        if columns is not None:
+            kwargs["usecols"] = columns
         return pd.read_csv(file_path, **kwargs)
     elif ext == "parquet":
-        return pd.read_parquet(file_path, **kwargs)
-    elif ext == "xlsx":
-        return pd.read_excel(file_path, **kwargs)
-    elif ext == "xls":
+        return pd.read_parquet(file_path, columns=columns, **kwargs)
+    elif ext == "xlsx" or ext == "xls":
+        if columns is not None:
+            kwargs["usecols"] = columns
         return pd.read_excel(file_path, **kwargs)
     elif ext == "feather":
-        return pd.read_feather(file_path, **kwargs)
+        return pd.read_feather(file_path, columns=columns, **kwargs)
     else:
         raise ValueError(f"Extension {ext} is not supported for pandas loading. "
                         f"Use one of {EXTENSION_MAPPING.keys()} or use directly the pandas loader.")
-    
+
+
+def _read_arrow_pushdown(file_path: Path, ext: str, columns: Optional[List[str]], filters: Any, **kwargs):
+    """Read a Parquet or Feather file pushing down the projection and filters to Arrow."""
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow package is required for filtered loading. "
+                          "Install it using `pip install pyarrow`.")
+
+    if isinstance(filters, ds.Expression):
+        expression = filters
+    elif hasattr(pq, "filters_to_expression"):
+        expression = pq.filters_to_expression(filters)
+    else:  # pyarrow < 10
+        expression = pq._filters_to_expression(filters)
+
+    if isinstance(file_path, Path):
+        from pyarrow.fs import LocalFileSystem
+        source, filesystem = str(file_path.resolve()), LocalFileSystem()
+    else:
+        # In-memory stream of a decompressed file
+        import pyarrow as pa
+        source, filesystem = pa.py_buffer(file_path.read()), None
+
+    if ext == "parquet":
+        fragment = ds.ParquetFileFormat().make_fragment(source, filesystem=filesystem)
+        row_groups_total = fragment.num_row_groups
+        # Drop the row groups whose statistics can not satisfy the filters
+        fragment = fragment.subset(filter=expression)
+        row_groups_skipped = row_groups_total - fragment.num_row_groups
+    else:
+        # Feather files have no statistics, so only the projection avoids decoding
+        fragment = ds.IpcFileFormat().make_fragment(source, filesystem=filesystem)
+        row_groups_total, row_groups_skipped = 0, 0
+    table = fragment.to_table(columns=columns, filter=expression)
+
+    data = table.to_pandas(**kwargs)
+    data.attrs["row_groups_total"] = row_groups_total
+    data.attrs["row_groups_skipped"] = row_groups_skipped
+    return data
+
 @register_loader("pillow", ["jpg", "jpeg", "png", "bmp", "gif", "tiff", "tif", "webp"])
-def pillow_loader(file_path: Path, **kwargs):
-    """Load a file using the pillow loader."""
+def pillow_loader(
+    file_path: Path,
+    max_size: Optional[Tuple[int, int]] = None,
+    thumbnail: bool = False,
+    **kwargs,
+):
+    """
+    Load a file using the pillow loader.
+
+    Without options the image is opened lazily, and the pixels are decoded
+    when they are first accessed.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the image file.
+    max_size : Optional[Tuple[int, int]], optional
+        Maximum (width, height) of the returned image, keeping the aspect ratio.
+        JPEG images are decoded directly at a reduced scale (1/2, 1/4 or 1/8)
+        using the draft mode of libjpeg, which is much faster than decoding the
+        full image and resizing it. Default is None.
+    thumbnail : bool, optional
+        If True, return the thumbnail embedded in the EXIF data of the image
+        when there is one, without decoding the image. Default is False.
+    kwargs : dict
+        Additional keyword arguments to pass to `PIL.Image.open`.
+    """
     try:
         from PIL import Image
     except ImportError:
         raise ImportError("Pillow package is required for pillow loading. "
                           "Install it using `pip install pillow`.")
-    return Image.open(file_path, **kwargs)
+    image = Image.open(file_path, **kwargs)
+    if thumbnail:
+        exif_thumbnail = _read_exif_thumbnail(image)
+        if exif_thumbnail is not None:
+            # The thumbnail is decoded from memory, so the file of the full image is closed
+            image.close()
+            image = exif_thumbnail
+
+    if max_size is not None:
+        # Configure the decoder to the smallest scale that is still larger than max_size
+        image.draft(None, tuple(max_size))
+        if image.width > max_size[0] or image.height > max_size[1]:
+            image.thumbnail(max_size)
+    return image
+
+
+def _read_exif_thumbnail(image):
+    """Return the JPEG thumbnail stored in the IFD1 of the EXIF data of an image, if any."""
+    import io
+    import struct
+    from PIL import Image
+
+    exif = image.info.get("exif")
+    if not exif:
+        return None
+    if exif.startswith(b"Exif\x00\x00"):
+        exif = exif[6:]
+    endian = "<" if exif[:2] == b"II" else ">"
+
+    try:
+        # Skip the entries of the IFD0 to find the offset of the IFD1
+        ifd0 = struct.unpack(endian + "I", exif[4:8])[0]
+        num_entries = struct.unpack(endian + "H", exif[ifd0:ifd0 + 2])[0]
+        next_ifd = ifd0 + 2 + 12 * num_entries
+        ifd1 = struct.unpack(endian + "I", exif[next_ifd:next_ifd + 4])[0]
+        if ifd1 == 0:
+            return None
+
+        tags = {}
+        num_entries = struct.unpack(endian + "H", exif[ifd1:ifd1 + 2])[0]
+        for i in range(num_entries):
+            entry = exif[ifd1 + 2 + 12 * i:ifd1 + 14 + 12 * i]
+            tag, _, _, value = struct.unpack(endian + "HHII", entry)
+            tags[tag] = value
+    except struct.error:
+        return None
+
+    # JPEGInterchangeFormat and JPEGInterchangeFormatLength tags
+    offset, length = tags.get(0x0201), tags.get(0x0202)
+    if not offset or not length:
+        return None
+    return Image.open(io.BytesIO(exif[offset:offset + length]))
 
 @register_loader("pytorch", ["pt", "pth"])
-def pytorch_loader(file_path: Path, **kwargs):
-    """Load a file using the pytorch loader."""
+def pytorch_loader(
+    file_path: Path,
+    mmap: bool = True,
+    weights_only: bool = True,
+    map_location: Any = "cpu",
+    keys: Optional[List[str]] = None,
+    **kwargs,
+):
+    """
+    Load a file using the pytorch loader.
+
+    By default, the checkpoint is memory-mapped instead of being copied into
+    private memory, so the tensors are only read from disk when accessed and
+    several processes loading the same file share the page cache.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the checkpoint.
+    mmap : bool, optional
+        If True, memory-map the tensor storages of the file. It is ignored for
+        streams and for checkpoints in the legacy (non-zip) format, or if the
+        installed torch does not support it. Default is True.
+    weights_only : bool, optional
+        If True, only unpickle tensors, primitive types and dictionaries, which
+        is safe for untrusted files. Default is True.
+    map_location : Any, optional
+        Where to remap the storages, as accepted by `torch.load`. Default is "cpu".
+    keys : Optional[List[str]], optional
+        If given, only return the entries of the state dict that match one of
+        the keys, either exactly or as a prefix of dotted names (e.g. "encoder"
+        selects "encoder.layer.weight"). With `mmap=True`, the other tensors are
+        never read from disk. Default is None.
+    kwargs : dict
+        Additional keyword arguments to pass to `torch.load`.
+    """
     try:
         import torch
     except ImportError:
         raise ImportError("torch package is required for pytorch loading. "
                           "Install it using `pip install torch`.")
-    return torch.load(file_path, **kwargs)
+    import inspect
+    import zipfile
+
+    if mmap and "mmap" in inspect.signature(torch.load).parameters:
+        # Memory mapping requires a path to a checkpoint in the zip format
+        kwargs["mmap"] = isinstance(file_path, (str, Path)) and zipfile.is_zipfile(file_path)
+    if "weights_only" in inspect.signature(torch.load).parameters:
+        kwargs["weights_only"] = weights_only
+
+    state = torch.load(file_path, map_location=map_location, **kwargs)
+    if keys is None:
+        return state
+    return _select_keys(state, keys)
+
+
+def _select_keys(state: Any, keys: List[str]) -> dict:
+    """Select the entries of a state dict that match the keys or their dotted prefixes."""
+    from collections.abc import Mapping
+
+    if not isinstance(state, Mapping):
+        raise ValueError(f"Keys can only be selected from a state dict, got {type(state).__name__}.")
+
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    selected = {}
+    for key in keys:
+        matches = {name: value for name, value in state.items()
+                   if name == key or str(name).startswith(key + ".")}
+        if not matches:
+            raise ValueError(f"Key '{key}' not found in the state dict.")
+        selected.update(matches)
+    return selected
 
 @register_loader("yaml", ["yaml", "yml"])
 def load_yaml(file_path: Path, **kwargs):
@@ -243,7 +846,7 @@ def load_yaml(file_path: Path, **kwargs):
         raise ImportError("PyYAML is required to load .yaml files. "
                           "Install it using `pip install pyyaml`.")
     
-    with open(file_path, "r") as file:
+    with open_file(file_path, "r") as file:
         return yaml.safe_load(file)
 
 
@@ -252,20 +855,59 @@ def load_ini(file_path: Path, **kwargs):
     """Load a file using the INI loader."""
     import configparser    
     config = configparser.ConfigParser()
-    config.read(file_path)
+    with open_file(file_path, "r") as file:
+        config.read_file(file)
     return config
 
 
 @register_loader("matlab-scipy", ["mat"])
-def load_matlab(file_path: Path, **kwargs):
-    """Load a file using the MATLAB loader."""
+def load_matlab(file_path: Path, variable_names: Optional[List[str]] = None, **kwargs):
+    """
+    Load a file using the MATLAB loader.
+
+    MATLAB v7.3 files, which are HDF5 files, are returned open as a `MatlabFile`
+    whose variables are only read when accessed. Older files are read with
+    `scipy.io.loadmat`.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the MATLAB file.
+    variable_names : Optional[List[str]], optional
+        The names of the variables to read. The other variables are skipped
+        without being decoded. Default is None (all the variables).
+    kwargs : dict
+        Additional keyword arguments to pass to `scipy.io.loadmat`, or to
+        `h5py.File` for v7.3 files.
+    """
+    if _is_matlab_v73(file_path):
+        try:
+            import h5py  # noqa: F401
+        except ImportError:
+            raise ImportError("h5py package is required to load MATLAB v7.3 files. "
+                              "Install it using `pip install h5py`.")
+        from .lazy import MatlabFile
+        return MatlabFile(file_path, variable_names=variable_names, **kwargs)
+
     try:
         import scipy.io
     except ImportError:
         raise ImportError("scipy.io is required to load .mat files. "
                           "Install it using `pip install scipy`.")
-    
-    return scipy.io.loadmat(file_path, **kwargs)
+
+    return scipy.io.loadmat(file_path, variable_names=variable_names, **kwargs)
+
+
+def _is_matlab_v73(file_path: Union[Path, BinaryIO]) -> bool:
+    """Check whether a MATLAB file is in the HDF5-based v7.3 format."""
+    if isinstance(file_path, (str, Path)):
+        with open(file_path, "rb") as file:
+            header = file.read(HEADER_SIZE)
+    else:
+        position = file_path.tell()
+        header = file_path.read(HEADER_SIZE)
+        file_path.seek(position)
+    return header.startswith(b"MATLAB 7.3") or sniff_header(header) == "h5"
 
 
 @register_loader("audio-librosa", ["wav", "mp3", "flac", "ogg"])
@@ -281,20 +923,98 @@ def load_audio(file_path: Path, **kwargs):
 
 
 @register_loader("video-cv2", ["mp4", "avi", "mov", "mkv"])
-def load_video(file_path: Path, **kwargs):
-    """Load a file using the video loader."""
+def load_video(
+    file_path: Path,
+    start: int = 0,
+    stop: Optional[int] = None,
+    stride: int = 1,
+    max_frames: Optional[int] = None,
+    lazy: bool = False,
+    **kwargs,
+):
+    """
+    Load a file using the video loader.
+
+    The frames are decoded directly into a preallocated array of shape
+    (N, H, W, 3) and dtype uint8, in BGR order as returned by OpenCV.
+    Frames skipped by `stride` are grabbed without being converted.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path to the video file.
+    start : int, optional
+        Index of the first frame to read. Default is 0.
+    stop : Optional[int], optional
+        Index of the frame where reading stops (exclusive). Default is None, the end of the video.
+    stride : int, optional
+        Read one of every `stride` frames. Default is 1.
+    max_frames : Optional[int], optional
+        Maximum number of frames to read. Default is None.
+    lazy : bool, optional
+        If True, return a `dmf.video.VideoReader` that decodes frames on access
+        instead of reading them. It can not be combined with `start`, `stop`,
+        `stride` or `max_frames`. Default is False.
+    kwargs : dict
+        Additional keyword arguments to pass to the `VideoReader` when `lazy` is True.
+    """
     try:
         import cv2
+        import numpy as np
     except ImportError:
         raise ImportError("OpenCV is required to load video files. "
                           "Install it using `pip install opencv-python`.")
     
+    if not isinstance(file_path, Path):
+        raise ValueError("Video files can only be loaded from uncompressed files.")
+    if stride < 1:
+        raise ValueError("stride must be a positive integer.")
+
+    if lazy:
+        if start != 0 or stop is not None or stride != 1 or max_frames is not None:
+            raise ValueError("start, stop, stride and max_frames are not supported with lazy=True. "
+                             "Index the returned VideoReader instead.")
+        from ..video.video_reader import VideoReader
+        return VideoReader(file_path, **kwargs)
+
     cap = cv2.VideoCapture(str(file_path))
-    frames = []
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-        frames.append(frame)
-    cap.release()
-    return frames
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Unable to open video file: {file_path}")
+
+    try:
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        # The frame count of some containers is an estimate, so the buffer can still grow
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        end = frame_count if stop is None else (min(stop, frame_count) if frame_count > 0 else stop)
+        num_frames = len(range(start, end, stride)) if end > 0 else 256
+        if max_frames is not None:
+            num_frames = min(num_frames, max_frames)
+
+        frames = np.empty((num_frames, height, width, 3), dtype=np.uint8)
+        if start > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+
+        index, count = start, 0
+        while (stop is None or index < stop) and (max_frames is None or count < max_frames):
+            if count == len(frames):
+                extra_frames = np.empty((max(count, 1),) + frames.shape[1:], dtype=np.uint8)
+                frames = np.concatenate([frames, extra_frames])
+            # Decode in place into the preallocated buffer
+            slot = frames[count]
+            ret, frame = cap.read(slot)
+            if not ret:
+                break
+            if frame is not slot:
+                # OpenCV allocated a new array instead of writing into the buffer
+                frames[count] = frame
+            count += 1
+            index += 1
+            for _ in range(stride - 1):
+                if (stop is not None and index >= stop) or not cap.grab():
+                    break
+                index += 1
+    finally:
+        cap.release()
+
+    return frames if count == len(frames) else frames[:count].copy()
@@ -0,0 +1,124 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ["load_images"]
+
+RESAMPLING_FILTERS = {
+    "nearest": 0,
+    "lanczos": 1,
+    "bilinear": 2,
+    "bicubic": 3,
+    "box": 4,
+    "hamming": 5,
+}
+
+
+def load_images(
+    paths: Iterable[Union[str, Path]],
+    size: Optional[Tuple[int, int]] = None,
+    mode: str = "RGB",
+    workers: Optional[int] = None,
+    resample: str = "bilinear",
+    as_tensor: bool = False,
+):
+    """
+    Load a list of images into a single (N, H, W, C) array.
+
+    The images are decoded in parallel in a thread pool, as Pillow releases the GIL
+    while decoding, and each image is written directly into its slot of a
+    preallocated contiguous array. JPEG images are decoded at a reduced scale
+    when they are larger than `size`, using the draft mode of libjpeg.
+
+    Parameters
+    ----------
+    paths : Iterable[Union[str, Path]]
+        The paths of the images to load.
+    size : Optional[Tuple[int, int]], default=None
+        The (width, height) to resize the images to. If None, all the images
+        must have the same size as the first one.
+    mode : str, default="RGB"
+        The Pillow mode to convert the images to, e.g. "RGB", "RGBA", "L", or
+        "I;16" for 16-bit images. The number of channels C of the output is the
+        number of bands of the mode, and its dtype is the dtype of the pixels of
+        the mode (uint8, or uint16 for "I;16", int32 for "I" and float32 for "F").
+    workers : Optional[int], default=None
+        The number of threads. If None, the default of `ThreadPoolExecutor` is used.
+    resample : str, default="bilinear"
+        The resampling filter used to resize the images. One of "nearest",
+        "bilinear", "bicubic", "lanczos", "box" or "hamming".
+    as_tensor : bool, default=False
+        If True, return a torch tensor sharing the memory of the array.
+
+    Returns
+    -------
+    Union[np.ndarray, torch.Tensor]
+        An array of shape (N, H, W, C) with the images in the order of `paths`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pathlib import Path
+        from dmf.io import load_images
+
+        paths = sorted(Path("stimuli").glob("*.jpg"))
+        images = load_images(paths, size=(224, 224), workers=8)
+        print(images.shape)  # (N, 224, 224, 3)
+
+        # As a torch tensor in (N, C, H, W) order
+        tensor = load_images(paths, size=(224, 224), as_tensor=True).permute(0, 3, 1, 2)
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Pillow package is required for image loading. "
+                          "Install it using `pip install pillow`.")
+    import numpy as np
+
+    if resample not in RESAMPLING_FILTERS:
+        raise ValueError(f"Unknown resample filter: {resample}. "
+                         f"Available filters are: {', '.join(RESAMPLING_FILTERS)}.")
+
+    paths = [Path(path) for path in paths]
+    resize = size is not None
+    if not resize:
+        size = (0, 0)
+        if paths:
+            with Image.open(paths[0]) as image:
+                size = image.size
+    width, height = size
+    channels = Image.getmodebands(mode)
+    # The dtype of the pixels of the mode, e.g. uint8 for "RGB" and uint16 for "I;16"
+    dtype = np.asarray(Image.new(mode, (1, 1))).dtype
+
+    images = np.empty((len(paths), height, width, channels), dtype=dtype)
+
+    def decode(index: int, path: Path) -> None:
+        with Image.open(path) as image:
+            if image.size != (width, height):
+                if not resize:
+                    raise ValueError(f"Image {path} has size {image.size}, expected "
+                                     f"{(width, height)}. Provide `size` to resize the images.")
+                # Let libjpeg decode at the smallest scale larger than size
+                image.draft(mode if mode in ("L", "RGB") else None, (width, height))
+            image = image.convert(mode) if image.mode != mode else image
+            if image.size != (width, height):
+                image = image.resize((width, height), RESAMPLING_FILTERS[resample])
+            # Copy the pixels into the slot of the image in the output array
+            images[index] = np.asarray(image).reshape(height, width, channels)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(decode, range(len(paths)), paths))
+
+    if as_tensor:
+        try:
+            import torch
+        except ImportError:
+            raise ImportError("PyTorch package is required to return a tensor. "
+                              "Install it using `pip install torch`.")
+        return torch.from_numpy(images)
+    return images
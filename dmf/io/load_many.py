@@ -0,0 +1,145 @@
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..utils.typing import Literal
+from .load import load
+
+__all__ = ["load_many", "load_as_completed"]
+
+ExecutorType = Union[Literal["thread", "process"], Executor]
+ErrorsType = Literal["raise", "return"]
+
+
+def load_many(
+    paths: Iterable[Union[str, Path]],
+    workers: Optional[int] = None,
+    executor: ExecutorType = "thread",
+    errors: ErrorsType = "raise",
+    loader: Optional[str] = None,
+    **kwargs,
+) -> List[Any]:
+    """
+    Load many files concurrently, returning the results in the input order.
+
+    Each file is loaded with `load`, so the loader is inferred from its extension
+    and custom loaders registered with `register_loader` are supported.
+
+    Parameters
+    ----------
+    paths : Iterable[Union[str, Path]]
+        The paths of the files to load.
+    workers : Optional[int], default=None
+        The number of workers. If None, the default of the executor is used.
+    executor : Union[Literal["thread", "process"], Executor], default="thread"
+        "thread" for a thread pool, suited to I/O-bound loads and to libraries that
+        release the GIL while decoding, or "process" for a process pool, suited to
+        CPU-bound pure Python parsing. An existing executor can also be given, in
+        which case it is not shut down.
+    errors : Literal["raise", "return"], default="raise"
+        If "raise", the first error is raised and the pending loads are cancelled.
+        If "return", the exception is returned in place of the result of the file
+        that failed, and the other files are still loaded.
+    loader : Optional[str], default=None
+        The loader type to use. If not provided, it will be inferred from the extension of each file.
+    kwargs : dict
+        Additional keyword arguments to pass to `load`.
+
+    Returns
+    -------
+    List[Any]
+        The loaded data of each file, in the same order as `paths`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pathlib import Path
+        from dmf.io import load_many
+
+        paths = sorted(Path("participants").glob("*.csv"))
+        dfs = load_many(paths, workers=16)
+
+        # Capture the errors instead of stopping at the first one
+        results = load_many(paths, errors="return")
+        failed = [p for p, r in zip(paths, results) if isinstance(r, Exception)]
+    """
+    paths = [Path(path) for path in paths]
+    with _get_executor(executor, workers) as pool:
+        futures = [pool.submit(load, path, loader=loader, **kwargs) for path in paths]
+        try:
+            return [_get_result(future, errors) for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def load_as_completed(
+    paths: Iterable[Union[str, Path]],
+    workers: Optional[int] = None,
+    executor: ExecutorType = "thread",
+    errors: ErrorsType = "raise",
+    loader: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Tuple[Path, Any]]:
+    """
+    Load many files concurrently, yielding each result as soon as it is ready.
+
+    The parameters are the same as in `load_many`. Stopping the iteration early
+    cancels the loads that have not started yet.
+
+    Yields
+    ------
+    Tuple[Path, Any]
+        The path of the file and its loaded data (or the exception raised while
+        loading it if `errors="return"`), in completion order.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import load_as_completed
+
+        for path, df in load_as_completed(paths, workers=16):
+            process(df)
+    """
+    from concurrent.futures import as_completed
+
+    paths = [Path(path) for path in paths]
+    with _get_executor(executor, workers) as pool:
+        futures = {pool.submit(load, path, loader=loader, **kwargs): path for path in paths}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], _get_result(future, errors)
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+@contextmanager
+def _get_executor(executor: ExecutorType, workers: Optional[int]) -> Iterator[Executor]:
+    """Create the executor to use, or reuse the given one without shutting it down."""
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+    if isinstance(executor, Executor):
+        yield executor
+    elif executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield pool
+    elif executor == "process":
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield pool
+    else:
+        raise ValueError(f"Executor '{executor}' is not supported. Use 'thread' or 'process'.")
+
+
+def _get_result(future: Future, errors: ErrorsType) -> Any:
+    """Return the result of a future, or its exception if errors are returned."""
+    if errors == "return":
+        exception = future.exception()
+        return exception if exception is not None else future.result()
+    elif errors == "raise":
+        return future.result()
+    raise ValueError(f"Invalid value for errors: '{errors}'. Use 'raise' or 'return'.")
@@ -0,0 +1,107 @@
+import struct
+import sys
+from typing import Any, BinaryIO, List, Optional, Tuple
+
+__all__ = ["dump_out_of_band", "read_buffer_table", "load_out_of_band"]
+
+# Trailer at the end of pickles with out-of-band buffers: number of buffers and magic bytes
+OOB_MAGIC = b"DMFPKL5\x00"
+TRAILER = struct.Struct("<Q8s")
+
+# Buffers are aligned so that memory-mapped arrays are aligned for vectorized operations
+ALIGNMENT = 64
+
+# Smaller buffers are kept in the pickle stream
+MIN_BUFFER_SIZE = 64 * 1024
+
+# Pickle protocol 5 and its out-of-band buffers are only available from Python 3.8
+OUT_OF_BAND_SUPPORTED = sys.version_info >= (3, 8)
+
+
+def dump_out_of_band(data: Any, file: BinaryIO, min_buffer_size: int = MIN_BUFFER_SIZE, **kwargs) -> None:
+    """
+    Pickle data writing its large contiguous buffers after the pickle stream.
+
+    The data is pickled with protocol 5, and the buffers of at least
+    `min_buffer_size` bytes exposed by the objects (e.g. NumPy arrays) are written
+    without copies after the pickle stream, each aligned to 64 bytes. The file
+    ends with the table of the offsets and lengths of the buffers and a trailer.
+    The file starts as a regular pickle, so its format is still detected as pickle.
+
+    Before Python 3.8, the data is written as a regular protocol 4 pickle.
+    """
+    import pickle
+
+    if not OUT_OF_BAND_SUPPORTED:
+        kwargs.pop("protocol", None)
+        pickle.dump(data, file, protocol=4, **kwargs)
+        return
+
+    if kwargs.pop("protocol", 5) < 5:
+        raise ValueError("Out-of-band buffers require pickle protocol 5.")
+
+    buffers = []
+
+    def buffer_callback(buffer: "pickle.PickleBuffer") -> bool:
+        # A false value stores the buffer out-of-band
+        if buffer.raw().nbytes < min_buffer_size:
+            return True
+        buffers.append(buffer)
+        return False
+
+    pickle.dump(data, file, protocol=5, buffer_callback=buffer_callback, **kwargs)
+
+    table = []
+    position = file.tell()
+    for buffer in buffers:
+        raw = buffer.raw()
+        padding = -position % ALIGNMENT
+        file.write(b"\x00" * padding)
+        file.write(raw)
+        table.extend([position + padding, raw.nbytes])
+        position += padding + raw.nbytes
+    file.write(struct.pack(f"<{len(table)}Q", *table))
+    file.write(TRAILER.pack(len(buffers), OOB_MAGIC))
+
+
+def read_buffer_table(file: BinaryIO) -> Optional[List[Tuple[int, int]]]:
+    """Return the (offset, length) of the out-of-band buffers of a pickle file, or None for regular pickles."""
+    size = file.seek(0, 2)
+    if size < TRAILER.size:
+        return None
+    file.seek(size - TRAILER.size)
+    count, magic = TRAILER.unpack(file.read(TRAILER.size))
+    if magic != OOB_MAGIC:
+        return None
+    file.seek(size - TRAILER.size - 16 * count)
+    values = struct.unpack(f"<{2 * count}Q", file.read(16 * count))
+    return list(zip(values[::2], values[1::2]))
+
+
+def load_out_of_band(file: BinaryIO, table: List[Tuple[int, int]], mmap: bool = True, **kwargs) -> Any:
+    """
+    Unpickle a file written by `dump_out_of_band`.
+
+    With `mmap=True`, the buffers are read-only views of a memory map of the file,
+    so the arrays are not copied and their pages are only read when accessed.
+    Otherwise, each buffer is read once into writable memory.
+    """
+    import pickle
+
+    if not OUT_OF_BAND_SUPPORTED:
+        raise ValueError("Pickles with out-of-band buffers can only be loaded with Python 3.8 or newer.")
+
+    if mmap and table:
+        import mmap as mmap_module
+        view = memoryview(mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ))
+        buffers = [view[offset:offset + length] for offset, length in table]
+    else:
+        buffers = []
+        for offset, length in table:
+            buffer = bytearray(length)
+            file.seek(offset)
+            file.readinto(buffer)
+            buffers.append(buffer)
+
+    file.seek(0)
+    return pickle.load(file, buffers=buffers, **kwargs)
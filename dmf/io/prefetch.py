@@ -0,0 +1,146 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Union
+
+from .load import load
+
+__all__ = ["Prefetcher"]
+
+
+class _Pending:
+    """A file being loaded ahead, with the memory it is estimated to use."""
+
+    def __init__(self, path: Path, future: Future):
+        self.path = path
+        self.future = future
+        # Until the file is loaded, its size on disk is used as an estimate
+        self.nbytes = path.stat().st_size if path.exists() else 0
+        self.measured = False
+
+    def update_size(self) -> None:
+        """Replace the estimate by the size of the loaded data once it is available."""
+        from .cache import _estimate_size
+
+        if not self.measured and self.future.done() and not self.future.cancelled():
+            if self.future.exception() is None:
+                self.nbytes = _estimate_size(self.future.result())
+            self.measured = True
+
+
+class Prefetcher:
+    """
+    Iterate over the data of a sequence of files, loading the next ones in the background.
+
+    While the consumer processes the data of a file, the following files are
+    loaded in a thread pool, so the loading time is hidden behind the
+    computation. The files are loaded ahead as long as there are fewer than
+    `depth` pending files and the memory they use stays below `max_bytes`. The
+    memory of a pending file is estimated from its size on disk until it is
+    loaded, and from the size of its loaded data afterwards. At least one file
+    is always loaded ahead, even if it exceeds the budget.
+
+    Parameters
+    ----------
+    paths : Iterable[Union[str, Path]]
+        The paths of the files, in the order in which they are consumed.
+    depth : int, default=2
+        The maximum number of files loaded ahead of the consumer.
+    workers : Optional[int], default=None
+        The number of threads. If None, `depth` threads are used.
+    max_bytes : Optional[int], default=None
+        The maximum memory, in bytes, used by the files loaded ahead. If None,
+        only `depth` limits the prefetching.
+    loader : Optional[str], default=None
+        The loader type to use. If not provided, it will be inferred from the extension of each file.
+    kwargs : dict
+        Additional keyword arguments to pass to `load`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from pathlib import Path
+        from dmf.io import Prefetcher
+
+        paths = sorted(Path("sessions").glob("*.parquet"))
+        with Prefetcher(paths, depth=4, workers=2, max_bytes=8 * 1024**3) as prefetcher:
+            for df in prefetcher:
+                process(df)  # The next sessions are loaded meanwhile
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Union[str, Path]],
+        depth: int = 2,
+        workers: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        loader: Optional[str] = None,
+        **kwargs,
+    ):
+        if depth < 1:
+            raise ValueError("depth must be a positive integer.")
+        self.paths: List[Path] = [Path(path) for path in paths]
+        self.depth = depth
+        self.max_bytes = max_bytes
+        self.loader = loader
+        self.kwargs = kwargs
+        self._executor = ThreadPoolExecutor(max_workers=workers or depth)
+        self._pending: Deque[_Pending] = deque()
+        self._next_index = 0
+        self._closed = False
+
+    @property
+    def pending_bytes(self) -> int:
+        """Estimated memory used by the files loaded ahead."""
+        for pending in self._pending:
+            pending.update_size()
+        return sum(pending.nbytes for pending in self._pending)
+
+    def _fill(self) -> None:
+        """Submit the next files while the depth and memory budget allow it."""
+        while self._next_index < len(self.paths) and len(self._pending) < self.depth:
+            if self._pending and self.max_bytes is not None and self.pending_bytes >= self.max_bytes:
+                break
+            path = self.paths[self._next_index]
+            future = self._executor.submit(load, path, loader=self.loader, **self.kwargs)
+            self._pending.append(_Pending(path, future))
+            self._next_index += 1
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            self._fill()
+            while self._pending:
+                pending = self._pending.popleft()
+                # The consumed file no longer counts in the budget of the files loaded ahead
+                self._fill()
+                yield pending.future.result()
+        finally:
+            self.close()
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def close(self) -> None:
+        """Cancel the pending loads and release the threads."""
+        if self._closed:
+            return
+        self._closed = True
+        for pending in self._pending:
+            pending.future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        """Context management enter method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context management exit method."""
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"<Prefetcher files={len(self.paths)} consumed={self._next_index - len(self._pending)} "
+            f"pending={len(self._pending)} depth={self.depth}>"
+        )
@@ -1,5 +1,15 @@
+import io
 from pathlib import Path
-from typing import Any, Optional, Union, Callable, List
+from typing import Any, BinaryIO, Optional, Union, Callable, List, TYPE_CHECKING
+
+from ..utils.typing import Literal
+from .codecs import (
+    CODECS, STREAMABLE_EXTENSIONS, open_compressed, open_file, registered_extension, split_compression
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from .async_saver import AsyncSaver
 
 __all__ = ["save", "register_saver"]
 
@@ -7,18 +17,30 @@ __all__ = ["save", "register_saver"]
 SAVERS = {}
 EXTENSION_MAPPING = {}
 
-def save(data: Any, file_path: Union[str, Path], saver: Optional[str] = None, **kwargs):
+def save(
+    data: Any,
+    file_path: Union[str, Path],
+    saver: Optional[str] = None,
+    background: Union[bool, "AsyncSaver"] = False,
+    shards: Optional[int] = None,
+    max_shard_bytes: Optional[int] = None,
+    **kwargs,
+) -> Optional["Future"]:
     """
     Save data to a file using the appropriate saver.
 
     This function saves data to various file formats by automatically determining the appropriate saver based on the file extension. You can also specify the saver explicitly if desired.
 
+    If the file has a gzip, bzip2, xz, zstd or lz4 extension after the extension of the
+    format (e.g. "data.parquet.zst"), the data is compressed on the fly while it is saved.
+
     Supported Savers
     ----------------
-    - "pickle": For .pkl files.
+    - "pickle": For .pkl files. Use `out_of_band=True` to store large arrays after the pickle stream, memory-mapped on load.
     - "joblib": For .joblib files.
     - "pandas": For .csv, .parquet, .xlsx, .xls, .feather files.
-    - "json": For .json files.
+    - "json": For .json files, serialized with orjson or ujson when installed.
+    - "jsonl": For .jsonl, .ndjson files, saving one record per line. Use `append=True` to add records to an existing file.
     - "str": For .txt, .html, .log, .md, .rst files.
     - "hdf5": For .h5, .hdf5, .hdf files.
     - "numpy": For .npz, .npy files.
@@ -38,12 +60,26 @@ def save(data: Any, file_path: Union[str, Path], saver: Optional[str] = None, **
         The path to the file where the data should be saved. The file extension will be used to determine the appropriate saver if not specified.
     saver : Optional[str], default=None
         The saver type to use. If not provided, it will be inferred from the file extension.
+    background : Union[bool, AsyncSaver], default=False
+        If True, queue the write in the global `dmf.io.AsyncSaver` and return
+        immediately. An `AsyncSaver` instance can be passed to use a dedicated one.
+        The data must not be modified until the write has finished.
+    shards : Optional[int], default=None
+        If set, `file_path` is a directory where a DataFrame or an array is saved
+        split along its first axis into this number of shards, written in parallel,
+        with a manifest to load them back. See `dmf.io.shards.save_sharded` for the
+        options `shard_format`, `workers` and `checksum`.
+    max_shard_bytes : Optional[int], default=None
+        Like `shards`, choosing the number of shards so that each one uses at most
+        this memory.
     kwargs : dict
         Additional keyword arguments to pass to the saver function.
 
     Returns
     -------
-    None
+    Optional[Future]
+        A future that completes when the file has been written if `background`
+        is set, otherwise None.
 
     Raises
     ------
@@ -83,9 +119,39 @@ def save(data: Any, file_path: Union[str, Path], saver: Optional[str] = None, **
 
         arr = np.array([1, 2, 3])
         save(arr, "data.npz")
+
+    Saving a checkpoint without waiting for the write:
+
+    .. code-block:: python
+
+        future = save(state, "checkpoint.pkl", background=True)
+
+    Saving a large DataFrame as Parquet shards of at most 256 MiB:
+
+    .. code-block:: python
+
+        save(df, "dataset/", max_shard_bytes=256 * 1024**2)
+        df = load("dataset/")
     """
+    if background is True:
+        from .async_saver import get_default_saver
+        background = get_default_saver()
+    if background is not None and background is not False:
+        return background.save(data, file_path, saver=saver, shards=shards,
+                               max_shard_bytes=max_shard_bytes, **kwargs)
+
+    if shards is not None or max_shard_bytes is not None:
+        from .shards import save_sharded
+        save_sharded(data, file_path, shards=shards, max_shard_bytes=max_shard_bytes, **kwargs)
+        return None
+
     file_path = Path(file_path)
-    ext = file_path.suffix.lstrip(".").lower()
+    ext = registered_extension(file_path, EXTENSION_MAPPING)
+    inner_path, compression = file_path, None
+    if ext in CODECS and ext not in EXTENSION_MAPPING:
+        inner_path, compression = split_compression(file_path)
+        ext = registered_extension(inner_path, EXTENSION_MAPPING)
+
     if saver and saver not in SAVERS:
         raise ValueError(f"Saver '{saver}' is not supported. "
                          f"Use one of {list(SAVERS.keys())}.")
@@ -99,9 +165,24 @@ def save(data: Any, file_path: Union[str, Path], saver: Optional[str] = None, **
             )
     
     saver_func = SAVERS[saver]
+    if compression:
+        return _save_compressed(saver_func, data, file_path, compression, ext, **kwargs)
     return saver_func(data, file_path, **kwargs)
 
 
+def _save_compressed(saver_func: Callable, data: Any, file_path: Path, compression: str, ext: str, **kwargs):
+    """Save data streaming the output of the saver of the inner file through a codec."""
+    with open_compressed(file_path, "wb", compression=compression) as stream:
+        if ext in STREAMABLE_EXTENSIONS:
+            return saver_func(data, stream, **kwargs)
+        # Formats that need random access are written to memory and then compressed
+        buffer = io.BytesIO()
+        buffer.name = stream.name
+        result = saver_func(data, buffer, **kwargs)
+        stream.write(buffer.getbuffer())
+        return result
+
+
 def register_saver(saver_name: str, extensions: List[str]):
     """
     Decorator to register a custom saver.
@@ -129,10 +210,40 @@ def register_saver(saver_name: str, extensions: List[str]):
 
 
 @register_saver("pickle", ["pkl", "pickle"])
-def save_pickle(data: Any, file_path: Path, **kwargs):
-    """Save data using the pickle saver."""
+def save_pickle(data: Any, file_path: Path, out_of_band: bool = False, min_buffer_size: int = 65536, **kwargs):
+    """
+    Save data using the pickle saver.
+
+    Parameters
+    ----------
+    data : Any
+        The data to save.
+    file_path : Path
+        The path to the pickle file.
+    out_of_band : bool, optional
+        If True, pickle with protocol 5 and write the large contiguous buffers,
+        such as the data of NumPy arrays, after the pickle stream without copying
+        them, aligned to 64 bytes. They are memory-mapped when the file is loaded.
+        Only supported for uncompressed files. Before Python 3.8, a regular
+        protocol 4 pickle is written instead. Default is False.
+    min_buffer_size : int, optional
+        The minimum size in bytes of the buffers stored out-of-band. Smaller
+        buffers are kept in the pickle stream. Default is 65536.
+    kwargs : dict
+        Additional keyword arguments to pass to `pickle.dump`.
+    """
     import pickle
-    with open(file_path, "wb") as file:
+
+    if out_of_band:
+        from .oob_pickle import dump_out_of_band
+
+        if not isinstance(file_path, (str, Path)):
+            raise ValueError("out_of_band is only supported for uncompressed pickle files.")
+        with open(file_path, "wb") as file:
+            dump_out_of_band(data, file, min_buffer_size=min_buffer_size, **kwargs)
+        return
+
+    with open_file(file_path, "wb") as file:
         pickle.dump(data, file, **kwargs)
 
 @register_saver("joblib", ["joblib"])
@@ -146,50 +257,238 @@ def save_joblib(data: Any, file_path: Path, **kwargs):
     joblib.dump(data, file_path, **kwargs)
 
 @register_saver("hdf5", ["h5", "hdf5", "hdf"])
-def save_hdf5(data: Any, file_path: Path, dataset_name: str = "dataset", **kwargs):
+def save_hdf5(
+    data: Any,
+    file_path: Path,
+    dataset_name: str = "dataset",
+    access: Optional[Literal["row", "column", "tile"]] = "row",
+    compression: Union[bool, str, None] = None,
+    compression_opts: Any = None,
+    shuffle: bool = True,
+    chunk_bytes: int = 1024**2,
+    **kwargs,
+):
     """
     Save data using the HDF5 saver.
 
+    Numeric arrays larger than `chunk_bytes` are stored in chunks of about
+    `chunk_bytes` bytes, shaped for the way they will be read, so that reading
+    a slice only reads the chunks it overlaps. Nested dictionaries are saved as
+    groups.
+
     Parameters
     ----------
     data : Any
-        The data to save. Can be a dictionary of arrays or a single array.
+        The data to save. Can be a dictionary of arrays, possibly nested, or a single array.
     file_path : Path
         The path to the HDF5 file.
     dataset_name : str, optional
         The name of the dataset if `data` is not a dictionary. Default is "dataset".
+    access : Optional[Literal["row", "column", "tile"]], optional
+        How the arrays will be read, to choose their chunk shape:
+        "row" for slices along the first axis (e.g. trials), "column" for slices
+        along the last axis (e.g. one feature of all the samples), "tile" for
+        blocks along all the axes (e.g. image crops). If None, the arrays are
+        stored contiguously unless they are compressed. Default is "row".
+    compression : Union[bool, str, None], optional
+        The compression filter: "gzip" (portable, slower), "lzf" (fast, only
+        readable with h5py) or "blosc" (fast and multi-threaded, requires the
+        hdf5plugin package). If True, "blosc" is used when hdf5plugin is
+        installed, and "gzip" otherwise. Default is None (no compression).
+    compression_opts : Any, optional
+        The options of the compression filter, e.g. the gzip level (0-9) or
+        the blosc level (0-9). Default is None (the default of the filter).
+    shuffle : bool, optional
+        Whether to shuffle the bytes of the values before compressing them,
+        which usually improves the compression of numeric data. Default is True.
+    chunk_bytes : int, optional
+        The target size of the chunks, in bytes. Default is 1 MiB.
     kwargs : dict
-        Additional keyword arguments to pass to the h5py dataset creation.
-    
+        Additional keyword arguments to pass to the h5py dataset creation, such
+        as `chunks` to set the chunk shape explicitly.
+
     Raises
     ------
     ValueError
-        If the data type is not supported.
+        If the data type or the access pattern is not supported.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import save
+
+        # Read trial by trial
+        save({"eeg": eeg, "meta": {"onsets": onsets}}, "recording.h5", compression=True)
+
+        # Read one feature for all the samples
+        save(features, "features.h5", access="column", compression="lzf")
     """
     try:
         import h5py
     except ImportError:
         raise ImportError("h5py package is required for HDF5 saving. "
                           "Install it using `pip install h5py`.")
-    
+    if access not in (None, "row", "column", "tile"):
+        raise ValueError(f"Access pattern '{access}' is not supported. "
+                         "Use 'row', 'column', 'tile' or None.")
+
+    filters = _hdf5_filters(compression, compression_opts, shuffle)
     with h5py.File(file_path, "w") as file:
         if isinstance(data, dict):
-            for key, value in data.items():
-                file.create_dataset(key, data=value, **kwargs)
+            _write_hdf5_group(file, data, access, filters, chunk_bytes, **kwargs)
+        else:
+            _write_hdf5_dataset(file, dataset_name, data, access, filters, chunk_bytes, **kwargs)
+
+
+def _write_hdf5_group(group, data: dict, access, filters: dict, chunk_bytes: int, **kwargs):
+    """Write a dictionary into an HDF5 group, creating subgroups for nested dictionaries."""
+    for key, value in data.items():
+        if isinstance(value, dict):
+            _write_hdf5_group(group.create_group(str(key)), value, access, filters, chunk_bytes, **kwargs)
         else:
-            file.create_dataset(dataset_name, data=data, **kwargs)
+            _write_hdf5_dataset(group, str(key), value, access, filters, chunk_bytes, **kwargs)
+
+
+def _write_hdf5_dataset(group, name: str, value: Any, access, filters: dict, chunk_bytes: int, **kwargs):
+    """Write a value as a dataset, chunked and compressed if it is a numeric array."""
+    import numpy as np
+
+    array = np.asarray(value) if not isinstance(value, (str, bytes)) else None
+    if array is None or array.dtype.kind not in "biufc" or array.ndim == 0 or array.size == 0:
+        group.create_dataset(name, data=value, **kwargs)
+        return
+
+    options = dict(filters)
+    if "chunks" not in kwargs:
+        chunked = bool(filters) or (access is not None and array.nbytes > chunk_bytes)
+        if chunked:
+            options["chunks"] = _hdf5_chunks(array.shape, array.dtype.itemsize, access or "row", chunk_bytes)
+    group.create_dataset(name, data=array, **options, **kwargs)
+
+
+def _hdf5_chunks(shape: tuple, itemsize: int, access: str, chunk_bytes: int) -> tuple:
+    """Return a chunk shape of about `chunk_bytes` bytes suited to an access pattern."""
+    chunks = list(shape)
+
+    def nbytes(chunks: List[int]) -> int:
+        size = itemsize
+        for length in chunks:
+            size *= length
+        return size
+
+    if access == "tile":
+        # Halve the longest axis until the chunk fits, giving blocks of similar lengths
+        while nbytes(chunks) > chunk_bytes and max(chunks) > 1:
+            axis = chunks.index(max(chunks))
+            chunks[axis] = -(-chunks[axis] // 2)
+        return tuple(chunks)
+
+    # Rows keep the trailing axes whole and split the first ones, columns the opposite
+    order = range(len(shape)) if access == "row" else reversed(range(len(shape)))
+    for axis in order:
+        others = nbytes(chunks) // chunks[axis]
+        if others * chunks[axis] <= chunk_bytes:
+            break
+        chunks[axis] = max(1, chunk_bytes // others)
+    return tuple(chunks)
+
+
+def _hdf5_filters(compression: Union[bool, str, None], compression_opts: Any, shuffle: bool) -> dict:
+    """Return the keyword arguments of `create_dataset` for a compression filter."""
+    if compression is True:
+        try:
+            import hdf5plugin  # noqa: F401
+            compression = "blosc"
+        except ImportError:
+            compression = "gzip"
+    if not compression:
+        return {}
+
+    if compression == "blosc":
+        try:
+            import hdf5plugin
+        except ImportError:
+            raise ImportError("hdf5plugin package is required for blosc compression. "
+                              "Install it using `pip install hdf5plugin`.")
+        blosc_shuffle = hdf5plugin.Blosc.SHUFFLE if shuffle else hdf5plugin.Blosc.NOSHUFFLE
+        level = 5 if compression_opts is None else compression_opts
+        return dict(hdf5plugin.Blosc(cname="lz4", clevel=level, shuffle=blosc_shuffle))
+
+    if compression not in ("gzip", "lzf"):
+        raise ValueError(f"Compression '{compression}' is not supported. Use 'gzip', 'lzf' or 'blosc'.")
+    filters = {"compression": compression, "shuffle": shuffle}
+    if compression_opts is not None:
+        filters["compression_opts"] = compression_opts
+    return filters
+
 
 @register_saver("json", ["json"])
-def save_json(data: Any, file_path: Path, **kwargs):
-    """Save data using the json saver."""
-    import json
-    with open(file_path, "w") as file:
-        json.dump(data, file, **kwargs)
+def save_json(data: Any, file_path: Path, engine: Optional[str] = None, **kwargs):
+    """
+    Save data using the json saver.
+
+    NumPy arrays and scalars are serialized as lists and numbers.
+
+    Parameters
+    ----------
+    data : Any
+        The data to save.
+    file_path : Path
+        The path to the JSON file.
+    engine : Optional[str], optional
+        The JSON engine: "orjson", "ujson" or "json" (the standard library). If
+        None, the fastest installed engine is used, unless options of the
+        standard library such as `ensure_ascii` are given, the indent is not 2,
+        or the data has integers beyond 64 bits, NaN or infinite values.
+        Default is None.
+    kwargs : dict
+        Additional keyword arguments, such as `indent` and `sort_keys`, or the
+        options of `json.dumps` for the standard library engine.
+    """
+    from .json_io import resolve_json_engine
+
+    json_engine = resolve_json_engine(engine, kwargs)
+    content = json_engine.dumps(data, **kwargs)
+    with open_file(file_path, "wb") as file:
+        file.write(content)
+
+
+@register_saver("jsonl", ["jsonl", "ndjson"])
+def save_jsonl(data: Any, file_path: Path, engine: Optional[str] = None, append: bool = False, **kwargs):
+    """
+    Save records using the JSON Lines saver, one record per line.
+
+    Parameters
+    ----------
+    data : Any
+        An iterable of records, or a pandas DataFrame, saved one row per line.
+    file_path : Path
+        The path to the .jsonl or .ndjson file.
+    engine : Optional[str], optional
+        The JSON engine, as in the json saver. Default is None.
+    append : bool, optional
+        If True, add the records at the end of an existing file instead of
+        overwriting it. Only supported for uncompressed files. Default is False.
+    kwargs : dict
+        Additional keyword arguments to pass to `json.dumps` for the standard library engine.
+    """
+    from .json_io import resolve_json_engine
+
+    if append and not isinstance(file_path, (str, Path)):
+        raise ValueError("append is only supported for uncompressed JSON Lines files.")
+    if hasattr(data, "to_dict") and hasattr(data, "columns"):
+        data = data.to_dict(orient="records")
+
+    json_engine = resolve_json_engine(engine, kwargs)
+    with open_file(file_path, "ab" if append else "wb") as file:
+        for record in data:
+            file.write(json_engine.dumps(record, **kwargs) + b"\n")
 
 @register_saver("str", ["txt", "html", "log", "md", "rst"])
 def save_str(data, file_path: Path, **kwargs):
     """Save data using the txt saver."""
-    with open(file_path, "w") as file:
+    with open_file(file_path, "w") as file:
         file.write(str(data), **kwargs)
 
 @register_saver("numpy", ["npz", "npy"])
@@ -209,7 +508,7 @@ def save_numpy(data: Any, file_path: Path, **kwargs):
     if not isinstance(data, np.ndarray):
         data = np.array(data)
 
-    ext = file_path.suffix.lstrip(".").lower()
+    ext = registered_extension(file_path, EXTENSION_MAPPING)
     if ext == "npz":
         if not isinstance(data, dict):
             raise ValueError("NPZ saver expects data to be a dictionary of arrays.")
@@ -227,9 +526,13 @@ def save_pandas(data: Any, file_path: Path, **kwargs):
 
     data = pd.DataFrame(data)
 
-    ext = file_path.suffix.lstrip(".").lower()
+    ext = registered_extension(file_path, EXTENSION_MAPPING)
     if ext == "csv":
-        data.to_csv(file_path, **kwargs)
+        if isinstance(file_path, Path):
+            data.to_csv(file_path, **kwargs)
+        else:
+            with open_file(file_path, "w", newline="") as file:
+                data.to_csv(file, **kwargs)
     elif ext == "parquet":
         data.to_parquet(file_path, **kwargs)
     elif ext == "xlsx" or ext == "xls":
@@ -270,7 +573,7 @@ def save_yaml(data: Any, file_path: Path, **kwargs):
     except ImportError:
         raise ImportError("PyYAML is required to save .yaml files. "
                           "Install it using `pip install pyyaml`.")
-    with open(file_path, "w") as file:
+    with open_file(file_path, "w") as file:
         yaml.safe_dump(data, file, **kwargs)
 
 @register_saver("ini", ["ini", "cfg"])
@@ -282,7 +585,7 @@ def save_ini(data: Any, file_path: Path, **kwargs):
     config = configparser.ConfigParser()
     for section, params in data.items():
         config[section] = params
-    with open(file_path, "w") as file:
+    with open_file(file_path, "w") as file:
         config.write(file)
 
 @register_saver("matlab", ["mat"])
@@ -312,4 +615,6 @@ def save_audio(data: Any, file_path: Path, **kwargs):
 def save_video(data: Any, file_path: Path, **kwargs):
     """Save data using the video saver."""
     from ..video.video_writer import write_video
+    if not isinstance(file_path, Path):
+        raise ValueError("Video files can only be saved to uncompressed files.")
     write_video(file_path=file_path, frames=data, **kwargs)
\ No newline at end of file
@@ -0,0 +1,286 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+from .codecs import registered_extension, split_compression
+from .load import EXTENSION_MAPPING, SHARDS_MANIFEST
+
+__all__ = ["save_sharded", "load_sharded", "MANIFEST_NAME"]
+
+# The double extension of the manifest is registered as the "shards" loader
+MANIFEST_NAME = SHARDS_MANIFEST
+MANIFEST_FORMAT = "dmf-shards"
+
+# Default format of the shards for each kind of data
+DEFAULT_EXTENSIONS = {"dataframe": "parquet", "array": "npy"}
+
+# Formats that store the index of a DataFrame as ordinary columns
+INDEX_AS_COLUMNS = {"csv", "xlsx", "xls"}
+
+
+def save_sharded(
+    data: Any,
+    directory: Union[str, Path],
+    shards: Optional[int] = None,
+    max_shard_bytes: Optional[int] = None,
+    shard_format: Optional[str] = None,
+    workers: Optional[int] = None,
+    checksum: bool = True,
+    **kwargs,
+) -> Path:
+    """
+    Save a DataFrame or an array as shards split along the first axis, written in parallel.
+
+    The shards are written concurrently with `save` in the given format, and a
+    manifest listing the shards, their row ranges, the schema of the data and
+    the checksums of the files is written last. Loading the directory or the
+    manifest with `load` reassembles the data.
+
+    Parameters
+    ----------
+    data : Any
+        A pandas DataFrame or a NumPy array.
+    directory : Union[str, Path]
+        The directory where the shards and the manifest are written. It is created if needed.
+    shards : Optional[int], default=None
+        The number of shards.
+    max_shard_bytes : Optional[int], default=None
+        The maximum size in memory of each shard, used to choose the number of shards.
+    shard_format : Optional[str], default=None
+        The extension of the shards, e.g. "parquet", "feather", "csv" or "npy".
+        Default is "parquet" for DataFrames and "npy" for arrays.
+    workers : Optional[int], default=None
+        The number of threads writing the shards. If None, the default of `ThreadPoolExecutor` is used.
+    checksum : bool, default=True
+        Whether to store the SHA-256 checksum of each shard in the manifest.
+    kwargs : dict
+        Additional keyword arguments to pass to the saver of the shards.
+
+    Returns
+    -------
+    Path
+        The path of the manifest.
+
+    Raises
+    ------
+    ValueError
+        If the data can not be sharded or the number of shards is not valid.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import load, save
+
+        save(df, "trials/", max_shard_bytes=512 * 1024**2)
+        df = load("trials/")
+    """
+    from .cache import _estimate_size
+    from .save import save
+
+    if (shards is None) == (max_shard_bytes is None):
+        raise ValueError("Specify either shards or max_shard_bytes.")
+    kind = _get_kind(data)
+    if kind is None:
+        raise ValueError(f"Data of type {type(data).__name__} can not be sharded. "
+                         "Use a pandas DataFrame or a NumPy array.")
+
+    n_rows = len(data)
+    if max_shard_bytes is not None:
+        row_bytes = _estimate_size(data) / max(n_rows, 1)
+        rows_per_shard = max(1, int(max_shard_bytes // max(row_bytes, 1)))
+        shards = max(1, -(-n_rows // rows_per_shard))
+    if shards < 1:
+        raise ValueError("shards must be a positive integer.")
+    shards = min(shards, max(n_rows, 1))
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    # A previous manifest is removed before its shards are overwritten, so it
+    # never lists shards of two different saves
+    manifest_path = directory / MANIFEST_NAME
+    previous = _stale_candidates(directory)
+    if manifest_path.exists():
+        manifest_path.unlink()
+    ext = (shard_format or DEFAULT_EXTENSIONS[kind]).lstrip(".")
+    bounds = [n_rows * i // shards for i in range(shards + 1)]
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+    names = [f"part-{i:05d}.{ext}" for i in range(shards)]
+    schema = _get_schema(data, kind)
+    if kind == "dataframe" and _index_as_columns(Path(names[0])):
+        # A default index is rebuilt when loading, so it is not written
+        kwargs.setdefault("index", schema["index"] != "range")
+
+    def write_shard(name: str, start: int, stop: int) -> Dict[str, Any]:
+        shard = data.iloc[start:stop] if kind == "dataframe" else data[start:stop]
+        shard_path = directory / name
+        save(shard, shard_path, **kwargs)
+        entry = {"path": name, "start": start, "stop": stop, "bytes": shard_path.stat().st_size}
+        if checksum:
+            entry["sha256"] = _file_checksum(shard_path)
+        return entry
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        entries = list(pool.map(write_shard, names, *zip(*ranges)))
+
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": 1,
+        "kind": kind,
+        "rows": n_rows,
+        "schema": schema,
+        "shards": entries,
+    }
+    # The manifest is written last and atomically, so an interrupted save leaves no manifest
+    tmp_path = directory / f".{MANIFEST_NAME}.{os.getpid()}.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, manifest_path)
+
+    for path in previous - {directory / name for name in names}:
+        path.unlink()
+    return manifest_path
+
+
+def load_sharded(
+    manifest_path: Union[str, Path],
+    stream: bool = False,
+    workers: Optional[int] = None,
+    verify: bool = False,
+    **kwargs,
+) -> Any:
+    """
+    Load the data saved by `save_sharded` from its manifest.
+
+    Parameters
+    ----------
+    manifest_path : Union[str, Path]
+        The path of the manifest.
+    stream : bool, default=False
+        If True, return an iterator over the shards, in order, loading the next
+        shard in the background. Otherwise, load the shards in parallel and
+        reassemble the data.
+    workers : Optional[int], default=None
+        The number of threads loading the shards.
+    verify : bool, default=False
+        Whether to check the checksums of the shards before loading them.
+    kwargs : dict
+        Additional keyword arguments to pass to the loader of the shards, such
+        as `columns` for Parquet shards.
+
+    Returns
+    -------
+    Any
+        The reassembled DataFrame or array, or an iterator over the shards if `stream` is True.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a manifest of shards, or a checksum does not match.
+    """
+    from .load_many import load_many
+    from .prefetch import Prefetcher
+
+    manifest_path = Path(manifest_path)
+    manifest = json.loads(manifest_path.read_text())
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"'{manifest_path}' is not a manifest of shards.")
+
+    paths = [manifest_path.parent / entry["path"] for entry in manifest["shards"]]
+    if verify:
+        for path, entry in zip(paths, manifest["shards"]):
+            if "sha256" in entry and _file_checksum(path) != entry["sha256"]:
+                raise ValueError(f"Checksum of shard '{path}' does not match the manifest.")
+
+    schema = manifest["schema"]
+    if manifest["kind"] == "dataframe" and schema.get("index") != "range" and paths \
+            and _index_as_columns(paths[0]):
+        kwargs.setdefault("index_col", list(range(schema.get("index_levels", 1))))
+
+    if stream:
+        return iter(Prefetcher(paths, depth=workers or 2, workers=workers, **kwargs))
+
+    if manifest["kind"] == "array" and all(path.suffix == ".npy" for path in paths):
+        # Map the shards so that they are only read once, when copied into the output
+        kwargs.setdefault("mmap", True)
+    data = _assemble(load_many(paths, workers=workers, **kwargs), manifest)
+    if manifest["kind"] == "dataframe" and "columns" not in kwargs and "usecols" not in kwargs:
+        columns = [str(column) for column in data.columns]
+        if columns != schema["columns"]:
+            raise ValueError(f"Columns of the shards {columns} do not match "
+                             f"the columns of the manifest {schema['columns']}.")
+    return data
+
+
+def _assemble(results: List[Any], manifest: Dict[str, Any]) -> Any:
+    """Concatenate the loaded shards into a single DataFrame or array."""
+    import numpy as np
+
+    if manifest["kind"] == "dataframe":
+        import pandas as pd
+        # A default index is rebuilt, as formats such as CSV do not store it
+        ignore_index = manifest["schema"].get("index") == "range"
+        if len(results) == 1 and not ignore_index:
+            return results[0]
+        return pd.concat(results, ignore_index=ignore_index)
+
+    schema = manifest["schema"]
+    data = np.empty((manifest["rows"],) + tuple(schema["shape"][1:]), dtype=np.dtype(schema["dtype"]))
+    for entry, result in zip(manifest["shards"], results):
+        data[entry["start"]:entry["stop"]] = result
+    return data
+
+
+def _get_kind(data: Any) -> Optional[str]:
+    """Return the kind of data that can be sharded, or None."""
+    module = type(data).__module__.split(".")[0]
+    if module == "pandas" and type(data).__name__ == "DataFrame":
+        return "dataframe"
+    if module == "numpy" and getattr(data, "ndim", 0) >= 1:
+        return "array"
+    return None
+
+
+def _get_schema(data: Any, kind: str) -> Dict[str, Any]:
+    """Describe the columns and types of a DataFrame, or the shape and type of an array."""
+    if kind == "dataframe":
+        import pandas as pd
+
+        index = data.index
+        is_range = (isinstance(index, pd.RangeIndex) and index.start == 0
+                    and index.step == 1 and index.name is None)
+        return {"columns": [str(column) for column in data.columns],
+                "dtypes": {str(column): str(dtype) for column, dtype in data.dtypes.items()},
+                "index": "range" if is_range else str(index.dtype),
+                "index_levels": index.nlevels}
+    return {"shape": list(data.shape), "dtype": data.dtype.str}
+
+
+def _index_as_columns(shard_path: Path) -> bool:
+    """Return whether the format of a shard stores the index of a DataFrame as columns."""
+    inner_path, _ = split_compression(shard_path)
+    return registered_extension(inner_path, EXTENSION_MAPPING) in INDEX_AS_COLUMNS
+
+
+def _stale_candidates(directory: Path) -> Set[Path]:
+    """Return the shards of a previous save in a directory, listed in its manifest or named like shards."""
+    paths = set(directory.glob("part-[0-9][0-9][0-9][0-9][0-9].*"))
+    manifest_path = directory / MANIFEST_NAME
+    if manifest_path.exists():
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            paths.update(directory / entry["path"] for entry in manifest.get("shards", []))
+        except (ValueError, KeyError, TypeError):
+            pass
+    return {path for path in paths if path.is_file()}
+
+
+def _file_checksum(file_path: Path, block_size: int = 1024**2) -> str:
+    """Return the SHA-256 checksum of a file."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
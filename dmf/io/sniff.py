@@ -0,0 +1,136 @@
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+__all__ = ["sniff_format", "sniff_header"]
+
+# Number of bytes read from the start of the file to detect its format
+HEADER_SIZE = 520
+
+# Magic bytes of each format: (offset, signature, extension), checked in order
+SIGNATURES = [
+    (0, b"MATLAB 5.0 MAT-file", "mat"),
+    (0, b"MATLAB 7.3 MAT-file", "mat"),  # HDF5 file with a 512 bytes MATLAB header
+    (0, b"\x89HDF\r\n\x1a\n", "h5"),
+    (512, b"\x89HDF\r\n\x1a\n", "h5"),  # HDF5 file with a user block
+    (0, b"PAR1", "parquet"),
+    (0, b"ARROW1", "feather"),
+    (0, b"\x93NUMPY", "npy"),
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpg"),
+    (0, b"GIF87a", "gif"),
+    (0, b"GIF89a", "gif"),
+    (0, b"II*\x00", "tiff"),
+    (0, b"MM\x00*", "tiff"),
+    (0, b"fLaC", "flac"),
+    (0, b"OggS", "ogg"),
+    (0, b"ID3", "mp3"),
+    (0, b"\x1a\x45\xdf\xa3", "mkv"),
+    (0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "xls"),
+    (0, b"\x1f\x8b", "gz"),
+    (0, b"\x28\xb5\x2f\xfd", "zst"),
+    (0, b"\x04\x22\x4d\x18", "lz4"),
+    (0, b"\xfd7zXZ\x00", "xz"),
+    (0, b"BZh", "bz2"),
+    (0, b"7z\xbc\xaf\x27\x1c", "7z"),
+    (257, b"ustar", "tar"),
+]
+
+# Container formats of the RIFF and ISO media families, identified by a second tag
+RIFF_FORMATS = {b"WAVE": "wav", b"WEBP": "webp", b"AVI ": "avi"}
+FTYP_FORMATS = {b"qt  ": "mov"}
+
+# Cache of detected formats, keyed by the inode and modification of the file
+SNIFF_CACHE: Dict[Tuple, Optional[str]] = {}
+MAX_CACHE_ENTRIES = 100000
+
+
+def sniff_format(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Detect the format of a file from its first bytes.
+
+    Only the first few hundred bytes of the file are read, and the result is
+    cached per inode, so detecting the format of many files is cheap and a file
+    is read again only after it is modified.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the file.
+
+    Returns
+    -------
+    Optional[str]
+        The usual extension of the detected format (without leading dot), for
+        example "parquet", "h5", "npy", "npz", "png", "pkl" or "gz", or None if
+        the format has no known signature, as happens with text files.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import sniff_format
+
+        sniff_format("shards/part-0000")
+        # 'parquet'
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    # Some file systems do not provide inode numbers, fall back to the path
+    key = (stat.st_dev, stat.st_ino or str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+    if key in SNIFF_CACHE:
+        return SNIFF_CACHE[key]
+
+    with open(file_path, "rb") as file:
+        header = file.read(HEADER_SIZE)
+    file_format = sniff_header(header)
+
+    if len(SNIFF_CACHE) >= MAX_CACHE_ENTRIES:
+        SNIFF_CACHE.clear()
+    SNIFF_CACHE[key] = file_format
+    return file_format
+
+
+def sniff_header(header: bytes) -> Optional[str]:
+    """
+    Detect a format from the first bytes of a file or stream.
+
+    Parameters
+    ----------
+    header : bytes
+        The first bytes of the data, at least `HEADER_SIZE` when available.
+
+    Returns
+    -------
+    Optional[str]
+        The usual extension of the detected format, or None if no signature matches.
+    """
+    for offset, signature, file_format in SIGNATURES:
+        if header[offset:offset + len(signature)] == signature:
+            return file_format
+
+    if header[:4] == b"RIFF":
+        return RIFF_FORMATS.get(header[8:12])
+    if header[4:8] == b"ftyp":
+        return FTYP_FORMATS.get(header[8:12], "mp4")
+    if header[:2] == b"BM" and header[6:10] == b"\x00\x00\x00\x00":
+        return "bmp"
+    if header[:4] == b"PK\x03\x04":
+        return _match_zip_member(header)
+    if len(header) >= 2 and header[0] == 0x80 and 2 <= header[1] <= 5:
+        return "pkl"  # Pickle protocol 2 to 5 header
+    return None
+
+
+def _match_zip_member(header: bytes) -> str:
+    """Identify zip-based formats from the name of the first member of the archive."""
+    name_length = struct.unpack("<H", header[26:28])[0]
+    name = header[30:30 + name_length].decode("utf-8", errors="replace")
+
+    if name.endswith(".npy"):
+        return "npz"
+    if name == "[Content_Types].xml" or name.startswith("xl/"):
+        return "xlsx"
+    if name.endswith("/data.pkl") or name.endswith("/version"):
+        return "pt"
+    return "zip"
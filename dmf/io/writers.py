@@ -0,0 +1,372 @@
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..utils.decorators import register
+
+__all__ = ["open_writer", "Writer", "ParquetWriter", "CSVWriter", "HDF5Writer"]
+
+WRITERS = {}
+
+
+def open_writer(
+    file_path: Union[str, Path],
+    writer: Optional[str] = None,
+    flush_rows: int = 10000,
+    flush_bytes: int = 64 * 1024**2,
+    flush_interval: Optional[float] = None,
+    append: bool = False,
+    **kwargs,
+) -> "Writer":
+    """
+    Open a file to append data to it incrementally.
+
+    The rows given to the writer are buffered in memory and written in batches,
+    so appending a row costs the same regardless of the size of the file,
+    unlike saving the whole data again with `save`. Each batch is written as a
+    row group of a Parquet file, as rows of a CSV file (with the header written
+    once), or by growing resizable, chunked HDF5 datasets along the first axis.
+
+    Supported Formats
+    -----------------
+    - "parquet": For .parquet files.
+    - "csv": For .csv and .tsv files.
+    - "hdf5": For .h5, .hdf5 and .hdf files.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path]
+        The path to the file to write.
+    writer : Optional[str], default=None
+        The format of the file. If not provided, it will be inferred from the file extension.
+    flush_rows : int, default=10000
+        Write the buffered rows when there are at least this many. It is also
+        the size of the row groups of Parquet files.
+    flush_bytes : int, default=64 MiB
+        Write the buffered rows when their estimated memory reaches this size.
+    flush_interval : Optional[float], default=None
+        Write the buffered rows when they have been waiting for more than this
+        number of seconds. It is checked when new rows are written.
+    append : bool, default=False
+        If True, add the rows to an existing CSV or HDF5 file instead of overwriting it.
+        Parquet files can not be appended to once closed.
+    kwargs : dict
+        Additional keyword arguments to pass to the underlying writer:
+        `pyarrow.parquet.ParquetWriter` (e.g. `compression`), `DataFrame.to_csv`,
+        or `h5py.Group.create_dataset` (e.g. `compression`).
+
+    Returns
+    -------
+    Writer
+        The writer, to be used as a context manager or closed with `close()`.
+
+    Raises
+    ------
+    ValueError
+        If the file extension or the specified format is not supported.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from dmf.io import open_writer
+
+        with open_writer("results.parquet", flush_rows=1000) as writer:
+            for trial in range(n_trials):
+                writer.write_row({"trial": trial, "rt": rt, "correct": correct})
+
+        with open_writer("recording.h5") as writer:
+            for epoch in epochs:
+                writer.write({"eeg": epoch.data, "onset": epoch.onsets})
+    """
+    file_path = Path(file_path)
+    if not writer:
+        writer = file_path.suffix.lstrip(".").lower()
+    writer_class = WRITERS.get(writer)
+    if not writer_class:
+        raise ValueError(
+            f"Format '{writer}' is not supported for incremental writing. "
+            f"Use one of {list(WRITERS.keys())}."
+        )
+    return writer_class(file_path, flush_rows=flush_rows, flush_bytes=flush_bytes,
+                        flush_interval=flush_interval, append=append, **kwargs)
+
+
+class Writer:
+    """
+    Base class of the incremental writers, buffering rows and writing them in batches.
+
+    Subclasses implement `_to_batch` to normalize the written data, `_concat`
+    to merge the buffered batches, `_write_batch` to write them and `_close`.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        flush_rows: int = 10000,
+        flush_bytes: int = 64 * 1024**2,
+        flush_interval: Optional[float] = None,
+        append: bool = False,
+        **kwargs,
+    ):
+        self.file_path = Path(file_path)
+        self.flush_rows = flush_rows
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.append = append
+        self.kwargs = kwargs
+        self.rows_written = 0
+        self._buffer: List[Any] = []
+        self._buffered_rows = 0
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer has been closed."""
+        return self._closed
+
+    def write(self, data: Any) -> None:
+        """
+        Append a batch of rows.
+
+        Parameters
+        ----------
+        data : Any
+            For tables, a DataFrame, a dict of columns or a list of records. For
+            HDF5 files, an array or a dict of arrays (one dataset per key), with
+            the rows along the first axis.
+        """
+        from .cache import _estimate_size
+
+        if self._closed:
+            raise ValueError(f"Cannot write to the closed writer of '{self.file_path}'.")
+        batch, rows = self._to_batch(data)
+        if not rows:
+            return
+        self._buffer.append(batch)
+        self._buffered_rows += rows
+        self._buffered_bytes += _estimate_size(batch)
+
+        if (self._buffered_rows >= self.flush_rows
+                or self._buffered_bytes >= self.flush_bytes
+                or (self.flush_interval is not None
+                    and time.monotonic() - self._last_flush >= self.flush_interval)):
+            self.flush()
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        """
+        Append a single row.
+
+        Parameters
+        ----------
+        row : Dict[str, Any]
+            The values of the row, by column (or dataset) name.
+        """
+        self.write([row])
+
+    def flush(self) -> None:
+        """Write the buffered rows to the file."""
+        if self._buffer:
+            batch = self._concat(self._buffer)
+            self._write_batch(batch)
+            self.rows_written += self._buffered_rows
+            self._buffer = []
+            self._buffered_rows = 0
+            self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Write the buffered rows and close the file."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._close()
+
+    def _to_batch(self, data: Any):
+        raise NotImplementedError
+
+    def _concat(self, batches: List[Any]) -> Any:
+        raise NotImplementedError
+
+    def _write_batch(self, batch: Any) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        raise NotImplementedError
+
+    def __enter__(self):
+        """Context management enter method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context management exit method."""
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} file="{self.file_path}" rows_written={self.rows_written} '
+            f'buffered_rows={self._buffered_rows}>'
+        )
+
+
+class _TableWriter(Writer):
+    """Writer of tabular formats, buffering DataFrames and lists of records."""
+
+    def _to_batch(self, data: Any):
+        import pandas as pd
+
+        # Records are kept as they are, and converted once per flush
+        if not isinstance(data, (pd.DataFrame, list)):
+            data = pd.DataFrame(data)
+        return data, len(data)
+
+    def _concat(self, batches: List[Any]) -> Any:
+        import pandas as pd
+
+        frames, records = [], []
+        for batch in batches:
+            if isinstance(batch, list):
+                records.extend(batch)
+                continue
+            if records:
+                frames.append(pd.DataFrame.from_records(records))
+                records = []
+            frames.append(batch)
+        if records:
+            frames.append(pd.DataFrame.from_records(records))
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+@register(WRITERS, ["parquet"])
+class ParquetWriter(_TableWriter):
+    """
+    Incremental Parquet writer, writing each batch of rows as a row group.
+
+    The schema of the file is taken from the first batch, and the following
+    batches are converted to it. Use `open_writer` to create it.
+    """
+
+    def __init__(self, file_path: Path, append: bool = False, **kwargs):
+        if append and Path(file_path).exists():
+            raise ValueError("Parquet files can not be appended to. Write the rows to a new file.")
+        super().__init__(file_path, append=append, **kwargs)
+        self._writer = None
+        self._schema = None
+
+    def _write_batch(self, batch: Any) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow package is required for parquet writing. "
+                              "Install it using `pip install pyarrow`.")
+
+        table = pa.Table.from_pandas(batch, schema=self._schema, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(str(self.file_path), self._schema, **self.kwargs)
+        self._writer.write_table(table, row_group_size=len(batch))
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+@register(WRITERS, ["csv", "tsv"])
+class CSVWriter(_TableWriter):
+    """
+    Incremental CSV writer, writing the header once and appending the rows.
+
+    The file is kept open while writing. Use `open_writer` to create it.
+    """
+
+    def __init__(self, file_path: Path, append: bool = False, **kwargs):
+        super().__init__(file_path, append=append, **kwargs)
+        if self.file_path.suffix.lower() == ".tsv":
+            self.kwargs.setdefault("sep", "\t")
+        self._header = not (append and self.file_path.exists() and self.file_path.stat().st_size)
+        self._file = open(self.file_path, "a" if append else "w", newline="")
+
+    def _write_batch(self, batch: Any) -> None:
+        batch.to_csv(self._file, header=self._header, index=False, **self.kwargs)
+        self._header = False
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+@register(WRITERS, ["h5", "hdf5", "hdf"])
+class HDF5Writer(Writer):
+    """
+    Incremental HDF5 writer, growing resizable chunked datasets along the first axis.
+
+    Each key of the written dicts is a dataset, created on the first write with
+    an unlimited first dimension. Use `open_writer` to create it.
+    """
+
+    def __init__(self, file_path: Path, append: bool = False, dataset_name: str = "dataset", **kwargs):
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("h5py package is required for hdf5 writing. "
+                              "Install it using `pip install h5py`.")
+        super().__init__(file_path, append=append, **kwargs)
+        self.dataset_name = dataset_name
+        self._file = h5py.File(self.file_path, "a" if append else "w")
+
+    def _to_batch(self, data: Any):
+        import numpy as np
+
+        if isinstance(data, list):
+            # Rows given as records
+            data = {key: np.asarray([row[key] for row in data]) for key in data[0]} if data else {}
+        elif not isinstance(data, dict):
+            data = {self.dataset_name: data}
+        batch = {key: np.asarray(value) for key, value in data.items()}
+        lengths = {len(value) if value.ndim else 1 for value in batch.values()}
+        if len(lengths) > 1:
+            raise ValueError("All the datasets of a write must have the same number of rows.")
+        return batch, lengths.pop() if lengths else 0
+
+    def _concat(self, batches: List[Any]) -> Any:
+        import numpy as np
+        return {key: np.concatenate([np.atleast_1d(batch[key]) for batch in batches])
+                for key in batches[0]}
+
+    def _write_batch(self, batch: Any) -> None:
+        import h5py
+        import numpy as np
+
+        for key, value in batch.items():
+            dtype = value.dtype
+            # Chunks of about 1 MiB along the first axis
+            row_bytes = max(dtype.itemsize * int(np.prod(value.shape[1:])), 1)
+            if dtype.kind == "U":
+                # HDF5 stores text as variable-length UTF-8 strings
+                value, dtype = value.astype(object), h5py.string_dtype()
+            if key not in self._file:
+                chunk_rows = max(1, min(self.flush_rows, (1024**2) // row_bytes))
+                self._file.create_dataset(
+                    key,
+                    shape=(0,) + value.shape[1:],
+                    maxshape=(None,) + value.shape[1:],
+                    dtype=dtype,
+                    chunks=(chunk_rows,) + value.shape[1:],
+                    **self.kwargs,
+                )
+            dataset = self._file[key]
+            if dataset.maxshape[0] is not None:
+                raise ValueError(f"Dataset '{key}' of '{self.file_path}' is not resizable.")
+            start = dataset.shape[0]
+            dataset.resize(start + len(value), axis=0)
+            dataset[start:] = value
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
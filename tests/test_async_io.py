@@ -0,0 +1,54 @@
+import unittest
+import asyncio
+import time
+import tempfile
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from dmf.io import aload, asave, set_async_executor
+
+
+class TestAsyncIO(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_gather(self):
+        set_async_executor(workers=2)
+        paths = [self.test_dir / f"data{i}.csv" for i in range(10)]
+
+        async def main():
+            await asyncio.gather(*(
+                asave(pd.DataFrame({"a": [i]}), path, index=False) for i, path in enumerate(paths)
+            ))
+            return await asyncio.gather(*(aload(path) for path in paths))
+
+        results = asyncio.run(main())
+        self.assertEqual([df["a"][0] for df in results], list(range(10)))
+
+    def test_cancellation(self):
+        file_path = self.test_dir / "data.json"
+
+        async def main(executor):
+            # Block the only worker so the save stays queued
+            blocker = asyncio.get_running_loop().run_in_executor(executor, time.sleep, 0.2)
+            task = asyncio.ensure_future(asave({"a": 1}, file_path, executor=executor))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await blocker
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            asyncio.run(main(executor))
+        self.assertFalse(file_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import threading
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from dmf.io import AsyncSaver, load, save
+from dmf.io.save import register_saver
+
+
+BLOCKED = threading.Event()
+
+
+@register_saver("blocking-test", ["blocking"])
+def save_blocking(data, file_path, **kwargs):
+    """Saver that waits until the test releases it."""
+    BLOCKED.wait(5)
+    Path(file_path).write_text(str(len(data)))
+
+
+class TestAsyncSaver(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        BLOCKED.clear()
+
+    def tearDown(self):
+        BLOCKED.set()
+        shutil.rmtree(self.test_dir)
+
+    def test_context_flush(self):
+        with AsyncSaver(workers=2) as saver:
+            futures = [saver.save(np.full(10, i), self.test_dir / f"part{i}.npy") for i in range(5)]
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual([load(self.test_dir / f"part{i}.npy")[0] for i in range(5)], list(range(5)))
+        with self.assertRaises(RuntimeError):
+            saver.save(np.zeros(1), self.test_dir / "closed.npy")
+
+    def test_background_save(self):
+        future = save({"a": 1}, self.test_dir / "data.json", background=True)
+        future.result(timeout=5)
+        self.assertEqual(load(self.test_dir / "data.json"), {"a": 1})
+
+    def test_backpressure(self):
+        saver = AsyncSaver(workers=1, max_bytes=1500)
+        saver.save(np.zeros(100), self.test_dir / "first.blocking")  # 800 bytes, blocked in the worker
+        self.assertEqual(saver.pending_bytes, 800)
+
+        second = threading.Thread(target=saver.save, args=(np.zeros(100), self.test_dir / "second.blocking"))
+        second.start()
+        second.join(0.2)
+        self.assertTrue(second.is_alive())  # Waiting for the budget
+
+        BLOCKED.set()
+        second.join(5)
+        saver.close()
+        self.assertEqual(saver.pending_bytes, 0)
+        self.assertTrue((self.test_dir / "second.blocking").exists())
+
+    def test_errors(self):
+        saver = AsyncSaver()
+        future = saver.save(np.zeros(3), self.test_dir / "data.unknown")
+        with self.assertRaises(ValueError):
+            future.result(timeout=5)
+        with self.assertRaises(ValueError):
+            saver.flush()
+        saver.flush()  # Errors are only raised once
+        saver.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
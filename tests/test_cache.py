@@ -0,0 +1,82 @@
+import unittest
+import tempfile
+import shutil
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dmf.io import load, save, LoadCache
+
+
+class TestLoadCache(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.file_path = self.test_dir / "data.csv"
+        self.df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        self.df.to_csv(self.file_path, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_memory_hits(self):
+        cache = LoadCache()
+        first = load(self.file_path, cache=cache)
+        second = load(self.file_path, cache=cache)
+        self.assertIs(first, second)
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+
+        # Different loader arguments are different entries
+        load(self.file_path, cache=cache, usecols=["a"])
+        self.assertEqual(cache.stats["misses"], 2)
+
+    def test_modified_file(self):
+        cache = LoadCache()
+        load(self.file_path, cache=cache)
+        pd.DataFrame({"a": [4]}).to_csv(self.file_path, index=False)
+        stat = self.file_path.stat()
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertEqual(load(self.file_path, cache=cache)["a"].tolist(), [4])
+        self.assertEqual(cache.stats["misses"], 2)
+
+    def test_eviction(self):
+        arrays = []
+        for i in range(3):
+            file_path = self.test_dir / f"array{i}.npy"
+            save(np.zeros(1000, dtype=np.uint8), file_path)
+            arrays.append(file_path)
+
+        cache = LoadCache(max_bytes=2500)
+        for file_path in arrays:
+            load(file_path, cache=cache)
+        self.assertEqual(cache.stats["evictions"], 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_disk_tier(self):
+        cache_dir = self.test_dir / "cache"
+        load(self.file_path, cache=LoadCache(cache_dir=cache_dir))
+        self.assertEqual(len(list(cache_dir.glob("*.feather"))), 1)
+
+        cache = LoadCache(cache_dir=cache_dir)
+        loaded = load(self.file_path, cache=cache)
+        self.assertEqual(cache.stats["disk_hits"], 1)
+        self.assertTrue(loaded.equals(self.df))
+
+    def test_invalidate(self):
+        cache_dir = self.test_dir / "cache"
+        cache = LoadCache(cache_dir=cache_dir)
+        load(self.file_path, cache=cache)
+        cache.invalidate(self.file_path)
+        self.assertEqual(len(cache), 0)
+        self.assertFalse(list(cache_dir.iterdir()))
+
+        load(self.file_path, cache=cache)
+        self.assertEqual(cache.stats["misses"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dmf.io import load, save
+
+
+class TestCompressedLoadSave(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.df = pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5]})
+        self.array = np.arange(12, dtype=np.int32).reshape(3, 4)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_dataframes(self):
+        for name in ["data.csv.gz", "data.csv.bz2", "data.csv.zst", "data.parquet.zst",
+                     "data.feather.xz", "data.parquet.gz", "data.csv.lz4"]:
+            with self.subTest(name=name):
+                file_path = self.test_dir / name
+                kwargs = {"index": False} if ".csv" in name else {}
+                save(self.df, file_path, **kwargs)
+                self.assertTrue(load(file_path).equals(self.df))
+
+    def test_arrays(self):
+        for name in ["array.npy.gz", "array.npy.zst", "array.h5.xz", "array.npy.lz4"]:
+            with self.subTest(name=name):
+                file_path = self.test_dir / name
+                save(self.array, file_path)
+                loaded = load(file_path)
+                if name.startswith("array.h5"):
+                    loaded = loaded["dataset"].read()
+                np.testing.assert_array_equal(loaded, self.array)
+
+    def test_text_formats(self):
+        data = {"subject": "s01", "trials": [1, 2, 3]}
+        for name in ["data.json.zst", "data.yaml.gz", "data.pkl.xz"]:
+            with self.subTest(name=name):
+                file_path = self.test_dir / name
+                save(data, file_path)
+                self.assertEqual(load(file_path), data)
+
+        file_path = self.test_dir / "notes.txt.gz"
+        save("hello\nworld", file_path)
+        self.assertEqual(load(file_path), "hello\nworld")
+
+    def test_compressed_without_extension(self):
+        file_path = self.test_dir / "shard.parquet.gz"
+        save(self.df, file_path)
+        file_path = file_path.rename(self.test_dir / "shard")
+        self.assertTrue(load(file_path).equals(self.df))
+
+    def test_filters_on_compressed(self):
+        file_path = self.test_dir / "data.parquet.zst"
+        save(self.df, file_path)
+        loaded = load(file_path, columns=["b"], filters=[("a", ">", 1)])
+        self.assertEqual(loaded["b"].tolist(), [1.5, 2.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,9 +22,9 @@ class TestCompression(unittest.TestCase):
 
     def test_compression_decompression_file(self):
         compression_formats = [
-            "gz", "gzip", "bz2", "bzip2", "xz", 
+            "gz", "gzip", "bz2", "bzip2", "xz", "zst", "zstd", "lz4",
             "zip", "7z", "tar", "tgz", 
-            "tar.gz", "tar.bz2", "tar.xz"
+            "tar.gz", "tar.bz2", "tar.xz", "tar.zst", "tzst", "tar.lz4"
         ]
 
         for compression in compression_formats:
@@ -52,7 +52,7 @@ class TestCompression(unittest.TestCase):
     def test_compression_decompression_folder(self):
         compression_formats = [
             "zip", "7z", "tar", "tgz", 
-            "tar.gz", "tar.bz2", "tar.xz"
+            "tar.gz", "tar.bz2", "tar.xz", "tar.zst", "tzst", "tar.lz4"
         ]
         for compression in compression_formats:
             with self.subTest(compression=compression):
@@ -161,8 +161,31 @@ class TestCompression(unittest.TestCase):
                     # Assert that test_dir is empty
                     self.assertFalse(list(Path(self.test_dir).iterdir()))
 
+    def test_tar_compression_inferred(self):
+        import tarfile
+
+        self.sub_test_dir.mkdir(exist_ok=True)
+        self.df.to_csv(self.sub_test_dir / "test.csv", index=False)
+        for compression, magic in [("tar.gz", b"\x1f\x8b"), ("tar.zst", b"\x28\xb5\x2f\xfd")]:
+            with self.subTest(compression=compression):
+                output_file = Path(self.test_dir) / f"archive.{compression}"
+                compress(self.sub_test_dir, output_file=output_file)
+                self.assertEqual(output_file.read_bytes()[:len(magic)], magic)
+
+                output_dir = Path(self.test_dir) / compression
+                decompress(output_file, output_dir=output_dir)
+                self.assertTrue(pd.read_csv(output_dir / "subdir" / "test.csv").equals(self.df))
+
+    def test_zstd_threads_long_distance(self):
+        self.input_file.write_bytes(bytes(range(256)) * 20000)
+        output_file = compress(self.input_file, compression="tar.zst", level=5, threads=2,
+                               long_distance=True)
+        self.input_file.unlink()
+        decompress(output_file, output_dir=self.test_dir)
+        self.assertEqual(self.input_file.read_bytes(), bytes(range(256)) * 20000)
+
     def test_compression_folder_not_supported(self):
-        compression_formats = ["gz", "gzip", "bz2", "bzip2", "xz"]
+        compression_formats = ["gz", "gzip", "bz2", "bzip2", "xz", "zst", "lz4"]
         self.sub_test_dir = Path(self.test_dir) / "subdir"
         self.sub_test_dir.mkdir(exist_ok=True)
         self.df.to_csv(self.sub_test_dir / "test.csv", index=False)
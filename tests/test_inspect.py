@@ -0,0 +1,93 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dmf.io import inspect, save
+
+
+class TestInspect(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.array = np.zeros((10, 3), dtype=np.float32)
+        self.df = pd.DataFrame({"a": range(25), "b": ["x"] * 25})
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_numpy(self):
+        file_path = self.test_dir / "array.npy"
+        save(self.array, file_path)
+        metadata = inspect(file_path)
+        self.assertEqual(metadata["format"], "npy")
+        self.assertEqual(metadata["shape"], (10, 3))
+        self.assertEqual(metadata["dtype"], "float32")
+        self.assertEqual(metadata["size"], file_path.stat().st_size)
+
+        file_path = self.test_dir / "arrays.npz"
+        np.savez_compressed(file_path, a=self.array, b=np.arange(4))
+        arrays = inspect(file_path)["arrays"]
+        self.assertEqual(arrays["a"]["shape"], (10, 3))
+        self.assertEqual(arrays["b"]["shape"], (4,))
+
+    def test_tables(self):
+        file_path = self.test_dir / "data.parquet"
+        self.df.to_parquet(file_path, index=False, row_group_size=10)
+        metadata = inspect(file_path)
+        self.assertEqual(metadata["columns"], ["a", "b"])
+        self.assertEqual(metadata["num_rows"], 25)
+        self.assertEqual(metadata["num_row_groups"], 3)
+
+        file_path = self.test_dir / "data.feather"
+        self.df.to_feather(file_path)
+        self.assertEqual(inspect(file_path)["num_rows"], 25)
+
+        file_path = self.test_dir / "data.csv"
+        self.df.to_csv(file_path, index=False)
+        self.assertEqual(inspect(file_path)["columns"], ["a", "b"])
+
+    def test_hdf5_and_matlab(self):
+        file_path = self.test_dir / "data.h5"
+        save({"eeg": self.array}, file_path)
+        self.assertEqual(inspect(file_path)["datasets"]["eeg"]["shape"], (10, 3))
+
+        file_path = self.test_dir / "data.mat"
+        save({"eeg": self.array}, file_path)
+        self.assertEqual(inspect(file_path)["variables"]["eeg"]["shape"], (10, 3))
+
+    def test_image(self):
+        from PIL import Image
+
+        file_path = self.test_dir / "image.png"
+        Image.new("RGB", (32, 16)).save(file_path)
+        metadata = inspect(file_path)
+        self.assertEqual((metadata["width"], metadata["height"], metadata["mode"]), (32, 16, "RGB"))
+
+    def test_audio(self):
+        file_path = self.test_dir / "audio.wav"
+        save(np.zeros(8000), file_path, samplerate=16000)
+        metadata = inspect(file_path)
+        self.assertEqual(metadata["sample_rate"], 16000)
+        self.assertAlmostEqual(metadata["duration"], 0.5)
+
+    def test_video(self):
+        file_path = self.test_dir / "video.mp4"
+        save([np.zeros((16, 32, 3), dtype=np.uint8)] * 10, file_path, fps=5)
+        metadata = inspect(file_path)
+        self.assertEqual((metadata["frame_count"], metadata["width"], metadata["height"]), (10, 32, 16))
+        self.assertAlmostEqual(metadata["fps"], 5)
+
+    def test_compressed(self):
+        file_path = self.test_dir / "array.npy.gz"
+        save(self.array, file_path)
+        metadata = inspect(file_path)
+        self.assertEqual(metadata["compression"], "gz")
+        self.assertNotIn("shape", metadata)
+
+
+if __name__ == "__main__":
+    unittest.main()
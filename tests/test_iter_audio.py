@@ -0,0 +1,53 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from scipy.signal import resample_poly
+
+from dmf.io import iter_audio
+
+
+class TestIterAudio(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.file_path = self.test_dir / "audio.wav"
+        self.samplerate = 44100
+        self.audio = np.random.RandomState(0).uniform(-0.5, 0.5, (self.samplerate * 2, 2))
+        sf.write(self.file_path, self.audio, self.samplerate, subtype="DOUBLE")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_blocks(self):
+        blocks = list(iter_audio(self.file_path, block_size=10000, dtype="float64"))
+        self.assertEqual([len(block) for block in blocks], [10000] * 8 + [8200])
+        np.testing.assert_array_equal(np.concatenate(blocks), self.audio)
+
+    def test_overlap(self):
+        blocks = list(iter_audio(self.file_path, block_size=1000, overlap=400, mono=True, dtype="float64"))
+        self.assertEqual(blocks[0].shape, (1000,))
+        np.testing.assert_array_equal(blocks[0][600:], blocks[1][:400])
+        np.testing.assert_allclose(blocks[1][:600], self.audio[600:1200].mean(axis=1))
+
+    def test_time_window(self):
+        blocks = list(iter_audio(self.file_path, block_size=4096, start=0.5, stop=1.0, dtype="float64"))
+        np.testing.assert_array_equal(np.concatenate(blocks), self.audio[22050:44100])
+
+    def test_resample(self):
+        for sr, up, down in [(16000, 160, 441), (48000, 160, 147)]:
+            with self.subTest(sr=sr):
+                blocks = list(iter_audio(self.file_path, block_size=5000, sr=sr, dtype="float64"))
+                expected = resample_poly(self.audio, up, down, axis=0)
+                np.testing.assert_allclose(np.concatenate(blocks), expected, atol=1e-12)
+
+    def test_invalid_overlap(self):
+        with self.assertRaises(ValueError):
+            next(iter_audio(self.file_path, block_size=100, overlap=100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from dmf.io import iter_load
+
+
+class TestIterLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.df = pd.DataFrame({"a": range(25), "b": [str(i) for i in range(25)]})
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_batches(self):
+        writers = {
+            "csv": lambda path: self.df.to_csv(path, index=False),
+            "parquet": lambda path: self.df.to_parquet(path, index=False, row_group_size=10),
+            "feather": lambda path: self.df.to_feather(path),
+            "jsonl": lambda path: self.df.to_json(path, orient="records", lines=True),
+        }
+        for ext, writer in writers.items():
+            with self.subTest(ext=ext):
+                file_path = self.test_dir / f"data.{ext}"
+                writer(file_path)
+
+                batches = list(iter_load(file_path, batch_size=10))
+                self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+
+                result = pd.concat(batches, ignore_index=True)
+                result["b"] = result["b"].astype(str)
+                self.assertTrue(result.equals(self.df.astype({"b": str})))
+
+    def test_columns(self):
+        file_path = self.test_dir / "data.parquet"
+        self.df.to_parquet(file_path, index=False)
+        batch = next(iter_load(file_path, columns=["a"]))
+        self.assertEqual(list(batch.columns), ["a"])
+
+    def test_compressed(self):
+        from dmf.io import save
+
+        for name in ["data.csv.gz", "data.tsv.bz2", "data.jsonl.zst"]:
+            with self.subTest(name=name):
+                file_path = self.test_dir / name
+                if ".tsv" in name:
+                    self.df.to_csv(file_path, sep="\t", index=False, compression="bz2")
+                else:
+                    save(self.df, file_path, **({} if ".jsonl" in name else {"index": False}))
+                batches = list(iter_load(file_path, batch_size=10))
+                self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+                self.assertEqual(pd.concat(batches)["a"].tolist(), list(range(25)))
+
+    def test_unsupported(self):
+        file_path = self.test_dir / "data.xlsx"
+        file_path.touch()
+        with self.assertRaises(ValueError):
+            iter_load(file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
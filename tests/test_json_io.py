@@ -0,0 +1,110 @@
+import importlib.util
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dmf.io import load, save, iter_jsonl, get_json_engine
+
+ENGINES = [name for name in ["orjson", "ujson", "json"] if importlib.util.find_spec(name)]
+
+
+class TestJsonEngines(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.data = {"subject": "s01", "rt": np.array([0.5, 0.75]), "trials": np.int64(3)}
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_numpy_round_trip(self):
+        file_path = self.test_dir / "data.json"
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                save(self.data, file_path, engine=engine)
+                self.assertEqual(load(file_path, engine=engine), {"subject": "s01", "rt": [0.5, 0.75], "trials": 3})
+
+    def test_stdlib_options(self):
+        file_path = self.test_dir / "data.json"
+        save({"name": "é"}, file_path, ensure_ascii=False)
+        self.assertEqual(file_path.read_text(encoding="utf-8"), '{"name": "é"}')
+        self.assertEqual(load(file_path, object_hook=lambda d: sorted(d)), ["name"])
+
+    def test_indent(self):
+        import json
+
+        file_path = self.test_dir / "data.json"
+        save({"a": [1, 2]}, file_path, indent=4)
+        self.assertEqual(file_path.read_text(), json.dumps({"a": [1, 2]}, indent=4))
+
+    def test_non_finite_round_trip(self):
+        file_path = self.test_dir / "data.json"
+        save({"nan": float("nan"), "values": np.array([1.0, np.inf])}, file_path)
+        loaded = load(file_path)
+        self.assertTrue(np.isnan(loaded["nan"]))
+        self.assertEqual(loaded["values"], [1.0, float("inf")])
+
+        file_path = self.test_dir / "events.jsonl"
+        save([{"t": float("nan")}, {"t": 1.0}], file_path)
+        records = list(iter_jsonl(file_path))
+        self.assertTrue(np.isnan(records[0]["t"]))
+        self.assertEqual(records[1], {"t": 1.0})
+
+    def test_big_integer(self):
+        file_path = self.test_dir / "data.json"
+        save({"a": 2**70}, file_path)
+        self.assertEqual(load(file_path), {"a": 2**70})
+
+    def test_large_payload(self):
+        file_path = self.test_dir / "data.json"
+        records = [{"trial": i, "rt": i / 7, "label": None} for i in range(100000)]
+        records[-1]["rt"] = float("nan")
+        save(records, file_path)
+        loaded = load(file_path)
+        self.assertEqual(loaded[:-1], records[:-1])
+        self.assertTrue(np.isnan(loaded[-1]["rt"]))
+
+        save(records[:-1], file_path)
+        self.assertEqual(load(file_path), records[:-1])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            get_json_engine("simdjson")
+
+
+class TestJsonLines(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.records = [{"event": "start", "t": 0.0}, {"event": "stop", "t": np.float64(1.5)}]
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_round_trip(self):
+        for name in ["events.jsonl", "events.ndjson", "events.jsonl.gz"]:
+            with self.subTest(name=name):
+                file_path = self.test_dir / name
+                save(self.records, file_path)
+                self.assertEqual(load(file_path), [{"event": "start", "t": 0.0}, {"event": "stop", "t": 1.5}])
+                self.assertEqual([record["event"] for record in iter_jsonl(file_path)], ["start", "stop"])
+
+    def test_append(self):
+        file_path = self.test_dir / "events.jsonl"
+        save(self.records, file_path)
+        save(pd.DataFrame({"event": ["pause"], "t": [2.0]}), file_path, append=True)
+        self.assertEqual(file_path.read_text().count("\n"), 3)
+        self.assertEqual(load(file_path)[-1], {"event": "pause", "t": 2.0})
+
+    def test_blank_lines(self):
+        file_path = self.test_dir / "events.jsonl"
+        file_path.write_text('{"a": 1}\n\n{"a": 2}\n')
+        self.assertEqual(list(iter_jsonl(file_path, engine="json")), [{"a": 1}, {"a": 2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,376 @@
+import importlib.util
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dmf.io import load, save, set_loader_defaults
+
+
+class TestNumpyLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.array = np.arange(60, dtype=np.float32).reshape(10, 6)
+
+    def tearDown(self):
+        set_loader_defaults("numpy", mmap=None)
+        shutil.rmtree(self.test_dir)
+
+    def test_npy_mmap(self):
+        file_path = self.test_dir / "array.npy"
+        save(self.array, file_path)
+
+        loaded = load(file_path, mmap=True)
+        self.assertIsInstance(loaded, np.memmap)
+        self.assertFalse(loaded.flags.writeable)
+        np.testing.assert_array_equal(loaded, self.array)
+
+        self.assertNotIsInstance(load(file_path), np.memmap)
+
+    def test_npz_mmap(self):
+        file_path = self.test_dir / "arrays.npz"
+        fortran = np.asfortranarray(self.array)
+        np.savez(file_path, a=self.array, b=fortran, c=np.arange(3))
+
+        with load(file_path, mmap=True) as archive:
+            self.assertEqual(sorted(archive.files), ["a", "b", "c"])
+            for key, expected in [("a", self.array), ("b", fortran), ("c", np.arange(3))]:
+                with self.subTest(key=key):
+                    self.assertIsInstance(archive[key], np.memmap)
+                    np.testing.assert_array_equal(archive[key], expected)
+
+    def test_npz_compressed_mmap(self):
+        file_path = self.test_dir / "arrays.npz"
+        np.savez_compressed(file_path, a=self.array)
+
+        archive = load(file_path, mmap=True)
+        self.assertNotIsInstance(archive["a"], np.memmap)
+        np.testing.assert_array_equal(archive["a"], self.array)
+
+    def test_npz_mmap_options(self):
+        file_path = self.test_dir / "arrays.npz"
+        np.savez(file_path, a=self.array)
+
+        archive = load(file_path, mmap=True, mmap_mode="c")
+        archive["a"][0] = -1
+        np.testing.assert_array_equal(load(file_path)["a"], self.array)
+        with self.assertRaises(ValueError):
+            load(file_path, mmap=True, mmap_mode="w+")
+        with self.assertRaises(ValueError):
+            load(file_path, mmap=True, unknown=True)
+
+    def test_loader_defaults(self):
+        file_path = self.test_dir / "array.npy"
+        save(self.array, file_path)
+
+        set_loader_defaults("numpy", mmap=True)
+        self.assertIsInstance(load(file_path), np.memmap)
+        self.assertNotIsInstance(load(file_path, mmap=False), np.memmap)
+
+        with self.assertRaises(ValueError):
+            set_loader_defaults("unknown", mmap=True)
+
+
+class TestHDF5Loader(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.file_path = self.test_dir / "data.h5"
+        self.array = np.arange(200, dtype=np.float64).reshape(20, 10)
+
+        import h5py
+        with h5py.File(self.file_path, "w") as file:
+            file.create_dataset("eeg", data=self.array, chunks=(5, 10), compression="gzip")
+            group = file.create_group("meta")
+            group.attrs["subject"] = "s01"
+            group.create_dataset("labels", data=np.arange(20))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_lazy_file_is_open(self):
+        file = load(self.file_path)
+        self.assertFalse(file.closed)
+        self.assertEqual(sorted(file.keys()), ["eeg", "meta"])
+        file.close()
+        self.assertTrue(file.closed)
+
+    def test_dataset_slicing(self):
+        with load(self.file_path) as file:
+            eeg = file["eeg"]
+            self.assertEqual(eeg.shape, (20, 10))
+            self.assertEqual(eeg.chunks, (5, 10))
+            self.assertEqual(eeg.compression, "gzip")
+            np.testing.assert_array_equal(eeg[3:7], self.array[3:7])
+            np.testing.assert_array_equal(np.asarray(eeg), self.array)
+            self.assertEqual(len(list(eeg.iter_chunks())), 4)
+
+    def test_groups(self):
+        with load(self.file_path) as file:
+            meta = file["meta"]
+            self.assertEqual(meta.attrs["subject"], "s01")
+            np.testing.assert_array_equal(meta["labels"].read(), np.arange(20))
+            np.testing.assert_array_equal(file["meta/labels"][:3], np.arange(3))
+
+
+class TestMatlabLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.matrix = np.arange(6, dtype=np.float64).reshape(3, 2)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write_v73(self, file_path):
+        """Write an HDF5 file with the layout used by MATLAB v7.3."""
+        import h5py
+
+        with h5py.File(file_path, "w", userblock_size=512) as file:
+            # MATLAB stores the transpose of the arrays
+            file.create_dataset("x", data=self.matrix.T).attrs["MATLAB_class"] = np.bytes_("double")
+            name = file.create_dataset("name", data=np.array([[ord(c)] for c in "abc"], dtype=np.uint16))
+            name.attrs["MATLAB_class"] = np.bytes_("char")
+            flag = file.create_dataset("flag", data=np.array([[1], [0]], dtype=np.uint8))
+            flag.attrs["MATLAB_class"] = np.bytes_("logical")
+
+            refs = file.create_group("#refs#")
+            elements = [refs.create_dataset(key, data=np.full((1, 1), value)) for key, value in [("a", 1.0), ("b", 2.0)]]
+            struct = file.create_group("s")
+            struct.attrs["MATLAB_class"] = np.bytes_("struct")
+            struct.create_dataset("value", data=np.array([[5.0]])).attrs["MATLAB_class"] = np.bytes_("double")
+            cell = struct.create_dataset("cell", data=np.array([[e.ref] for e in elements]), dtype=h5py.ref_dtype)
+            cell.attrs["MATLAB_class"] = np.bytes_("cell")
+        with open(file_path, "r+b") as file:
+            file.write(b"MATLAB 7.3 MAT-file, Platform: GLNXA64")
+
+    def test_v73(self):
+        from dmf.io import MatlabFile, MatlabArray
+
+        file_path = self.test_dir / "data.mat"
+        self._write_v73(file_path)
+        with load(file_path) as file:
+            self.assertIsInstance(file, MatlabFile)
+            self.assertEqual(set(file), {"x", "name", "flag", "s"})
+            self.assertIsInstance(file["x"], MatlabArray)
+            self.assertEqual(file["x"].shape, (3, 2))
+            np.testing.assert_array_equal(file["x"][1:, 1], self.matrix[1:, 1])
+            np.testing.assert_array_equal(np.asarray(file["x"]), self.matrix)
+            self.assertEqual(file["name"], "abc")
+            self.assertEqual(file["flag"].read().tolist(), [[True, False]])
+
+            cell = file["s"]["cell"]
+            self.assertEqual(cell.shape, (1, 2))
+            self.assertEqual(cell[0, 1][0, 0], 2.0)
+            self.assertEqual([element[0, 0] for element in cell], [1.0, 2.0])
+            self.assertEqual(file["s"]["value"][0, 0], 5.0)
+
+        with load(file_path, variable_names=["x"]) as file:
+            self.assertEqual(list(file), ["x"])
+        with self.assertRaises(ValueError):
+            load(file_path, variable_names=["missing"])
+
+    def test_v5_variable_names(self):
+        import scipy.io
+
+        file_path = self.test_dir / "data.mat"
+        scipy.io.savemat(file_path, {"x": self.matrix, "y": np.ones(3)})
+        data = load(file_path, variable_names=["x"])
+        self.assertIn("x", data)
+        self.assertNotIn("y", data)
+        np.testing.assert_array_equal(data["x"], self.matrix)
+
+
+class TestPandasLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.df = pd.DataFrame({"trial": range(100), "rt": np.linspace(0, 1, 100), "cond": ["a", "b"] * 50})
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_parquet_pushdown(self):
+        file_path = self.test_dir / "data.parquet"
+        self.df.to_parquet(file_path, index=False, row_group_size=10)
+
+        loaded = load(file_path, columns=["rt"], filters=[("trial", ">=", 75)])
+        self.assertEqual(list(loaded.columns), ["rt"])
+        self.assertEqual(len(loaded), 25)
+        self.assertEqual(loaded.attrs["row_groups_total"], 10)
+        self.assertEqual(loaded.attrs["row_groups_skipped"], 7)
+
+    def test_feather_pushdown(self):
+        file_path = self.test_dir / "data.feather"
+        self.df.to_feather(file_path)
+
+        loaded = load(file_path, columns=["trial"], filters=[("cond", "==", "a")])
+        self.assertEqual(list(loaded.columns), ["trial"])
+        self.assertEqual(loaded["trial"].tolist(), list(range(0, 100, 2)))
+
+    def test_columns(self):
+        file_path = self.test_dir / "data.csv"
+        self.df.to_csv(file_path, index=False)
+
+        self.assertEqual(list(load(file_path, columns=["cond"]).columns), ["cond"])
+        with self.assertRaises(ValueError):
+            load(file_path, filters=[("trial", ">", 1)])
+
+
+@unittest.skipUnless(importlib.util.find_spec("torch"), "torch is not installed")
+class TestPytorchLoader(unittest.TestCase):
+
+    def setUp(self):
+        import torch
+
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.file_path = self.test_dir / "model.pt"
+        self.state = {
+            "encoder.weight": torch.ones(4, 4),
+            "encoder.bias": torch.zeros(4),
+            "head.weight": torch.arange(8.0),
+        }
+        torch.save(self.state, self.file_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_load(self):
+        import torch
+
+        state = load(self.file_path)
+        self.assertEqual(set(state), set(self.state))
+        self.assertTrue(torch.equal(state["head.weight"], self.state["head.weight"]))
+
+    def test_keys(self):
+        state = load(self.file_path, keys=["encoder"])
+        self.assertEqual(set(state), {"encoder.weight", "encoder.bias"})
+        self.assertEqual(set(load(self.file_path, keys=["head.weight"])), {"head.weight"})
+        with self.assertRaises(ValueError):
+            load(self.file_path, keys=["decoder"])
+
+
+class TestMultipleFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_glob_dataframes(self):
+        for i in [2, 0, 1]:
+            pd.DataFrame({"session": [i] * (i + 1)}).to_parquet(self.test_dir / f"shard-{i}.parquet")
+        (self.test_dir / "notes.txt").write_text("ignored")
+
+        df = load(self.test_dir / "*.parquet", source_column="source", workers=2)
+        self.assertEqual(df["session"].tolist(), [0, 1, 1, 2, 2, 2])
+        self.assertEqual(df.index.tolist(), list(range(6)))
+        self.assertEqual([Path(source).name for source in df["source"][[0, 1, 3]]],
+                         ["shard-0.parquet", "shard-1.parquet", "shard-2.parquet"])
+
+    def test_directory_arrays(self):
+        for i in range(3):
+            np.save(self.test_dir / f"part{i}.npy", np.full((i + 1, 2), i, dtype=np.int32))
+
+        array = load(self.test_dir)
+        self.assertEqual(array.shape, (6, 2))
+        self.assertNotIsInstance(array, np.memmap)
+        np.testing.assert_array_equal(array[:, 0], [0, 1, 1, 2, 2, 2])
+
+        arrays = load(self.test_dir, concat=False)
+        self.assertEqual([len(array) for array in arrays], [1, 2, 3])
+
+    def test_errors(self):
+        with self.assertRaises(FileNotFoundError):
+            load(self.test_dir / "*.csv")
+        for i in range(2):
+            save({"value": i}, self.test_dir / f"config{i}.json")
+        with self.assertRaises(ValueError):
+            load(self.test_dir / "*.json")
+        self.assertEqual(load(self.test_dir / "*.json", concat=False), [{"value": 0}, {"value": 1}])
+
+
+class TestPillowLoader(unittest.TestCase):
+
+    def setUp(self):
+        from PIL import Image
+
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.file_path = self.test_dir / "image.jpg"
+        self.image = Image.new("RGB", (800, 600), color="red")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_max_size(self):
+        self.image.save(self.file_path)
+        image = load(self.file_path, max_size=(200, 200))
+        self.assertEqual(image.size, (200, 150))
+        self.assertEqual(load(self.file_path).size, (800, 600))
+
+    def test_exif_thumbnail(self):
+        import io
+        import struct
+        from PIL import Image
+
+        thumbnail = io.BytesIO()
+        Image.new("RGB", (16, 12), color="blue").save(thumbnail, format="jpeg")
+        thumbnail = thumbnail.getvalue()
+
+        # TIFF header, empty IFD0 and IFD1 pointing to the thumbnail
+        ifd1 = struct.pack("<H", 2)
+        ifd1 += struct.pack("<HHII", 0x0201, 4, 1, 8 + 6 + 30)
+        ifd1 += struct.pack("<HHII", 0x0202, 4, 1, len(thumbnail))
+        ifd1 += struct.pack("<I", 0)
+        tiff = b"II*\x00" + struct.pack("<I", 8) + struct.pack("<HI", 0, 14) + ifd1 + thumbnail
+        self.image.save(self.file_path, exif=b"Exif\x00\x00" + tiff)
+
+        self.assertEqual(load(self.file_path, thumbnail=True).size, (16, 12))
+
+        self.image.save(self.file_path)
+        self.assertEqual(load(self.file_path, thumbnail=True).size, (800, 600))
+
+
+class TestVideoLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.file_path = self.test_dir / "video.avi"
+        frames = [np.full((16, 32, 3), i * 10, dtype=np.uint8) for i in range(20)]
+        save(frames, self.file_path, fps=5)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_preallocated_array(self):
+        frames = load(self.file_path)
+        self.assertIsInstance(frames, np.ndarray)
+        self.assertEqual(frames.shape, (20, 16, 32, 3))
+        self.assertEqual(frames.dtype, np.uint8)
+        self.assertAlmostEqual(frames[7].mean(), 70, delta=5)
+
+    def test_frame_selection(self):
+        full = load(self.file_path)
+        frames = load(self.file_path, start=3, stop=15, stride=4)
+        np.testing.assert_array_equal(frames, full[3:15:4])
+
+        frames = load(self.file_path, stride=3, max_frames=4)
+        np.testing.assert_array_equal(frames, full[0:12:3])
+
+    def test_lazy(self):
+        from dmf.video import VideoReader
+
+        with load(self.file_path, lazy=True) as reader:
+            self.assertIsInstance(reader, VideoReader)
+            self.assertEqual(len(reader), 20)
+        with self.assertRaises(ValueError):
+            load(self.file_path, lazy=True, start=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from dmf.io import load_images
+
+
+class TestLoadImages(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.paths = []
+        for i in range(10):
+            file_path = self.test_dir / f"image{i:02d}.png"
+            Image.new("RGB", (40, 30), color=(i, 2 * i, 3 * i)).save(file_path)
+            self.paths.append(file_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_input_order(self):
+        images = load_images(self.paths, workers=4)
+        self.assertEqual(images.shape, (10, 30, 40, 3))
+        self.assertEqual(images.dtype, np.uint8)
+        self.assertTrue(images.flags["C_CONTIGUOUS"])
+        for i, image in enumerate(images):
+            np.testing.assert_array_equal(image[0, 0], [i, 2 * i, 3 * i])
+
+    def test_size_and_mode(self):
+        file_path = self.test_dir / "large.jpg"
+        Image.new("RGB", (800, 600), color="white").save(file_path)
+        images = load_images(self.paths + [file_path], size=(20, 10), mode="L")
+        self.assertEqual(images.shape, (11, 10, 20, 1))
+        self.assertGreater(images[-1].min(), 250)
+
+    def test_high_bit_depth(self):
+        data = (np.arange(30 * 40, dtype=np.uint16) * 50).reshape(30, 40)
+        file_path = self.test_dir / "depth.png"
+        Image.fromarray(data).save(file_path)
+        images = load_images([file_path, file_path], mode="I;16")
+        self.assertEqual(images.shape, (2, 30, 40, 1))
+        self.assertEqual(images.dtype, np.uint16)
+        np.testing.assert_array_equal(images[1, ..., 0], data)
+
+    def test_different_sizes(self):
+        file_path = self.test_dir / "other.png"
+        Image.new("RGB", (10, 10)).save(file_path)
+        with self.assertRaises(ValueError):
+            load_images(self.paths + [file_path])
+
+
+if __name__ == "__main__":
+    unittest.main()
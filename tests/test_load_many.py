@@ -0,0 +1,47 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from dmf.io import load_many, load_as_completed
+
+
+class TestLoadMany(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.paths = []
+        for i in range(20):
+            file_path = self.test_dir / f"participant{i:02d}.csv"
+            pd.DataFrame({"participant": [i] * 3}).to_csv(file_path, index=False)
+            self.paths.append(file_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_input_order(self):
+        for executor in ["thread", "process"]:
+            with self.subTest(executor=executor):
+                results = load_many(self.paths, workers=4, executor=executor)
+                self.assertEqual([df["participant"][0] for df in results], list(range(20)))
+
+    def test_errors(self):
+        paths = self.paths[:2] + [self.test_dir / "missing.csv"]
+        with self.assertRaises(FileNotFoundError):
+            load_many(paths)
+
+        results = load_many(paths, errors="return")
+        self.assertIsInstance(results[0], pd.DataFrame)
+        self.assertIsInstance(results[2], FileNotFoundError)
+
+    def test_as_completed(self):
+        results = dict(load_as_completed(self.paths, workers=4))
+        self.assertEqual(set(results), set(self.paths))
+        for i, path in enumerate(self.paths):
+            self.assertEqual(results[path]["participant"][0], i)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import pickle
+import sys
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from dmf.io import load, save
+
+
+@unittest.skipIf(sys.version_info < (3, 8), "out-of-band buffers require Python 3.8")
+class TestOutOfBandPickle(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.file_path = self.test_dir / "results.pkl"
+        self.data = {
+            "features": np.random.rand(500, 300),
+            "labels": np.arange(100000, dtype=np.int32),
+            "small": np.arange(10),
+            "name": "session-01",
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _assert_equal(self, data):
+        self.assertEqual(set(data), set(self.data))
+        self.assertEqual(data["name"], "session-01")
+        for key in ["features", "labels", "small"]:
+            np.testing.assert_array_equal(data[key], self.data[key])
+
+    def test_round_trip(self):
+        save(self.data, self.file_path, out_of_band=True)
+        data = load(self.file_path)
+        self._assert_equal(data)
+        # Large buffers are mapped read-only and aligned, small ones are in the stream
+        self.assertFalse(data["features"].flags.writeable)
+        self.assertEqual(data["features"].ctypes.data % 64, 0)
+        self.assertEqual(data["labels"].ctypes.data % 64, 0)
+        self.assertTrue(data["small"].flags.writeable)
+
+        data = load(self.file_path, mmap=False)
+        self._assert_equal(data)
+        self.assertTrue(data["features"].flags.writeable)
+
+    def test_pickle_stream_is_small(self):
+        from dmf.io.oob_pickle import read_buffer_table
+
+        save(self.data, self.file_path, out_of_band=True)
+        with open(self.file_path, "rb") as file:
+            self.assertEqual(file.read(2), b"\x80\x05")
+            table = read_buffer_table(file)
+        self.assertEqual(len(table), 2)
+        self.assertLess(table[0][0], 1024)
+
+    def test_regular_pickle(self):
+        save(self.data, self.file_path)
+        self._assert_equal(load(self.file_path))
+        with open(self.file_path, "rb") as file:
+            self._assert_equal(pickle.load(file))
+
+    def test_compressed(self):
+        with self.assertRaises(ValueError):
+            save(self.data, self.test_dir / "results.pkl.gz", out_of_band=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import tempfile
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+from dmf.io import Prefetcher
+
+
+class TestPrefetcher(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.paths = []
+        for i in range(6):
+            file_path = self.test_dir / f"part{i}.npy"
+            np.save(file_path, np.full(1000, i, dtype=np.float64))
+            self.paths.append(file_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_order(self):
+        with Prefetcher(self.paths, depth=3, workers=2) as prefetcher:
+            self.assertEqual(len(prefetcher), 6)
+            self.assertEqual([array[0] for array in prefetcher], list(range(6)))
+
+    def test_depth(self):
+        prefetcher = Prefetcher(self.paths, depth=2)
+        iterator = iter(prefetcher)
+        next(iterator)
+        self.assertEqual(len(prefetcher._pending), 2)
+        prefetcher.close()
+
+    def test_max_bytes(self):
+        # Each array uses 8000 bytes, so only one file fits in the budget
+        prefetcher = Prefetcher(self.paths, depth=4, max_bytes=8000)
+        iterator = iter(prefetcher)
+        next(iterator)
+        time.sleep(0.2)
+        self.assertEqual(len(prefetcher._pending), 1)
+        self.assertEqual([array[0] for array in iterator], list(range(1, 6)))
+
+    def test_errors(self):
+        (self.test_dir / "part2.npy").write_bytes(b"corrupted")
+        results = []
+        with self.assertRaises(ValueError):
+            for array in Prefetcher(self.paths):
+                results.append(array[0])
+        self.assertEqual(results, [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import importlib.util
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import h5py
+import numpy as np
+
+from dmf.io import load, save
+
+
+class TestHDF5Saver(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.file_path = self.test_dir / "data.h5"
+        self.array = np.random.rand(2000, 64, 10)  # About 10 MiB
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _chunks(self, **kwargs):
+        save(self.array, self.file_path, **kwargs)
+        with h5py.File(self.file_path, "r") as file:
+            np.testing.assert_array_equal(file["dataset"][:], self.array)
+            return file["dataset"].chunks
+
+    def test_access_patterns(self):
+        self.assertEqual(self._chunks(), (204, 64, 10))
+        self.assertEqual(self._chunks(access="column"), (2000, 64, 1))
+        tile = self._chunks(access="tile")
+        self.assertLessEqual(np.prod(tile) * 8, 1024**2)
+        self.assertLess(max(tile) / min(tile), 20)
+        self.assertIsNone(self._chunks(access=None))
+        with self.assertRaises(ValueError):
+            save(self.array, self.file_path, access="diagonal")
+
+    def test_small_arrays_contiguous(self):
+        save({"small": np.arange(10)}, self.file_path)
+        with h5py.File(self.file_path, "r") as file:
+            self.assertIsNone(file["small"].chunks)
+
+    def test_compression(self):
+        save({"data": np.zeros((100, 100))}, self.file_path, compression="gzip", compression_opts=6)
+        with h5py.File(self.file_path, "r") as file:
+            self.assertEqual(file["data"].compression, "gzip")
+            self.assertEqual(file["data"].compression_opts, 6)
+            self.assertTrue(file["data"].shuffle)
+            self.assertIsNotNone(file["data"].chunks)
+        with self.assertRaises(ValueError):
+            save(self.array, self.file_path, compression="zip")
+
+    @unittest.skipUnless(importlib.util.find_spec("hdf5plugin"), "hdf5plugin is not installed")
+    def test_blosc(self):
+        import hdf5plugin  # noqa: F401
+
+        save({"data": self.array}, self.file_path, compression=True)
+        with h5py.File(self.file_path, "r") as file:
+            self.assertIn(str(hdf5plugin.Blosc.filter_id), file["data"]._filters)
+            np.testing.assert_array_equal(file["data"][10], self.array[10])
+
+    def test_nested_groups(self):
+        data = {"eeg": np.ones((4, 3)), "meta": {"subject": "s01", "onsets": np.arange(4), "extra": {"fs": 250}}}
+        save(data, self.file_path)
+        with load(self.file_path) as file:
+            self.assertEqual(set(file), {"eeg", "meta"})
+            self.assertEqual(file["meta"]["onsets"][:].tolist(), [0, 1, 2, 3])
+            self.assertEqual(file["meta"]["extra"]["fs"][()], 250)
+            self.assertEqual(file["meta"]["subject"][()], b"s01")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dmf.io import load, save
+
+
+class TestShards(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_dataframe_shards(self):
+        df = pd.DataFrame({"trial": np.arange(100), "rt": np.random.rand(100)})
+        save(df, self.test_dir / "trials", shards=4, workers=4)
+
+        manifest = json.loads((self.test_dir / "trials" / "manifest.shards.json").read_text())
+        self.assertEqual(len(manifest["shards"]), 4)
+        self.assertEqual([(shard["start"], shard["stop"]) for shard in manifest["shards"]],
+                         [(0, 25), (25, 50), (50, 75), (75, 100)])
+        self.assertEqual(manifest["schema"]["columns"], ["trial", "rt"])
+        self.assertTrue(all(len(shard["sha256"]) == 64 for shard in manifest["shards"]))
+
+        loaded = load(self.test_dir / "trials")
+        pd.testing.assert_frame_equal(loaded, df)
+
+    def test_array_max_shard_bytes(self):
+        data = np.arange(1000 * 16, dtype=np.float64).reshape(1000, 16)
+        save(data, self.test_dir / "embeddings", max_shard_bytes=16 * 8 * 300)
+
+        shards = sorted((self.test_dir / "embeddings").glob("part-*.npy"))
+        self.assertEqual(len(shards), 4)
+        loaded = load(self.test_dir / "embeddings" / "manifest.shards.json", verify=True)
+        np.testing.assert_array_equal(loaded, data)
+
+    def test_stream(self):
+        data = np.arange(50)
+        save(data, self.test_dir / "stream", shards=5)
+        shards = list(load(self.test_dir / "stream", stream=True))
+        self.assertEqual(len(shards), 5)
+        np.testing.assert_array_equal(np.concatenate(shards), data)
+
+    def test_shard_format(self):
+        df = pd.DataFrame({"a": range(10)})
+        save(df, self.test_dir / "csv", shards=2, shard_format="csv", checksum=False)
+        self.assertTrue((self.test_dir / "csv" / "part-00001.csv").exists())
+        pd.testing.assert_frame_equal(load(self.test_dir / "csv"), df)
+
+    def test_csv_round_trip(self):
+        df = pd.DataFrame({"trial": np.arange(100), "condition": ["a", "b"] * 50})
+        save(df, self.test_dir / "csv", shards=3, shard_format="csv")
+        loaded = load(self.test_dir / "csv")
+        self.assertNotIn("Unnamed: 0", loaded.columns)
+        pd.testing.assert_frame_equal(loaded, df)
+
+    def test_csv_named_index(self):
+        df = pd.DataFrame({"a": np.arange(10), "b": np.arange(100, 110)}).set_index("b")
+        save(df, self.test_dir / "csv", shards=3, shard_format="csv.gz")
+        pd.testing.assert_frame_equal(load(self.test_dir / "csv"), df)
+
+        df = df.set_index("a", append=True)
+        df["c"] = 1.5
+        save(df, self.test_dir / "multi", shards=2, shard_format="csv")
+        pd.testing.assert_frame_equal(load(self.test_dir / "multi"), df)
+
+    def test_schema_mismatch(self):
+        save(pd.DataFrame({"a": range(10)}), self.test_dir / "csv", shards=2, shard_format="csv")
+        pd.DataFrame({"b": range(5)}).to_csv(self.test_dir / "csv" / "part-00001.csv", index=False)
+        with self.assertRaises(ValueError):
+            load(self.test_dir / "csv")
+
+    def test_overwrite(self):
+        save(np.arange(100), self.test_dir / "data", shards=5)
+        save(np.arange(10), self.test_dir / "data", shards=2)
+        self.assertEqual(sorted(path.name for path in (self.test_dir / "data").iterdir()),
+                         ["manifest.shards.json", "part-00000.npy", "part-00001.npy"])
+        np.testing.assert_array_equal(load(self.test_dir / "data"), np.arange(10))
+
+    def test_verify_checksum(self):
+        save(np.arange(20), self.test_dir / "data", shards=2)
+        np.save(self.test_dir / "data" / "part-00001.npy", np.zeros(10, dtype=int))
+        with self.assertRaises(ValueError):
+            load(self.test_dir / "data", verify=True)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            save({"a": 1}, self.test_dir / "dict", shards=2)
+        with self.assertRaises(ValueError):
+            save(np.arange(10), self.test_dir / "both", shards=2, max_shard_bytes=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import tempfile
+import shutil
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dmf.io import load, save, sniff_format
+
+
+def _write(file_path, writer, *args, **kwargs):
+    """Write with numpy to the exact path, without the extension added by numpy."""
+    with open(file_path, "wb") as file:
+        writer(file, *args, **kwargs)
+
+
+class TestSniffFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.df = pd.DataFrame({"a": [1, 2, 3]})
+        self.array = np.arange(6).reshape(2, 3)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_signatures(self):
+        from PIL import Image
+
+        writers = {
+            "parquet": lambda path: self.df.to_parquet(path),
+            "feather": lambda path: self.df.to_feather(path),
+            "npy": lambda path: _write(path, np.save, self.array),
+            "npz": lambda path: _write(path, np.savez, a=self.array),
+            "h5": lambda path: save(self.array, path, saver="hdf5"),
+            "mat": lambda path: save({"a": self.array}, path, saver="matlab"),
+            "png": lambda path: Image.new("RGB", (4, 4)).save(path, format="png"),
+            "jpg": lambda path: Image.new("RGB", (4, 4)).save(path, format="jpeg"),
+            "pkl": lambda path: save({"a": 1}, path, saver="pickle"),
+            "gz": lambda path: self.df.to_csv(path, compression="gzip"),
+        }
+        for expected, writer in writers.items():
+            with self.subTest(format=expected):
+                file_path = self.test_dir / f"file_{expected}"
+                writer(file_path)
+                self.assertEqual(sniff_format(file_path), expected)
+
+    def test_text(self):
+        file_path = self.test_dir / "data.csv"
+        self.df.to_csv(file_path, index=False)
+        self.assertIsNone(sniff_format(file_path))
+
+    def test_load_without_extension(self):
+        file_path = self.test_dir / "part-0000"
+        self.df.to_parquet(file_path)
+        self.assertTrue(load(file_path).equals(self.df))
+
+        file_path = self.test_dir / "array-0000"
+        _write(file_path, np.save, self.array)
+        np.testing.assert_array_equal(load(file_path), self.array)
+
+    def test_registered_extension_is_trusted(self):
+        file_path = self.test_dir / "notes.txt"
+        file_path.write_bytes(b"PAR1 is the signature of parquet files")
+        self.assertEqual(load(file_path), "PAR1 is the signature of parquet files")
+
+        file_path = self.test_dir / "data.csv"
+        file_path.write_bytes(b"ID3,a\n1,2\n")
+        self.assertEqual(list(load(file_path).columns), ["ID3", "a"])
+
+    def test_plugin_extension_is_trusted(self):
+        from dmf.io.load import register_loader, LOADERS, EXTENSION_MAPPING
+
+        register_loader("test-nwb", ["nwb"])(lambda file_path: "nwb")
+        try:
+            file_path = self.test_dir / "session.nwb"
+            save(self.array, file_path, saver="hdf5")
+            self.assertEqual(sniff_format(file_path), "h5")
+            self.assertEqual(load(file_path), "nwb")
+        finally:
+            LOADERS.pop("test-nwb")
+            EXTENSION_MAPPING.pop("nwb")
+
+    def test_weak_formats_keep_extension(self):
+        import joblib
+
+        file_path = self.test_dir / "model.joblib"
+        joblib.dump({"a": self.array}, file_path)
+        self.assertEqual(sniff_format(file_path), "pkl")
+        np.testing.assert_array_equal(load(file_path)["a"], self.array)
+
+    def test_unknown_extension(self):
+        file_path = self.test_dir / "part-0000.bin"
+        self.df.to_parquet(file_path)
+        self.assertTrue(load(file_path).equals(self.df))
+
+    def test_double_extension(self):
+        from dmf.io.load import register_loader, LOADERS, EXTENSION_MAPPING
+
+        file_path = self.test_dir / "data.v2.csv"
+        self.df.to_csv(file_path, index=False)
+        self.assertTrue(load(file_path).equals(self.df))
+
+        register_loader("test-double", ["csv.test"])(lambda file_path: "double")
+        try:
+            file_path = self.test_dir / "data.csv.test"
+            file_path.touch()
+            self.assertEqual(load(file_path), "double")
+        finally:
+            LOADERS.pop("test-double")
+            EXTENSION_MAPPING.pop("csv.test")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dmf.io import load, open_writer
+
+
+class TestWriters(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_parquet_row_groups(self):
+        import pyarrow.parquet as pq
+
+        file_path = self.test_dir / "results.parquet"
+        with open_writer(file_path, flush_rows=10) as writer:
+            for trial in range(25):
+                writer.write_row({"trial": trial, "rt": trial / 10, "condition": "a"})
+        self.assertEqual(writer.rows_written, 25)
+        self.assertEqual(pq.ParquetFile(file_path).num_row_groups, 3)
+        df = load(file_path)
+        self.assertEqual(df["trial"].tolist(), list(range(25)))
+
+    def test_csv_header_once(self):
+        file_path = self.test_dir / "results.csv"
+        with open_writer(file_path, flush_rows=2) as writer:
+            writer.write(pd.DataFrame({"trial": [0, 1, 2]}))
+            writer.write_row({"trial": 3})
+        with open_writer(file_path, append=True) as writer:
+            writer.write_row({"trial": 4})
+        self.assertEqual(file_path.read_text().splitlines(), ["trial", "0", "1", "2", "3", "4"])
+
+    def test_hdf5_resizable(self):
+        import h5py
+
+        file_path = self.test_dir / "recording.h5"
+        with open_writer(file_path, flush_rows=4) as writer:
+            for epoch in range(3):
+                writer.write({"eeg": np.full((3, 2, 5), epoch), "onset": np.arange(3) + 3 * epoch})
+            writer.write_row({"eeg": np.zeros((2, 5)), "onset": 9})
+        with open_writer(file_path, append=True) as writer:
+            writer.write_row({"eeg": np.ones((2, 5)), "onset": 10})
+
+        with h5py.File(file_path, "r") as file:
+            self.assertEqual(file["eeg"].shape, (11, 2, 5))
+            self.assertEqual(file["eeg"].maxshape, (None, 2, 5))
+            self.assertIsNotNone(file["eeg"].chunks)
+            self.assertEqual(file["onset"][:].tolist(), list(range(11)))
+            self.assertEqual(file["eeg"][5, 0, 0], 1)
+
+    def test_hdf5_text(self):
+        import h5py
+
+        file_path = self.test_dir / "events.h5"
+        with open_writer(file_path, flush_rows=2) as writer:
+            for index in range(3):
+                writer.write_row({"x": float(index), "name": f"n{index}" * (index + 1)})
+
+        with h5py.File(file_path, "r") as file:
+            self.assertEqual(file["x"][:].tolist(), [0.0, 1.0, 2.0])
+            self.assertEqual(file["name"].asstr()[:].tolist(), ["n0", "n1n1", "n2n2n2"])
+
+    def test_flush_interval(self):
+        file_path = self.test_dir / "results.csv"
+        writer = open_writer(file_path, flush_interval=0)
+        writer.write_row({"trial": 0})
+        self.assertEqual(writer.rows_written, 1)
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write_row({"trial": 1})
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            open_writer(self.test_dir / "results.json")
+
+
+if __name__ == "__main__":
+    unittest.main()